@@ -0,0 +1,174 @@
+"""
+Copyright 2021 Janrey "CodexLink" Licas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+	http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# # Benchmark: Commit Payload Memory
+# * Measures the peak memory (with tracemalloc) of `AsyncGithubAPILite._get_commit_payload()` per run, against the payload that it has replaced (a dict that was serialized by aiohttp).
+# The whole path of the README (fetch, splice and payload) is measured as well. Run from the root of the repository: `python benchmarks/commit_payload_memory.py`.
+
+from asyncio import new_event_loop
+from base64 import b64decode, b64encode
+from json import dumps as json_dumps
+from json import loads as json_loads
+from logging import CRITICAL, getLogger
+from os import path
+from sys import path as sys_path
+from tracemalloc import get_traced_memory, start, stop
+from typing import Any, Callable
+
+sys_path.insert(0, path.join(path.dirname(path.abspath(__file__)), "..", "src"))
+
+from api import AsyncGithubAPILite  # noqa: E402
+from badge import BadgeConstructor  # noqa: E402
+from utils import UtilityMethods  # noqa: E402
+
+BADGE_IDENTIFIER: str = "Discord Activity"
+BADGE_OUTDATED: bytes = (
+    b"[![Discord Activity](https://badgen.net/badge/Visual%20Studio%20Code/Playing%20for%2012%20minutes?color=f1c40f&icon=discord)](https://github.com/CodexLink/discord-activity-badge)"
+)
+BADGE_UPDATE: str = (
+    "[![Discord Activity](https://badgen.net/badge/Visual%20Studio%20Code/Playing%20for%2013%20minutes?color=f1c40f&icon=discord)](https://github.com/CodexLink/discord-activity-badge)"
+)
+README_SHA: str = "0" * 40
+README_SECTION: bytes = (
+    b"## Section\n\nSome prose with a [link](https://example.com) and an ![image](https://example.com/image.png).\n\n"
+    + b"Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. "
+    * 4
+    + b"\n\n"
+)
+
+
+class Runner(UtilityMethods, AsyncGithubAPILite, BadgeConstructor):
+    pass
+
+
+def make_readme(size: int) -> bytes:
+    # The badge is placed on top, which is where `check_and_update_badge()` places it by default.
+    return (
+        BADGE_OUTDATED
+        + b"\n\n"
+        + (README_SECTION * (size // len(README_SECTION) + 1))[:size]
+    )
+
+
+def old_get_commit_payload(runner: Runner, data: list[Any]) -> bytes:
+    # The payload from before, which aiohttp serialized (with `json.dumps()`) and encoded when it was given as `json=`.
+    return json_dumps(
+        {
+            "content": b64encode(data[1]).decode("ascii"),
+            "message": runner.envs["COMMIT_MESSAGE"],
+            "sha": str(data[0]),
+            "committer": {
+                "name": "Discord Activity Badge",
+                "email": "discord_activity@discord_bot.com",
+            },
+        }
+    ).encode("utf-8")
+
+
+def old_update_readme(runner: Runner, response_body: bytes) -> bytes:
+    # The README was fetched as JSON (with the README in Base64), and was spliced by its slices.
+    readme_ctx: bytes = b64decode(json_loads(response_body)["content"])
+    badge_location: Any = runner._locate_badges(readme_ctx, (BADGE_IDENTIFIER,))[
+        BADGE_IDENTIFIER
+    ]
+    readme_update: bytes = b"".join(
+        (
+            readme_ctx[: badge_location["start"]],
+            BADGE_UPDATE.encode("utf-8"),
+            readme_ctx[badge_location["end"] :],
+        )
+    )
+
+    return old_get_commit_payload(runner, [README_SHA, readme_update])
+
+
+def new_update_readme(runner: Runner, response_body: bytes) -> bytearray:
+    # The README is fetched raw, which means the response body is the README itself.
+    readme_sha: str = runner.get_blob_sha(response_body)
+    readme_update: bytes = runner.loop.run_until_complete(
+        runner.check_and_update_badge(response_body, {BADGE_IDENTIFIER: BADGE_UPDATE})
+    )
+
+    return runner._get_commit_payload([readme_sha, readme_update])
+
+
+def get_peak(fn: Callable[[], Any]) -> float:
+    # ! The result is held until the peak is taken, since it's sent afterwards.
+    start()
+    result: Any = fn()  # noqa: F841
+    peak: int = get_traced_memory()[1]
+    stop()
+
+    return peak / (1 << 20)
+
+
+def main() -> None:
+    runner: Runner = Runner.__new__(Runner)
+    runner.logger = getLogger(__name__)
+    runner.logger.setLevel(CRITICAL)
+    runner.envs = {"COMMIT_MESSAGE": "Update the Discord Activity Badge"}
+    runner.loop = new_event_loop()
+
+    print(
+        f"{'README':<8} {'body (old)':>11} {'body (new)':>11} {'payload (old)':>14} {'payload (new)':>14} {'run (old)':>10} {'run (new)':>10}   (MiB)"
+    )
+
+    for size_name, size in (
+        ("64 KiB", 64 << 10),
+        ("1 MiB", 1 << 20),
+        ("4 MiB", 4 << 20),
+        ("16 MiB", 16 << 20),
+    ):
+        readme_ctx: bytes = make_readme(size)
+        readme_update: bytes = runner.loop.run_until_complete(
+            runner.check_and_update_badge(readme_ctx, {BADGE_IDENTIFIER: BADGE_UPDATE})
+        )
+        json_body: bytes = json_dumps(
+            {"sha": README_SHA, "content": b64encode(readme_ctx).decode("ascii")}
+        ).encode("utf-8")
+
+        # * Both payloads should have the same fields, and the same README.
+        old_payload: Any = json_loads(
+            old_get_commit_payload(runner, [README_SHA, readme_update])
+        )
+        new_payload: Any = json_loads(
+            bytes(runner._get_commit_payload([README_SHA, readme_update]))
+        )
+        assert old_payload == new_payload, size_name
+
+        # The response bodies are already held before the run, which is why their size is given separately.
+        print(
+            "%-8s %11.2f %11.2f %14.2f %14.2f %10.2f %10.2f"
+            % (
+                size_name,
+                len(json_body) / (1 << 20),
+                len(readme_ctx) / (1 << 20),
+                get_peak(
+                    lambda: old_get_commit_payload(runner, [README_SHA, readme_update])
+                ),
+                get_peak(
+                    lambda: runner._get_commit_payload([README_SHA, readme_update])
+                ),
+                get_peak(lambda: old_update_readme(runner, json_body)),
+                get_peak(lambda: new_update_readme(runner, readme_ctx)),
+            )
+        )
+
+    runner.loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Copyright 2021 Janrey "CodexLink" Licas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+	http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# # Benchmark: Elapsed Time Formatter
+# * Compares `ElapsedTimeFormatter.format()` against the formatting that it has replaced, by microseconds per call. The original formatting (from `construct_badge()`)
+# counted the hours one at a time and picked the unit strings through `locals()`, while the render plan formatted them from the module-level TIME_STRINGS.
+# Run from the root of the repository: `python benchmarks/format_elapsed_time.py [--calls N]`.
+
+from argparse import ArgumentParser
+from itertools import product
+from os import path
+from sys import path as sys_path
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+sys_path.insert(0, path.join(path.dirname(path.abspath(__file__)), "..", "src"))
+
+from elements.constants import PreferredTimeDisplay  # noqa: E402
+from render import ElapsedTimeFormatter  # noqa: E402
+
+TIME_STRINGS: list[str] = ["hours", "minutes", "seconds"]
+ELAPSED_STRING: str = "elapsed."
+
+# The elapsed times, in seconds. No unit is exactly 1 on any of them, since such a unit is displayed in singular by the formatter (as in `1 hour`),
+# where the formatting before displayed it in plural.
+ELAPSED_TIMES: tuple[tuple[str, float], ...] = (
+    ("45s", 45.0),
+    ("2h 15m", 2 * 3600 + 15 * 60.0),
+    ("3 days", 3 * 86400 + 2 * 3600 + 5 * 60.0),
+    ("30 days", 30 * 86400 + 5 * 3600 + 30 * 60.0),
+)
+
+TIME_DISPLAYS: tuple[PreferredTimeDisplay, ...] = (
+    PreferredTimeDisplay.HOURS,
+    PreferredTimeDisplay.HOURS_MINUTES,
+    PreferredTimeDisplay.MINUTES,
+    PreferredTimeDisplay.SECONDS,
+)
+
+
+def original_format(
+    elapsed_seconds: float, time_option: PreferredTimeDisplay, is_shorthand: bool
+) -> str:
+    # The formatting of `construct_badge()` before the render plan, with the copy of TIME_STRINGS that every render made.
+    parsed_time: int = int(
+        elapsed_seconds
+        / (
+            3600
+            if time_option is PreferredTimeDisplay.HOURS
+            else (
+                60
+                if time_option is PreferredTimeDisplay.MINUTES
+                or time_option is PreferredTimeDisplay.HOURS_MINUTES
+                else 1
+            )
+        )
+    )
+
+    hours = (
+        parsed_time
+        if parsed_time >= 1 and time_option is PreferredTimeDisplay.HOURS
+        else 0
+    )
+    minutes = (
+        parsed_time
+        if parsed_time >= 1 and time_option is PreferredTimeDisplay.MINUTES
+        else 0
+    )
+    seconds = (
+        parsed_time
+        if parsed_time >= 1 and time_option is PreferredTimeDisplay.SECONDS
+        else 0
+    )
+
+    if time_option is PreferredTimeDisplay.HOURS_MINUTES:
+        while True:
+            if parsed_time / 60 >= 1:
+                hours += 1
+                parsed_time -= 60
+                continue
+
+            break
+
+        minutes = parsed_time
+
+    time_strings: list[str] = TIME_STRINGS.copy()
+
+    for idx, each_time_string in enumerate(TIME_STRINGS):
+        if is_shorthand:
+            time_strings[idx] = each_time_string[0]
+
+        else:
+            time_strings[idx] = (
+                each_time_string[:-1]
+                if locals()[f"{each_time_string}"] < 1
+                else each_time_string
+            )
+
+    return (
+        (f"{hours} %s" % time_strings[0] if hours >= 1 else "")
+        + (" " if hours and minutes else "")
+        + (f"{minutes} %s" % time_strings[1] if minutes >= 1 else "")
+        + (f"{seconds} %s" % time_strings[2] if seconds >= 1 else "")
+        + " %s" % ELAPSED_STRING
+        if hours >= 1 or minutes >= 1 or seconds >= 1
+        else "Just started."
+    )
+
+
+def plan_format(
+    elapsed_seconds: float, time_option: PreferredTimeDisplay, is_shorthand: bool
+) -> str:
+    # The formatting of `BadgeRenderPlan._render_time()` before the formatter, which already split the hours with divmod.
+    parsed_time: int = int(
+        elapsed_seconds
+        / (
+            3600
+            if time_option is PreferredTimeDisplay.HOURS
+            else (
+                60
+                if time_option is PreferredTimeDisplay.MINUTES
+                or time_option is PreferredTimeDisplay.HOURS_MINUTES
+                else 1
+            )
+        )
+    )
+
+    hours: int = (
+        parsed_time
+        if parsed_time >= 1 and time_option is PreferredTimeDisplay.HOURS
+        else 0
+    )
+    minutes: int = (
+        parsed_time
+        if parsed_time >= 1 and time_option is PreferredTimeDisplay.MINUTES
+        else 0
+    )
+    seconds: int = (
+        parsed_time
+        if parsed_time >= 1 and time_option is PreferredTimeDisplay.SECONDS
+        else 0
+    )
+
+    if time_option is PreferredTimeDisplay.HOURS_MINUTES:
+        hours, minutes = divmod(max(parsed_time, 0), 60)
+
+    if not (hours >= 1 or minutes >= 1 or seconds >= 1):
+        return "Just started."
+
+    time_strings: list[str] = [
+        (
+            each_time_string[0]
+            if is_shorthand
+            else each_time_string if each_time_value >= 1 else each_time_string[:-1]
+        )
+        for each_time_string, each_time_value in zip(
+            TIME_STRINGS, (hours, minutes, seconds)
+        )
+    ]
+
+    return (
+        (f"{hours} %s" % time_strings[0] if hours >= 1 else "")
+        + (" " if hours and minutes else "")
+        + (f"{minutes} %s" % time_strings[1] if minutes >= 1 else "")
+        + (f"{seconds} %s" % time_strings[2] if seconds >= 1 else "")
+        + " %s" % ELAPSED_STRING
+    )
+
+
+def formatter_format(formatter: ElapsedTimeFormatter, elapsed_seconds: float) -> str:
+    # The render displays `Just started.` in place of the time, when there's no unit to display.
+    elapsed_time: Optional[str] = formatter.format(elapsed_seconds)
+    return elapsed_time if elapsed_time is not None else "Just started."
+
+
+def get_microseconds_per_call(fn: Callable[[], Any], calls: int) -> float:
+    started_at: float = perf_counter()
+
+    for _ in range(calls):
+        fn()
+
+    return (perf_counter() - started_at) / calls * 1e6
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(
+        description="Compares the elapsed time formatter against the formatting that it has replaced."
+    )
+    parser.add_argument("--calls", type=int, default=100000)
+    calls: int = parser.parse_args().calls
+
+    print(
+        f"{'time display':<16} {'shorthand':<10} {'elapsed':<8} {'original':>9} {'plan':>9} {'formatter':>10}   (us per call)"
+    )
+
+    for time_display, is_shorthand, (elapsed_name, elapsed_seconds) in product(
+        TIME_DISPLAYS, (False, True), ELAPSED_TIMES
+    ):
+        formatter: ElapsedTimeFormatter = ElapsedTimeFormatter(
+            time_display, is_shorthand, ELAPSED_STRING
+        )
+
+        # * All of them should format the same time.
+        assert (
+            original_format(elapsed_seconds, time_display, is_shorthand)
+            == plan_format(elapsed_seconds, time_display, is_shorthand)
+            == formatter_format(formatter, elapsed_seconds)
+        ), (time_display, is_shorthand, elapsed_name)
+
+        print(
+            "%-16s %-10s %-8s %9.2f %9.2f %10.2f"
+            % (
+                time_display.name,
+                is_shorthand,
+                elapsed_name,
+                get_microseconds_per_call(
+                    lambda: original_format(
+                        elapsed_seconds, time_display, is_shorthand
+                    ),
+                    calls,
+                ),
+                get_microseconds_per_call(
+                    lambda: plan_format(elapsed_seconds, time_display, is_shorthand),
+                    calls,
+                ),
+                get_microseconds_per_call(
+                    lambda: formatter.format(elapsed_seconds), calls
+                ),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Copyright 2021 Janrey "CodexLink" Licas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+	http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# # Benchmark: Badge Locator
+# * Compares `BadgeConstructor._locate_badges()` against the regex that it has replaced (BADGE_REGEX_STRUCT_IDENTIFIER), over READMEs from 1 KiB to several MiB
+# and over near-miss inputs. Run from the root of the repository: `python benchmarks/locate_badges.py [--repeat N]`.
+
+from argparse import ArgumentParser
+from logging import getLogger
+from os import path
+from re import Pattern
+from re import compile as RE_COMPILE
+from sys import path as sys_path
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+sys_path.insert(0, path.join(path.dirname(path.abspath(__file__)), "..", "src"))
+
+from badge import BadgeConstructor  # noqa: E402
+
+BADGE_IDENTIFIER: str = "Discord Activity"
+BADGE: bytes = (
+    b"[![Discord Activity](https://badgen.net/badge/Visual%20Studio%20Code/Playing%20for%2012%20minutes?color=f1c40f&icon=discord)](https://github.com/CodexLink/discord-activity-badge)\n"
+)
+
+# The pattern that was compiled and searched on every call, before the badges were located by offsets.
+OLD_BADGE_PATTERN: Pattern[str] = RE_COMPILE(
+    r"(?P<Delimiter>\[\!\[)(?P<badge_identifier>([a-zA-Z0-9_()-]+(\s|\b)){1,6})\]\((?P<badge_url>https://[a-z]+.[a-z]{2,4})/(?P<entrypoint>\w+)/(?P<subject_badge>[^...]+\b)/(?P<status_badge>[^?]+)\?(?P<params>[^)]+)\)\]\((?P<redirect_url>https://[a-z]+.[a-z]{2,4}/[^)]+)\)"
+)
+
+# A section of an ordinary README, with a few other badges, links, images and a code block.
+README_SECTION: bytes = (
+    b"## Section\n\nSome prose with a [link](https://example.com) and an ![image](https://example.com/image.png).\n\n"
+    b"[![Build](https://img.shields.io/badge/build-passing-green)](https://example.com/ci) [![Coverage](https://img.shields.io/badge/coverage-99%25-green)](https://example.com/coverage)\n\n"
+    b"```python\nprint('Hello, World!')\n```\n\n"
+    + b"Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. "
+    * 4
+    + b"\n\n"
+)
+
+
+def repeat_to(chunk: bytes, size: int) -> bytes:
+    # The content is ended with a line break, so that the cut-off at the end can't be joined with the next line.
+    return (chunk * (size // len(chunk) + 1))[: size - 1] + b"\n"
+
+
+def make_inputs() -> list[tuple[str, bytes, bool]]:
+    """
+    Returns:
+        list[tuple[str, bytes, bool]]: The name and the content of every input, and whether the old regex finishes on it in a reasonable time.
+    """
+
+    inputs: list[tuple[str, bytes, bool]] = []
+
+    for size_name, size in (
+        ("1 KiB", 1 << 10),
+        ("64 KiB", 64 << 10),
+        ("1 MiB", 1 << 20),
+        ("4 MiB", 4 << 20),
+    ):
+        body: bytes = repeat_to(README_SECTION, size)
+
+        # * The badge is placed on top by default (see `check_and_update_badge()`), which makes it the common case.
+        inputs += [
+            (f"badge on top, {size_name}", BADGE + body, True),
+            (f"badge at the end, {size_name}", body + BADGE, True),
+            (f"no badge, {size_name}", body, True),
+            (
+                f"near-miss `[![a](b) `, {size_name}",
+                repeat_to(b"[![a](b) ", size) + BADGE,
+                True,
+            ),
+            (
+                f"`[![` storm, {size_name}",
+                repeat_to(b"[![", size) + BADGE,
+                True,
+            ),
+            (
+                f"`[` in the parts (not a badge), {size_name}",
+                repeat_to(b"[![a[1]](https://x/[y])](https://r)\n", size) + BADGE,
+                True,
+            ),
+        ]
+
+    # ! The old regex backtracks exponentially on identifier-like near misses, which is why it's only given the smallest of them.
+    for size_name, size in (("256 B", 256), ("1 KiB", 1 << 10), ("64 KiB", 64 << 10)):
+        inputs.append(
+            (
+                f"`[![a-a-a-...` near-miss, {size_name}",
+                repeat_to(b"[![a-a-a-a-a-a-a-a-a-a-a-a-a-", size),
+                size <= 1 << 10,
+            )
+        )
+
+    return inputs
+
+
+def old_locate_badge(readme_ctx: bytes) -> Optional[tuple[int, int]]:
+    # The README was decoded, and then searched for the first badge only.
+    match: Any = OLD_BADGE_PATTERN.search(readme_ctx.decode("utf-8"))
+    return (
+        match.span()
+        if match and match.group("badge_identifier") == BADGE_IDENTIFIER
+        else None
+    )
+
+
+def get_best_time(fn: Callable[[], Any], repeat: int) -> float:
+    best: float = float("inf")
+
+    for _ in range(repeat):
+        started_at: float = perf_counter()
+        fn()
+        best = min(best, perf_counter() - started_at)
+
+    return best * 1000
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(
+        description="Compares the badge locator against the regex that it has replaced."
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    repeat: int = parser.parse_args().repeat
+
+    locator: BadgeConstructor = BadgeConstructor()
+    locator.logger = getLogger(__name__)
+
+    print(
+        f"{'input':<46} {'old regex':>12} {'locate (own)':>14} {'locate (all)':>14}   (best of {repeat}, ms)"
+    )
+
+    for input_name, readme_ctx, runs_old in make_inputs():
+        own_badge: Any = locator._locate_badges(readme_ctx, (BADGE_IDENTIFIER,))
+
+        # * The badge should be located at the same offsets, wherever the old regex could find it.
+        if runs_old:
+            old_span: Optional[tuple[int, int]] = old_locate_badge(readme_ctx)
+            assert old_span is None or old_span == (
+                own_badge[BADGE_IDENTIFIER]["start"],
+                own_badge[BADGE_IDENTIFIER]["end"],
+            ), input_name
+
+        print(
+            "%-46s %12s %14.3f %14.3f"
+            % (
+                input_name,
+                (
+                    "%.3f" % get_best_time(lambda: old_locate_badge(readme_ctx), repeat)
+                    if runs_old
+                    else "(skipped)"
+                ),
+                get_best_time(
+                    lambda: locator._locate_badges(readme_ctx, (BADGE_IDENTIFIER,)),
+                    repeat,
+                ),
+                get_best_time(lambda: locator._locate_badges(readme_ctx), repeat),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,547 @@
+"""
+Copyright 2021 Janrey "CodexLink" Licas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+	http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# # Benchmark: Badge Render Plan
+# * Compares `BadgeRenderPlan.render()` against the rendering that it has replaced (where `construct_badge()` looked up the options on every render), by renders per second.
+# Both are checked to render the same badges over every combination of options, activities and statuses first.
+# Run from the root of the repository: `python benchmarks/render_badge.py [--renders N]`.
+
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+from itertools import product
+from logging import CRITICAL, getLogger
+from os import path
+from sys import path as sys_path
+from time import perf_counter
+from typing import Any, Callable, Optional
+from urllib.parse import quote
+
+sys_path.insert(0, path.join(path.dirname(path.abspath(__file__)), "..", "src"))
+
+from discord import Status  # noqa: E402
+
+from elements.constants import (  # noqa: E402
+    BADGE_BASE_MARKDOWN,
+    BADGE_BASE_SUBJECT,
+    BADGE_BASE_URL,
+    BADGE_ICON,
+    BADGE_NO_COLOR_DEFAULT,
+    BADGE_REDIRECT_BASE_DOMAIN,
+    ENV_STRUCT_CONSTRAINTS,
+    ContextOnSubject,
+    PreferredActivityDisplay,
+    PreferredTimeDisplay,
+)
+from presence import ActivitySnapshot, PresenceSnapshot  # noqa: E402
+from render import BadgeRenderPlan  # noqa: E402
+from utils import UtilityMethods  # noqa: E402
+
+# ! The clock is frozen, so that both renders count the time until the same moment.
+NOW: datetime = datetime(2024, 5, 1, 12, 0, 0)
+
+
+def get_epoch_ms(minutes_ago: float) -> int:
+    return int((NOW.timestamp() - minutes_ago * 60) * 1000)
+
+
+# The activities, as they were given (from `to_dict()`) to the old render. The times are picked so that no unit is exactly 1,
+# since such a unit is displayed in singular by the elapsed time formatter (as in `1 hour`), where the old render displayed it in plural.
+ACTIVITIES: dict[str, dict[str, dict[str, Any]]] = {
+    "none": {},
+    "rich presence": {
+        "RICH_PRESENCE": {
+            "name": "Visual Studio Code",
+            "details": "Editing badge.py",
+            "state": "Workspace: discord-activity-badge",
+            "assets": {"large_text": "Editing a PYTHON file"},
+            "timestamps": {"start": get_epoch_ms(135)},
+        }
+    },
+    "rich presence (no time)": {
+        "RICH_PRESENCE": {
+            "name": "Visual Studio Code",
+            "details": "Editing badge.py",
+            "state": "Workspace: discord-activity-badge",
+            "assets": {"large_text": "Editing a PYTHON file"},
+            "timestamps": {},
+        }
+    },
+    "game": {
+        "GAME_ACTIVITY": {
+            "name": "Honkai Impact 3rd",
+            "details": "",
+            "state": "",
+            "assets": {"large_text": ""},
+            "timestamps": {"start": get_epoch_ms(3 * 24 * 60 + 125)},
+        }
+    },
+    "game (just started)": {
+        "GAME_ACTIVITY": {
+            "name": "Honkai Impact 3rd",
+            "details": "",
+            "state": "",
+            "assets": {"large_text": ""},
+            "timestamps": {"start": get_epoch_ms(0.2)},
+        }
+    },
+    "custom activity": {
+        "CUSTOM_ACTIVITY": {
+            "name": "Custom Status",
+            "details": "",
+            "state": "Doing stuff",
+            "assets": {"large_text": ""},
+            "timestamps": {},
+        }
+    },
+    "spotify": {
+        "SPOTIFY_ACTIVITY": {
+            "name": "Spotify",
+            "details": "Song Title",
+            "state": "Artist; Other Artist",
+            "assets": {"large_text": "Album Name"},
+            "timestamps": {"start": get_epoch_ms(1.5), "end": get_epoch_ms(-2)},
+        }
+    },
+    "game and rich presence": {
+        "GAME_ACTIVITY": {
+            "name": "Honkai Impact 3rd",
+            "details": "",
+            "state": "",
+            "assets": {"large_text": ""},
+            "timestamps": {"start": get_epoch_ms(3)},
+        },
+        "RICH_PRESENCE": {
+            "name": "Visual Studio Code",
+            "details": "Editing badge.py",
+            "state": "Workspace: discord-activity-badge",
+            "assets": {"large_text": "Editing a PYTHON file"},
+            "timestamps": {"start": get_epoch_ms(5)},
+        },
+    },
+}
+
+STATUSES: tuple[Status, ...] = (Status.online, Status.idle, Status.dnd, Status.offline)
+
+OPTIONS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    (
+        "INPUT_PREFERRED_ACTIVITY_TO_DISPLAY",
+        ("", "GAME_ACTIVITY", "SPOTIFY_ACTIVITY", "CUSTOM_ACTIVITY", "RICH_PRESENCE"),
+    ),
+    ("INPUT_PREFERRED_PRESENCE_CONTEXT", ("", "STATE", "CONTEXT_DISABLED")),
+    (
+        "INPUT_TIME_DISPLAY_OUTPUT",
+        ("", "HOURS", "HOURS_MINUTES", "MINUTES", "SECONDS", "TIME_DISABLED"),
+    ),
+    ("INPUT_TIME_DISPLAY_SHORTHAND", ("", "true")),
+    ("INPUT_STATIC_SUBJECT_STRING", ("", "Static")),
+    ("INPUT_SHIFT_STATUS_ACTIVITY_COLORS", ("", "true")),
+    ("INPUT_SPOTIFY_INCLUDE_ALBUM_PLAYLIST_NAME", ("", "true")),
+    ("INPUT_STATUS_CONTEXT_SEPERATOR", ("", "|")),
+)
+
+
+def resolve_envs(options: dict[str, str]) -> dict[str, Any]:
+    resolver: UtilityMethods = UtilityMethods()
+    resolver.logger = getLogger(__name__)
+
+    env_source: dict[str, str] = {each_key: "" for each_key in ENV_STRUCT_CONSTRAINTS}
+    env_source.update(
+        {
+            "GITHUB_ACTOR": "CodexLink",
+            "GITHUB_API_URL": "https://api.github.com",
+            "INPUT_DISCORD_BOT_TOKEN": "token",
+            "INPUT_DISCORD_USER_ID": "1",
+            "INPUT_WORKFLOW_TOKEN": "token",
+        }
+    )
+    env_source.update(options)
+
+    return resolver._resolve_env_source(env_source)
+
+
+def make_snapshot(
+    activities: dict[str, dict[str, Any]], status: Status
+) -> PresenceSnapshot:
+    return PresenceSnapshot(
+        1,
+        "CodexLink",
+        "0001",
+        tuple(
+            ActivitySnapshot(
+                each_kind,
+                each_activity["name"],
+                each_activity["state"],
+                each_activity["details"],
+                each_activity["assets"]["large_text"],
+                each_activity["timestamps"].get("start"),
+                each_activity["timestamps"].get("end"),
+            )
+            for each_kind, each_activity in activities.items()
+        ),
+        status,
+    )
+
+
+def old_render(envs: dict[str, Any], user_ctx: dict[str, Any], now: datetime) -> str:
+    # The rendering of `construct_badge()` before the render plan, without its logging. The options were looked up (and formatted) on every render.
+    picked_activity: str = ""
+    is_preferred_exists: bool = False
+
+    redirect_url: str = BADGE_REDIRECT_BASE_DOMAIN + (
+        envs["URL_TO_REDIRECT_ON_CLICK"]
+        if envs["URL_TO_REDIRECT_ON_CLICK"]
+        else "{0}/{0}".format(envs["GITHUB_ACTOR"])
+    )
+
+    presence_ctx: dict[str, Any] = user_ctx["activities"]
+    contains_activities: bool = bool(len(presence_ctx))
+
+    if contains_activities:
+        for each_cls in PreferredActivityDisplay:
+            if envs["PREFERRED_ACTIVITY_TO_DISPLAY"] is each_cls:
+                if presence_ctx.get(each_cls.name) is not None:
+                    picked_activity = each_cls.name
+                    is_preferred_exists = True
+                    break
+
+        if not is_preferred_exists:
+            picked_activity = list(presence_ctx.keys())[0]
+
+    state_string: str = "%s_STRING" % (
+        picked_activity
+        if picked_activity != PreferredActivityDisplay.CUSTOM_ACTIVITY.name
+        else "%s_STATUS" % user_ctx["statuses"]["status"].name.upper()
+    )
+
+    subject_output: str = (
+        BADGE_BASE_SUBJECT
+        if not contains_activities and envs["STATIC_SUBJECT_STRING"] is None
+        else (
+            envs[
+                (
+                    state_string
+                    if envs["STATIC_SUBJECT_STRING"] is None
+                    else "STATIC_SUBJECT_STRING"
+                )
+            ]
+        )
+    )
+
+    seperator: str = (
+        (
+            ", "
+            if envs["STATUS_CONTEXT_SEPERATOR"] is None
+            else " %s " % envs["STATUS_CONTEXT_SEPERATOR"]
+        )
+        if (
+            envs["PREFERRED_PRESENCE_CONTEXT"] is not ContextOnSubject.CONTEXT_DISABLED
+            or envs["TIME_DISPLAY_OUTPUT"] is not PreferredTimeDisplay.TIME_DISABLED
+        )
+        and picked_activity != PreferredActivityDisplay.CUSTOM_ACTIVITY.name
+        else ""
+    )
+
+    status_output: str = (
+        (
+            "%s " % envs[state_string]
+            if envs["STATIC_SUBJECT_STRING"] is not None
+            else ""
+        )
+        + (
+            envs["%s_STATUS_STRING" % user_ctx["statuses"]["status"].name.upper()]
+            if not contains_activities
+            else presence_ctx[picked_activity][
+                (
+                    "name"
+                    if picked_activity != PreferredActivityDisplay.CUSTOM_ACTIVITY.name
+                    else "state"
+                )
+            ]
+        )
+        + (
+            (
+                seperator
+                + presence_ctx[picked_activity][
+                    (
+                        "state"
+                        if envs["PREFERRED_PRESENCE_CONTEXT"] is ContextOnSubject.STATE
+                        else "details"
+                    )
+                ]
+            )
+            if picked_activity == PreferredActivityDisplay.RICH_PRESENCE.name
+            and envs["PREFERRED_PRESENCE_CONTEXT"]
+            is not ContextOnSubject.CONTEXT_DISABLED
+            else ""
+        )
+        + (
+            seperator
+            + (
+                "{0} by {1}".format(
+                    presence_ctx[picked_activity]["details"],
+                    presence_ctx[picked_activity]["state"],
+                )
+                + (
+                    (" (%s)" % presence_ctx[picked_activity]["assets"]["large_text"])
+                    if envs["SPOTIFY_INCLUDE_ALBUM_PLAYLIST_NAME"]
+                    else ""
+                )
+            )
+            if picked_activity == PreferredActivityDisplay.SPOTIFY_ACTIVITY.name
+            else (
+                seperator
+                if envs["TIME_DISPLAY_OUTPUT"] is not PreferredTimeDisplay.TIME_DISABLED
+                and contains_activities
+                else ""
+            )
+        )
+    )
+
+    if (
+        envs["TIME_DISPLAY_OUTPUT"] is not PreferredTimeDisplay.TIME_DISABLED
+        and contains_activities
+    ):
+        contains_timestamps: Any = presence_ctx[picked_activity].get("timestamps")
+
+        if contains_timestamps:
+            has_remaining: Any = presence_ctx[picked_activity]["timestamps"].get("end")
+
+            start_time: datetime = datetime.fromtimestamp(
+                int(presence_ctx[picked_activity]["timestamps"]["start"]) / 1000
+            )
+            running_time: timedelta = now - start_time
+
+            if has_remaining:
+                end_time: timedelta = (
+                    datetime.fromtimestamp(int(has_remaining) / 1000) - start_time
+                )
+
+                if picked_activity == PreferredActivityDisplay.SPOTIFY_ACTIVITY.name:
+                    running_time = running_time - timedelta(
+                        microseconds=running_time.microseconds
+                    )
+                    end_time = end_time - timedelta(microseconds=end_time.microseconds)
+
+                    status_output = status_output + f" | {running_time} of {end_time}"
+
+            else:
+                time_option: PreferredTimeDisplay = envs["TIME_DISPLAY_OUTPUT"]
+                parsed_time: int = int(
+                    running_time.total_seconds()
+                    / (
+                        3600
+                        if time_option is PreferredTimeDisplay.HOURS
+                        else (
+                            60
+                            if time_option is PreferredTimeDisplay.MINUTES
+                            or time_option is PreferredTimeDisplay.HOURS_MINUTES
+                            else 1
+                        )
+                    )
+                )
+
+                hours = (
+                    parsed_time
+                    if parsed_time >= 1 and time_option is PreferredTimeDisplay.HOURS
+                    else 0
+                )
+                minutes = (
+                    parsed_time
+                    if parsed_time >= 1 and time_option is PreferredTimeDisplay.MINUTES
+                    else 0
+                )
+                seconds = (
+                    parsed_time
+                    if parsed_time >= 1 and time_option is PreferredTimeDisplay.SECONDS
+                    else 0
+                )
+
+                if time_option is PreferredTimeDisplay.HOURS_MINUTES:
+                    while True:
+                        if parsed_time / 60 >= 1:
+                            hours += 1
+                            parsed_time -= 60
+                            continue
+
+                        break
+
+                    minutes = parsed_time
+
+                time_strings: list[str] = ["hours", "minutes", "seconds"]
+
+                for idx, each_time_string in enumerate(("hours", "minutes", "seconds")):
+                    if envs["TIME_DISPLAY_SHORTHAND"]:
+                        time_strings[idx] = each_time_string[0]
+
+                    else:
+                        time_strings[idx] = (
+                            each_time_string[:-1]
+                            if locals()[f"{each_time_string}"] < 1
+                            else each_time_string
+                        )
+
+                is_time_displayable: bool = hours >= 1 or minutes >= 1 or seconds >= 1
+
+                status_output = (
+                    status_output
+                    + (
+                        (f"{hours} %s" % time_strings[0] if hours >= 1 else "")
+                        + (" " if hours and minutes else "")
+                        + (f"{minutes} %s" % time_strings[1] if minutes >= 1 else "")
+                        + (f"{seconds} %s" % time_strings[2] if seconds >= 1 else "")
+                        + (
+                            f" %s"
+                            % envs[
+                                (
+                                    "TIME_DISPLAY_%s_OVERRIDE_STRING" % "ELAPSED"
+                                    if not has_remaining
+                                    else "REMAINING"
+                                )
+                            ]
+                        )
+                    )
+                    if is_time_displayable
+                    else "Just started."
+                )
+
+    status_color: str = (
+        (envs["%s_COLOR" % state_string.removesuffix("_STRING")])
+        if envs["STATIC_SUBJECT_STRING"] is not None or contains_activities
+        else BADGE_NO_COLOR_DEFAULT
+    )
+
+    if status_color.startswith("#"):
+        status_color = status_color[1:]
+
+    subject_color: str = envs[
+        "%s_COLOR"
+        % (
+            "%s_STATUS" % user_ctx["statuses"]["status"].name.upper()
+            if contains_activities or envs["STATIC_SUBJECT_STRING"] is None
+            else state_string.removesuffix("_STRING")
+        )
+    ]
+
+    if subject_color.startswith("#"):
+        subject_color = subject_color[1:]
+
+    if envs["SHIFT_STATUS_ACTIVITY_COLORS"]:
+        status_color, subject_color = subject_color, status_color
+
+    constructed_url: str = (
+        f"{BADGE_BASE_URL}{quote(subject_output)}/{quote(status_output)}?color={subject_color}&labelColor={status_color}&icon={BADGE_ICON}"
+    )
+
+    return BADGE_BASE_MARKDOWN.format(
+        envs["BADGE_IDENTIFIER_NAME"], constructed_url, redirect_url
+    )
+
+
+def get_badge(render: Callable[[], str]) -> Optional[str]:
+    # ! A badge that needs an option which doesn't exist raises a KeyError on both renders, although not on the same key (the plan keys its tables by state).
+    try:
+        return render()
+
+    except KeyError:
+        return None
+
+
+def check_equivalence() -> int:
+    """
+    Returns:
+        int: The number of combinations that were compared.
+    """
+
+    option_keys: list[str] = [each_key for each_key, _ in OPTIONS]
+    compared: int = 0
+
+    for each_combination in product(*(each_values for _, each_values in OPTIONS)):
+        envs: dict[str, Any] = resolve_envs(dict(zip(option_keys, each_combination)))
+        render_plan: BadgeRenderPlan = BadgeRenderPlan(envs)
+
+        for (activities_name, activities), status in product(
+            ACTIVITIES.items(), STATUSES
+        ):
+            user_ctx: dict[str, Any] = {
+                "statuses": {"status": status},
+                "activities": activities,
+            }
+            snapshot: PresenceSnapshot = make_snapshot(activities, status)
+
+            old_badge: Any = get_badge(lambda: old_render(envs, user_ctx, NOW))
+            new_badge: Any = get_badge(lambda: render_plan.render(snapshot, NOW))
+
+            assert old_badge == new_badge, (
+                each_combination,
+                activities_name,
+                status,
+                old_badge,
+                new_badge,
+            )
+            compared += 1
+
+    return compared
+
+
+def get_renders_per_second(render: Callable[[], Any], renders: int) -> float:
+    started_at: float = perf_counter()
+
+    for _ in range(renders):
+        render()
+
+    return renders / (perf_counter() - started_at)
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(
+        description="Compares the badge render plan against the rendering that it has replaced."
+    )
+    parser.add_argument("--renders", type=int, default=20000)
+    renders: int = parser.parse_args().renders
+
+    getLogger(__name__).setLevel(CRITICAL)
+
+    print(f"Renders are the same on all {check_equivalence()} combinations.")
+
+    envs: dict[str, Any] = resolve_envs({})
+    print(f"{'activity':<24} {'old':>10} {'plan':>10}   (renders/s)")
+
+    for activities_name in ("rich presence", "spotify", "none"):
+        user_ctx: dict[str, Any] = {
+            "statuses": {"status": Status.online},
+            "activities": ACTIVITIES[activities_name],
+        }
+        snapshot: PresenceSnapshot = make_snapshot(
+            ACTIVITIES[activities_name], Status.online
+        )
+        render_plan: BadgeRenderPlan = BadgeRenderPlan(envs)
+
+        print(
+            "%-24s %10.0f %10.0f"
+            % (
+                activities_name,
+                get_renders_per_second(
+                    lambda: old_render(envs, user_ctx, NOW), renders
+                ),
+                get_renders_per_second(
+                    lambda: render_plan.render(snapshot, NOW), renders
+                ),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -14,24 +14,64 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from ast import literal_eval
-from asyncio import sleep
+from asyncio import (
+    Task,
+    TimeoutError,
+    create_task,
+    get_event_loop,
+    sleep,
+    wait,
+    wait_for,
+)
+from binascii import b2a_base64
+from json import dump as json_dump
+from json import dumps as json_dumps
+from json import load as json_load
 from logging import Logger
 from os import _exit as terminate
-from typing import Any, Callable, Optional, Union
-
-from aiohttp import BasicAuth, ClientResponse, ClientSession
+from os import environ as env
+from os import makedirs, path, remove
+from random import uniform
+from time import perf_counter, time
+from typing import Any, Callable, Mapping, Optional, Union
+
+from aiohttp import (
+    BasicAuth,
+    ClientError,
+    ClientRequest,
+    ClientResponse,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+)
+from discord.http import Route
+from yarl import URL
 
+from budget import GithubRateLimitBudget
 from elements.constants import (
     COMMIT_REQUEST_PAYLOAD,
     DISCORD_CLIENT_INTENTS,
+    GITHUB_API_PAYLOAD_CHUNK_SIZE,
+    GITHUB_API_RETRY_BASE_DELAY,
+    GITHUB_API_RETRY_DEADLINE,
+    GITHUB_API_RETRY_MAX_ATTEMPTS,
+    GITHUB_API_RETRY_MAX_DELAY,
+    GITHUB_API_SECONDARY_RATE_LIMIT_DELAY,
+    HTTP_CONNECTOR_DNS_CACHE_TTL,
+    HTTP_CONNECTOR_KEEPALIVE_TIMEOUT,
+    HTTP_CONNECTOR_LIMIT,
+    HTTP_CONNECTOR_LIMIT_PER_HOST,
+    HTTP_PRECONNECT_TIMEOUT,
+    README_CACHE_DIRECTORY,
+    README_CACHE_STRUCT,
     REQUEST_HEADER,
     ExitReturnCodes,
+    GithubResponseClass,
     GithubRunnerActions,
     GithubRunnerLevelMessages,
 )
+from elements.exceptions import GithubAPIConflictError, GithubAPIError
 from elements.typing import (
-    Base64String,
     HttpsURL,
     READMEContent,
     READMEIntegritySHA,
@@ -39,10 +79,26 @@ from elements.typing import (
 )
 
 
+class SharedTCPConnector(TCPConnector):
+    """
+    A TCPConnector that is shared by the ClientSession (Github API) and the Discord Client.
+
+    Sessions that own their connector (such as discord.py's) close it along with them, which would leave the other session without a pool.
+    Which is why closing this connector is left to `shutdown()`, once every session that uses it has been closed.
+    """
+
+    async def close(self) -> None:  # type: ignore
+        pass
+
+    async def shutdown(self) -> None:
+        await super().close()
+
+
 class AsyncGithubAPILite:
     # * The following variables are declared for weak reference since there's no hint-typing inheritance.
 
     envs: Any
+    get_blob_sha: Callable
     logger: Logger
     print_exception: Callable
 
@@ -51,15 +107,89 @@ class AsyncGithubAPILite:
     but I just realized that I only need some certain components. This class also contains session for all HTTPS requests and that includes Badgen.
     """
 
+    def _prepare_connector(self) -> None:
+        """
+        Instantiates the connector that is shared by the ClientSession and the Discord Client, and then pre-connects to the Github API and Discord on the background.
+        This should be called as early as possible, so that the connections were established while the environment is being resolved and the Discord Client logs in.
+        """
+
+        self._api_connector: SharedTCPConnector = SharedTCPConnector(
+            limit=HTTP_CONNECTOR_LIMIT,
+            limit_per_host=HTTP_CONNECTOR_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_CONNECTOR_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=HTTP_CONNECTOR_DNS_CACHE_TTL,
+        )
+
+        # ! `GITHUB_API_URL` is read straight from the environment since the environment is not resolved yet.
+        self._api_preconnect_tasks: dict[str, Task] = {
+            each_url: create_task(
+                self._preconnect(each_url),
+                name=f"Connector_Preconnect_{URL(each_url).host}",
+            )
+            for each_url in (env.get("GITHUB_API_URL"), Route.BASE)
+            if each_url
+        }
+
+    async def _preconnect(self, url: str) -> None:
+        """
+        Establishes a connection (DNS, TCP and TLS) to the host of the URL without sending any request, and then leaves it in the pool to be picked up by the first request.
+
+        Args:
+            url (str): The URL of the host to connect to.
+        """
+
+        try:
+            preconnected_at: float = perf_counter()
+            connection: Any = await wait_for(
+                self._api_connector.connect(
+                    ClientRequest("GET", URL(url), loop=get_event_loop()),
+                    [],
+                    ClientTimeout(),
+                ),
+                timeout=HTTP_PRECONNECT_TIMEOUT,
+            )
+            connection.release()
+
+            self.logger.info(
+                f"Pre-connected to {URL(url).host} (took {perf_counter() - preconnected_at:.3f}s)."
+            )
+
+        # * This is only an optimization. The request will connect on its own when this fails.
+        except (ClientError, OSError, TimeoutError) as e:
+            self.logger.warning(
+                f"Pre-connecting to {URL(url).host} has failed, the connection will be established on the first request instead. | Info: {e}"
+            )
+
+    async def _wait_for_preconnect(self, url: str) -> None:
+        """
+        Waits for the pre-connection to the host of the URL (if there's any), so that the request won't establish another connection while the other one is still pending.
+
+        Args:
+            url (str): The URL of the host, in the same form as the URL given in `_prepare_connector()`.
+        """
+
+        preconnect_task: Optional[Task] = self._api_preconnect_tasks.get(url)
+
+        if preconnect_task is not None and not preconnect_task.done():
+            await wait({preconnect_task})
+
     async def __ainit__(self) -> None:
         """
         Asynchronous init for instantiating other classes, if there's another one behind the MRO, which is the DiscordClientHandler.
-        This also instantiates aiohttp.ClientSession for future requests.
+        This also instantiates aiohttp.ClientSession (over the shared connector) for future requests, along with the rate limit budget of the token.
         """
 
-        self._api_session: ClientSession = ClientSession()
+        self._api_session: ClientSession = ClientSession(
+            connector=self._api_connector, connector_owner=False
+        )
         self.logger.info("ClientSession for API Requests has been instantiated.")
 
+        # * The rate limit is counted per token, which is why the tenants (on batch mode) look up their budget from here.
+        self._api_budgets: dict[str, GithubRateLimitBudget] = {}
+        self._api_budget: GithubRateLimitBudget = self._api_budgets.setdefault(
+            self.envs["WORKFLOW_TOKEN"], GithubRateLimitBudget(self.logger)
+        )
+
         super().__init__()
         self.logger.info(
             f"Discord Client Instantiatied with intents={DISCORD_CLIENT_INTENTS=}"
@@ -73,26 +203,26 @@ class AsyncGithubAPILite:
         self,
         action: GithubRunnerActions,
         data: Optional[list[Union[READMEIntegritySHA, READMERawContent]]] = None,
-    ) -> Union[None, list[Union[READMEIntegritySHA, Base64String]]]:
+    ) -> Union[None, list[Union[READMEIntegritySHA, READMERawContent]]]:
         """
         A method that handles every possible requests by packaging required components into one. This was done so that we only have to call the method without worrying anything.
 
         Args:
             action (GithubRunnerActions): The action to perform. Choices should be FETCH_README and COMMIT_CHANGES.
             data (Optional[list[tuple[READMEIntegritySHA, READMERawContent]]] , optional): The data required for COMMIT_CHANGES.
-            Basically it needs the old README SHA integrity and the new README in the form of Base64 (READMERawContent). Defaults to None.
+            Basically it needs the old README SHA integrity and the new README in raw bytes (READMERawContent), which is encoded to Base64 on the request. Defaults to None.
 
         Returns:
-            Union[None, list[Union[READMEIntegritySHA, Base64String]]]: This expects to return a list of READMEIntegritySHA and Base64 straight from b64decode or None.
+            Union[None, list[Union[READMEIntegritySHA, READMERawContent]]]: This expects to return a list of READMEIntegritySHA and the README in raw bytes (decoded from Base64) or None.
+
+        Raises:
+            GithubAPIConflictError: The README has been changed (since it was fetched) before the changes were committed.
+            GithubAPIError: The request has failed and cannot be retried any further, such as when it ran out of attempts or the rate limit.
         """
 
         if action in GithubRunnerActions:
             # We setup paths for HttpsURL with the use of these two varaibles.
-            user_repo = (
-                "{0}/{0}".format(self.envs["GITHUB_ACTOR"])
-                if self.envs["PROFILE_REPOSITORY"] is None
-                else "{0}".format(self.envs["PROFILE_REPOSITORY"])
-            )
+            user_repo: str = self.get_user_repo()
             repo_path: HttpsURL = HttpsURL(
                 "{0}/repos/{1}/{2}".format(
                     self.envs["GITHUB_API_URL"],
@@ -103,74 +233,153 @@ class AsyncGithubAPILite:
                 )
             )
 
-            # When making requests, we might want to loop whenever the data that we receive is malformed or have failed to send.
-            while True:
-                http_request: ClientResponse = await self._request(
-                    repo_path, action, data=data if data is not None else None
-                )
+            # * The README is fetched conditionally whenever it was cached from the previous run, which doesn't count against the rate limit when it was not modified.
+            readme_cache: Optional[tuple[README_CACHE_STRUCT, READMERawContent]] = (
+                self._load_readme_cache(user_repo)
+                if action is GithubRunnerActions.FETCH_README
+                and self.envs["STATE_DIRECTORY"]
+                else None
+            )
+
+            # ! The README is only encoded to Base64 here (once, then reused by every attempt), since this is where the commit is known to be sent.
+            commit_payload: Optional[bytearray] = (
+                self._get_commit_payload(data)  # type: ignore
+                if action is GithubRunnerActions.COMMIT_CHANGES and data is not None
+                else None
+            )
+
+            await self._wait_for_preconnect(self.envs["GITHUB_API_URL"])
+            deadline: float = perf_counter() + GITHUB_API_RETRY_DEADLINE
+
+            # Requests are retried depending on how the previous one has failed, until they run out of attempts or time.
+            for attempt in range(GITHUB_API_RETRY_MAX_ATTEMPTS):
+                # * Every attempt costs a request, so it has to be admitted by the budget that is shared with the other requests of the token.
+                if not await self._api_budget.acquire(action, deadline):
+                    response_class: GithubResponseClass = (
+                        GithubResponseClass.RATE_LIMITED
+                    )
+                    response_info: str = f"The rate limit budget has run out and will not be reset until {self._api_budget.reset_at}."
+                    break
+
+                response_headers: Optional[Mapping[str, Any]] = None
 
                 try:
-                    if http_request.ok:
+                    http_request: ClientResponse = await self._request(
+                        repo_path,
+                        action,
+                        payload=commit_payload,
+                        etag=readme_cache[0]["etag"] if readme_cache else None,
+                    )
+                    response_headers = http_request.headers
+                    response_body: bytes = await http_request.read()
+
+                except (ClientError, TimeoutError) as e:
+                    response_class = GithubResponseClass.TRANSIENT
+                    response_info = f"{type(e).__name__}: {e}"
+                    retry_delay: float = self._get_backoff_delay(attempt)
+
+                else:
+                    response_class = self._classify_response(
+                        http_request, response_body
+                    )
+
+                    if response_class is GithubResponseClass.SUCCESS:
                         suffix_req_cost: str = (
                             "Remaining Requests over Rate-Limit (%s/%s)"
                             % (
-                                http_request.headers["X-RateLimit-Remaining"],
-                                http_request.headers["X-RateLimit-Limit"],
+                                http_request.headers.get("X-RateLimit-Remaining"),
+                                http_request.headers.get("X-RateLimit-Limit"),
                             )
                         )
 
-                        # For this action, decode the README (base64) in utf-8 (str) then sterilized unnecessary newline.
                         if action is GithubRunnerActions.FETCH_README:
-                            read_response: bytes = http_request.content.read_nowait()
-                            serialized_response: dict = literal_eval(
-                                read_response.decode("utf-8")
+                            if http_request.status == 304 and readme_cache is not None:
+                                self.logger.info(
+                                    f"Github Profile ({user_repo}) README was not modified since the previous run. Using the cached README... | {suffix_req_cost}"
+                                )
+                                return [readme_cache[0]["sha"], readme_cache[1]]
+
+                            # * The README was requested raw, which means the body is the README itself. Its SHA is computed the same way as Github does.
+                            readme_ctx: READMERawContent = READMERawContent(
+                                response_body
+                            )
+                            readme_sha: READMEIntegritySHA = READMEIntegritySHA(
+                                self.get_blob_sha(readme_ctx)
                             )
 
                             self.logger.info(
                                 f"Github Profile ({user_repo}) README has been fetched. | {suffix_req_cost}"
                             )
-                            return [
-                                serialized_response["sha"],
-                                Base64String(
-                                    serialized_response["content"].replace("\n", "")
-                                ),
-                            ]
 
-                        # Since we commit and there's nothing else to modify, just output that the request was success.
-                        if action is GithubRunnerActions.COMMIT_CHANGES and data is Base64String(data):  # type: ignore # It explicitly wants to typecast `str`, which renders the condition false.
-                            self.logger.info(
-                                f"README Changes from ({user_repo}) has been pushed through! | {suffix_req_cost}"
-                            )
-                            return None
+                            if (
+                                self.envs["STATE_DIRECTORY"]
+                                and "ETag" in http_request.headers
+                            ):
+                                self._save_readme_cache(
+                                    user_repo,
+                                    {
+                                        "etag": http_request.headers["ETag"],
+                                        "sha": readme_sha,
+                                    },
+                                    readme_ctx,
+                                )
+
+                            return [readme_sha, readme_ctx]
 
-                    # If any of those conditions weren't met, retry again.
-                    else:
-                        self.logger.warning(
-                            "Conditions were not met, continuing again after 3 seconds (as a penalty)."
+                        # Since we commit and there's nothing else to modify, just output that the request was success.
+                        self.logger.info(
+                            f"README Changes from ({user_repo}) has been pushed through! | {suffix_req_cost}"
                         )
-                        await sleep(0.6)
-                        continue
 
-                # Same for this case, but we assert that the data received is malformed.
-                except SyntaxError as e:
-                    self.logger.warning(
-                        f"Fetched Data is either incomplete or malformed. Attempting to re-fetch... | Info: {e} at line {e.__traceback__.tb_lineno}."  # type: ignore
-                    )
+                        # ! The README has a new SHA from this point, which means the cached README is outdated.
+                        if self.envs["STATE_DIRECTORY"]:
+                            self._discard_readme_cache(user_repo)
+
+                        return None
 
-                    await sleep(0.6)
-                    continue
+                    response_info = f"{http_request.status} {http_request.reason} ({response_body[:256].decode('utf-8', 'replace')})"
+                    retry_delay = (
+                        self._get_rate_limit_delay(http_request, attempt)
+                        if response_class is GithubResponseClass.RATE_LIMITED
+                        else self._get_backoff_delay(attempt)
+                    )
 
-                # Whenever we tried too much, we don't know if we are rate-limited, because the request will make the ClientResponse.ok set to True.
-                # So for this case, we special handle it by identifying the message.
-                except KeyError as e:
-                    if serialized_response["message"].startswith(
-                        "API rate limit exceeded"
-                    ):
-                        msg: str = f"Request accepted but you are probably rate-limited by Github API. Did you keep on retrying or you are over-committing changes? | More Info: {e} at line {e.__traceback__.tb_lineno}."  # type: ignore
-                        self.logger.critical(msg)
+                # ! The request is released even when it was cancelled (such as when its tenant was cancelled), otherwise it would hold the budget for the rest of the run.
+                finally:
+                    self._api_budget.release(response_headers)
+
+                # ! Retrying a conflict or a fatal response will only end up the same, since the request will not change.
+                if (
+                    response_class is GithubResponseClass.CONFLICT
+                    or response_class is GithubResponseClass.FATAL
+                    or attempt + 1 >= GITHUB_API_RETRY_MAX_ATTEMPTS
+                    or perf_counter() + retry_delay > deadline
+                ):
+                    break
+
+                self.logger.warning(
+                    f"Request to Github API ({action.name}) was classified as {response_class.name}. Retrying in {retry_delay:.2f} seconds (attempt {attempt + 1} of {GITHUB_API_RETRY_MAX_ATTEMPTS}). | Info: {response_info}"
+                )
+                await sleep(retry_delay)
+
+            # ! The failure is raised to the stage (which marks it as FAILED) instead of terminating, so that the other stages and tenants are left unaffected.
+            if response_class is GithubResponseClass.CONFLICT:
+                raise GithubAPIConflictError(
+                    f"README has been changed while the badge was being constructed. | Info: {response_info}",
+                    action,
+                    response_class,
+                )
 
-                        self.print_exception(GithubRunnerLevelMessages.ERROR, msg, e)
-                        terminate(ExitReturnCodes.RATE_LIMITED_EXIT)
+            raise GithubAPIError(
+                f"Request to Github API ({action.name}) has failed and cannot be retried any further (classified as {response_class.name}, after {attempt + 1} attempt/s).%s | Info: {response_info}"
+                % (
+                    " Did you keep on retrying or you are over-committing changes?"
+                    if response_class is GithubResponseClass.RATE_LIMITED
+                    else ""
+                ),
+                action,
+                response_class,
+            )
 
         else:
 
@@ -180,11 +389,126 @@ class AsyncGithubAPILite:
             self.print_exception(GithubRunnerLevelMessages.ERROR, msg)
             terminate(ExitReturnCodes.ILLEGAL_CONDITION_EXIT)
 
+    def get_user_repo(self) -> str:
+        """
+        Returns:
+            str: The repository that contains the README, in `<owner>/<repository>` form. Defaults to the special repository of `GITHUB_ACTOR`.
+        """
+
+        return (
+            "{0}/{0}".format(self.envs["GITHUB_ACTOR"])
+            if self.envs["PROFILE_REPOSITORY"] is None
+            else "{0}".format(self.envs["PROFILE_REPOSITORY"])
+        )
+
+    def _get_readme_cache_paths(self, user_repo: str) -> tuple[str, str]:
+        """
+        Args:
+            user_repo (str): The repository of the README, in `<owner>/<repository>` form.
+
+        Returns:
+            tuple[str, str]: The path of the cache (README_CACHE_STRUCT in JSON) and the path of the cached README, under STATE_DIRECTORY.
+        """
+
+        cache_path: str = self.get_state_path(README_CACHE_DIRECTORY, user_repo)
+
+        return f"{cache_path}.json", f"{cache_path}.md"
+
+    def _load_readme_cache(
+        self, user_repo: str
+    ) -> Optional[tuple[README_CACHE_STRUCT, READMERawContent]]:
+        """
+        Loads the README that was cached from the previous run, along with its ETag and SHA.
+
+        Args:
+            user_repo (str): The repository of the README, in `<owner>/<repository>` form.
+
+        Returns:
+            Optional[tuple[README_CACHE_STRUCT, READMERawContent]]: The cache and the cached README, or None when it doesn't exist, is unreadable or doesn't match its SHA.
+        """
+
+        cache_path, readme_path = self._get_readme_cache_paths(user_repo)
+
+        try:
+            with open(cache_path, encoding="utf-8") as cache_file:
+                readme_cache: README_CACHE_STRUCT = json_load(cache_file)
+
+            with open(readme_path, "rb") as readme_file:
+                readme_ctx: READMERawContent = READMERawContent(readme_file.read())
+
+        except FileNotFoundError:
+            return None
+
+        except (OSError, ValueError) as e:
+            self.logger.warning(
+                f"README cache of {user_repo} cannot be loaded. Fetching the whole README instead... | Info: {e}"
+            )
+            return None
+
+        # ! The cache may have been partially restored, so it has to match its SHA before it can be trusted.
+        if self.get_blob_sha(readme_ctx) != readme_cache["sha"]:
+            self.logger.warning(
+                f"README cache of {user_repo} does not match its SHA. Fetching the whole README instead..."
+            )
+            return None
+
+        return readme_cache, readme_ctx
+
+    def _save_readme_cache(
+        self, user_repo: str, readme_cache: README_CACHE_STRUCT, readme_ctx: bytes
+    ) -> None:
+        """
+        Persists the README along with its ETag and SHA under STATE_DIRECTORY, so that the next run can fetch it conditionally. Failing to do so only loses the cache.
+
+        Args:
+            user_repo (str): The repository of the README, in `<owner>/<repository>` form.
+            readme_cache (README_CACHE_STRUCT): The ETag and the SHA of the README.
+            readme_ctx (bytes): The content of the README in raw bytes.
+        """
+
+        cache_path, readme_path = self._get_readme_cache_paths(user_repo)
+
+        try:
+            makedirs(path.dirname(cache_path), exist_ok=True)
+
+            # The README is written first, since the cache is what refers to it.
+            with open(readme_path, "wb") as readme_file:
+                readme_file.write(readme_ctx)
+
+            with open(cache_path, "w", encoding="utf-8") as cache_file:
+                json_dump(readme_cache, cache_file)
+
+        except OSError as e:
+            self.logger.warning(
+                f"README of {user_repo} cannot be cached, the next run will fetch the whole README. | Info: {e}"
+            )
+
+    def _discard_readme_cache(self, user_repo: str) -> None:
+        """
+        Removes the cached README, which is done once the README has changed from our end.
+
+        Args:
+            user_repo (str): The repository of the README, in `<owner>/<repository>` form.
+        """
+
+        for each_path in self._get_readme_cache_paths(user_repo):
+            try:
+                remove(each_path)
+
+            except FileNotFoundError:
+                pass
+
+            except OSError as e:
+                self.logger.warning(
+                    f"README cache of {user_repo} cannot be discarded. | Info: {e}"
+                )
+
     async def _request(
         self,
         url: HttpsURL,
         action_type: GithubRunnerActions,
-        data: Optional[list[Union[READMEIntegritySHA, READMERawContent]]] = None,
+        payload: Optional[bytearray] = None,
+        etag: Optional[str] = None,
     ) -> ClientResponse:
         """
         An inner-private method that handles the requests by using packaged header and payload, necessarily for requests.
@@ -192,10 +516,11 @@ class AsyncGithubAPILite:
         Args:
             url (HttpsURL): The URL String to make Request.
             action_type (GithubRunnerActions): The type of action that is recently passed on `exec_api_actions().`
-            data (Optional[list[Union[READMEIntegritySHA, READMERawContent]]], optional): The argument given in `exec_api_actions()`, now handled in this method.. Defaults to None.
+            payload (Optional[bytearray], optional): The payload of the commit (in JSON), from `_get_commit_payload()`. Defaults to None.
+            etag (Optional[str], optional): The ETag of the cached README, which makes the request conditional (`If-None-Match`). Defaults to None.
 
         Returns:
-            ClientResponse: The raw response given by the aiohttp.REST_METHODS. Returned without modification to give the receiver more options.
+            ClientResponse: The raw response given by the aiohttp.REST_METHODS, regardless of its status. Returned without modification to give the receiver more options.
         """
 
         if action_type in GithubRunnerActions:
@@ -214,50 +539,34 @@ class AsyncGithubAPILite:
             )
 
             # # This dictionary is applied when GithubRunnerActions.COMMIT_CHANGES was given in parameter `action`.
+            # * The README is fetched raw, so that there's no JSON or Base64 to decode.
             extra_contents: REQUEST_HEADER = {
-                "headers": {"Accept": "application/vnd.github.v3+json"},
+                "headers": {
+                    "Accept": "application/vnd.github.v3.raw"
+                    if action_type is GithubRunnerActions.FETCH_README
+                    else "application/vnd.github.v3+json"
+                },
                 "auth": BasicAuth(
                     self.envs["GITHUB_ACTOR"], self.envs["WORKFLOW_TOKEN"]
                 ),
             }
 
-            # # This dictionary is applied when GithubRunnerActions.COMMIT_CHANGES was given in parameter `action`.
-            data_context: COMMIT_REQUEST_PAYLOAD = (
-                {
-                    "content": READMEContent(bytes(data[1]).decode("utf-8")) if data is not None else None,  # type: ignore # Keep in mind that the type-hint is already correct, I don't know what's the problem.]
-                    "message": self.envs["COMMIT_MESSAGE"],
-                    "sha": READMEIntegritySHA(str(data[0]))
-                    if data is not None
-                    else None,
-                    "committer": {
-                        "name": "Discord Activity Badge",
-                        "email": "discord_activity@discord_bot.com",
-                    },
-                }
-                if action_type is GithubRunnerActions.COMMIT_CHANGES
-                else {
-                    "content": READMEContent(""),
-                    "message": "",
-                    "sha": READMEIntegritySHA(""),
-                    "committer": {"name": "", "email": ""},
-                }
-            )
+            if etag is not None:
+                extra_contents["headers"]["If-None-Match"] = etag
+
+            if payload is not None:
+                extra_contents["headers"]["Content-Type"] = "application/json"
 
             http_request: ClientResponse = await getattr(
                 self._api_session,
                 "get" if action_type is GithubRunnerActions.FETCH_README else "put",
-            )(url, json=data_context, allow_redirects=False, **extra_contents)
-
-            # todo: Make this clarified or confirmed. We don't have a case to where we can see this in action.
-            if http_request.ok:
-                return http_request
+            )(url, data=payload, allow_redirects=False, **extra_contents)
 
-            # ! Sometimes, we can exceed the rate-limit request per time. We have to handle the display error instead from the receiver of this request.
-            _resp_raw: ClientResponse = http_request  # Supposed to be ClientResponse
-            _resp_ctx: dict = literal_eval(str(_resp_raw))
-
-            self.logger.debug(_resp_ctx)
-            terminate(ExitReturnCodes.EXCEPTION_EXIT)
+            # * The response is classified by the receiver, since it decides whether to retry or not.
+            self.logger.debug(
+                f"Github API Response: {http_request.status} {http_request.reason} | Remaining Requests over Rate-Limit ({http_request.headers.get('X-RateLimit-Remaining')}/{http_request.headers.get('X-RateLimit-Limit')})"
+            )
+            return http_request
 
         else:
 
@@ -266,3 +575,139 @@ class AsyncGithubAPILite:
 
             self.print_exception(GithubRunnerLevelMessages.ERROR, msg, None)
             terminate(ExitReturnCodes.ILLEGAL_CONDITION_EXIT)
+
+    def _get_commit_payload(
+        self, data: list[Union[READMEIntegritySHA, READMERawContent]]
+    ) -> bytearray:
+        """
+        Serializes the payload of the commit (in JSON), which is reused for every attempt.
+
+        Notes:
+            The README is encoded to Base64 by chunks, straight into a buffer that was allocated for the whole payload.
+            This means the README (in Base64) is never held as a string, nor copied again by the JSON serializer.
+
+        Args:
+            data (list[Union[READMEIntegritySHA, READMERawContent]]): The SHA of the fetched README and the updated README in raw bytes, given in `exec_api_actions()`.
+
+        Returns:
+            bytearray: The payload of the commit, in JSON.
+        """
+
+        readme_ctx: memoryview = memoryview(data[1])
+        commit_payload: COMMIT_REQUEST_PAYLOAD = {
+            "message": self.envs["COMMIT_MESSAGE"],
+            "sha": READMEIntegritySHA(str(data[0])),
+            "committer": {
+                "name": "Discord Activity Badge",
+                "email": "discord_activity@discord_bot.com",
+            },
+            "content": READMEContent(""),  # ! This should be the last key, since the README is written in between its quotes.
+        }
+
+        # The content is the last empty string of the payload, because the other empty strings (if there's any) are placed before it.
+        payload_head, payload_tail = (
+            json_dumps(commit_payload).encode("utf-8").rsplit(b'""', 1)
+        )
+        payload_head += b'"'
+        payload_tail = b'"' + payload_tail
+
+        payload: bytearray = bytearray(
+            len(payload_head) + -(-len(readme_ctx) // 3) * 4 + len(payload_tail)
+        )
+        payload[: len(payload_head)] = payload_head
+        offset: int = len(payload_head)
+
+        for chunk_start in range(0, len(readme_ctx), GITHUB_API_PAYLOAD_CHUNK_SIZE):
+            encoded_chunk: bytes = b2a_base64(
+                readme_ctx[chunk_start : chunk_start + GITHUB_API_PAYLOAD_CHUNK_SIZE],
+                newline=False,
+            )
+            payload[offset : offset + len(encoded_chunk)] = encoded_chunk
+            offset += len(encoded_chunk)
+
+        payload[offset:] = payload_tail
+        return payload
+
+    def _classify_response(
+        self, http_request: ClientResponse, response_body: bytes
+    ) -> GithubResponseClass:
+        """
+        Classifies the response from Github API so that the receiver knows whether the request should be retried or not.
+
+        Notes:
+            Github answers with 403 on both the rate limits and the missing permissions, so they are told apart by the headers and the message.
+
+        Args:
+            http_request (ClientResponse): The response from `_request()`.
+            response_body (bytes): The body of the response, which was already read.
+
+        Returns:
+            GithubResponseClass: The class of the response.
+        """
+
+        if http_request.ok:
+            return GithubResponseClass.SUCCESS
+
+        if http_request.status >= 500:
+            return GithubResponseClass.TRANSIENT
+
+        if http_request.status == 409:
+            return GithubResponseClass.CONFLICT
+
+        if http_request.status == 429 or (
+            http_request.status == 403
+            and (
+                "Retry-After" in http_request.headers
+                or http_request.headers.get("X-RateLimit-Remaining") == "0"
+                or b"rate limit" in response_body.lower()
+            )
+        ):
+            return GithubResponseClass.RATE_LIMITED
+
+        return GithubResponseClass.FATAL
+
+    def _get_backoff_delay(self, attempt: int) -> float:
+        """
+        Computes the delay before the next retry, with bounded exponential backoff and full jitter so that concurrent retries (such as the tenants) are spread out.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting from 0.
+
+        Returns:
+            float: The delay (in seconds) before the next retry.
+        """
+
+        return uniform(
+            0, min(GITHUB_API_RETRY_MAX_DELAY, GITHUB_API_RETRY_BASE_DELAY * 2**attempt)
+        )
+
+    def _get_rate_limit_delay(
+        self, http_request: ClientResponse, attempt: int
+    ) -> float:
+        """
+        Computes the delay before the next retry of a rate-limited request, which respects `Retry-After` and `X-RateLimit-Reset` over the backoff.
+
+        Args:
+            http_request (ClientResponse): The rate-limited response.
+            attempt (int): The number of the failed attempt, starting from 0.
+
+        Returns:
+            float: The delay (in seconds) before the next retry. This can be beyond the deadline, which means the request should not be retried.
+        """
+
+        try:
+            if "Retry-After" in http_request.headers:
+                return float(http_request.headers["Retry-After"])
+
+            # * The primary rate limit is only lifted once the window has been reset, which is given in epoch seconds.
+            if http_request.headers.get("X-RateLimit-Remaining") == "0":
+                return max(
+                    0.0, float(http_request.headers["X-RateLimit-Reset"]) - time()
+                ) + self._get_backoff_delay(0)
+
+        except (KeyError, ValueError):
+            pass
+
+        return max(
+            GITHUB_API_SECONDARY_RATE_LIMIT_DELAY, self._get_backoff_delay(attempt)
+        )
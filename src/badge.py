@@ -14,184 +14,495 @@ see the license for the specific language governing permissions and
 limitations under the license.
 """
 
-from asyncio import Task, create_task, wait
-from base64 import b64decode, b64encode
-from datetime import datetime, timedelta
+from asyncio import FIRST_COMPLETED, Event, Task, create_task, gather, wait
+from functools import cached_property
+from hashlib import sha1
+from json import dump as json_dump
+from json import dumps as json_dumps
+from json import load as json_load
 from logging import Logger
-from os import _exit as terminate
-from re import Match, Pattern
+from os import makedirs, path
+from re import Match
 from re import compile as RE_COMPILE
-from typing import Any, Callable, Optional, Union
-from urllib.parse import quote
+from re import escape as re_escape
+from time import time
+from typing import Any, Callable, Collection, Optional, Union
 
 from elements.constants import (
-    BADGE_BASE_MARKDOWN,
-    BADGE_BASE_SUBJECT,
-    BADGE_BASE_URL,
-    BADGE_ICON,
-    BADGE_NO_COLOR_DEFAULT,
-    BADGE_REDIRECT_BASE_DOMAIN,
-    BADGE_REGEX_STRUCT_IDENTIFIER,
-    DISCORD_USER_STRUCT,
-    TIME_STRINGS,
-    Base64Actions,
-    ContextOnSubject,
-    ExitReturnCodes,
+    BADGE_LOCATION_STRUCT,
+    BADGE_LOCATOR_ANY_IDENTIFIER,
+    BADGE_LOCATOR_PATTERN,
+    BADGE_RENDER_MEMO_SIZE,
+    PUBLISHED_BADGES_DIRECTORY,
+    PUBLISHED_BADGES_STRUCT,
+    STAGE_RESULT_STRUCT,
+    GithubRunnerActions,
     GithubRunnerLevelMessages,
-    PreferredActivityDisplay,
-    PreferredTimeDisplay,
+    RunnerStages,
+    StageStatus,
 )
-from elements.typing import (
-    ActivityDictName,
-    BadgeElements,
-    BadgeStructure,
-    Base64Bytes,
-    Base64String,
-    ColorHEX,
-    HttpsURL,
-    READMEContent,
+from elements.exceptions import (
+    BadgeConstructionError,
+    DiscordClientExitedError,
+    GithubAPIConflictError,
 )
+from elements.typing import BadgeStructure, READMERawContent
+from presence import ActivitySnapshot, PresenceSnapshot
+from render import BadgeRenderMemo, BadgeRenderPlan
+from scheduler import StageScheduler
 
 
 class BadgeConstructor:
     # * The following variables are declared for weak reference since there's no hint-typing inheritance.
 
+    _api_budget: Any
     args: Any
-    badge_task: Task
+    badge_definitions: list[Any]
     discord_client_task: Task
     envs: Any
+    exec_api_actions: Callable
+    get_blob_sha: Callable
+    get_state_path: Callable
+    get_user_repo: Callable
     logger: Logger
+    presence_ready: Event
     print_exception: Callable
-    user_ctx: DISCORD_USER_STRUCT
+    user_ctx: PresenceSnapshot
+
+    # The last published badge/s of this instance, which are kept for the next update cycles (such as on daemon mode).
+    _published_badges: Optional[PUBLISHED_BADGES_STRUCT] = None
 
     # A child class that contains the logic for badge construction with respect to a variety of options for displaying a badge.
-    # This class also handles decoding and encoding of Base64 README since its the one who modifies the badge.
+    # This class also handles the README (in raw bytes) since its the one who modifies the badge.
 
-    async def _handle_b64(
-        self,
-        action: Base64Actions,
-        ctx_inout: Union[Base64String, READMEContent],
-    ) -> Base64Bytes:
+    async def update_readme_badge(
+        self, stages: Optional[StageScheduler] = None
+    ) -> dict[RunnerStages, STAGE_RESULT_STRUCT]:
         """
-        A private child class that handles README content by decoding and encoding it, to be stored in the memory buffer.
+        Fetches the README, constructs the badge and commits the changes (if there's any), declared as stages to run concurrently whenever possible.
+        Used once on a normal run, for every presence change on daemon mode, and for every tenant on batch mode.
 
         Args:
-            action (Base64Actions): The action that this method will perform. Choices are DECODE_B64_TO_BUFFER and ENCODE_BUFFER_TO_B64.
-            ctx_inout (READMEContent): A variable that holds the data both for decoding and encoding.
+            stages (Optional[StageScheduler], optional): The scheduler to declare the stages to, so that the results can be merged with other stages. Defaults to a new scheduler.
 
         Returns:
-            Base64Bytes: Both actions returns Base64 in bytes respectively. This was done to give other methods more options on how they want to handle the data.
+            dict[RunnerStages, STAGE_RESULT_STRUCT]: The result of every stage.
         """
 
-        if ctx_inout is Base64String(str(ctx_inout)):
-            if action is Base64Actions.DECODE_B64_TO_BUFFER:
-                self.logger.info(
-                    "Conversion from Base64 (String) to Readable README Markdown Format is done and is loaded into the memory!"
+        if stages is None:
+            stages = StageScheduler(self.logger)
+
+        # * The last published badge/s are kept from the last cycle, and are only trusted from the disk when STATE_DIRECTORY is declared.
+        published_badges: Optional[
+            PUBLISHED_BADGES_STRUCT
+        ] = self._published_badges or (
+            self._load_published_badges() if self.envs["STATE_DIRECTORY"] else None
+        )
+
+        async def commit_stage(
+            readme_data: list[Any],
+            constructed_badges: dict[str, BadgeStructure],
+            readme_update: READMERawContent,
+        ) -> bool:
+            # Returns True whenever the changes were pushed through.
+            if not self.readme_has_changes:
+                # The README already contains the badge/s, which is as good as publishing them.
+                self._save_published_badges(constructed_badges, readme_data[0])
+
+                return False
+
+            if getattr(self.args, "do_not_commit") or self.envs["IS_DRY_RUN"]:
+                self.logger.warning(
+                    "Argument -dnc / --do-not-commit was invoked, will skip updating README."
+                )
+                return False
+
+            # ! Commits that only change the elapsed time are the first to go once the rate limit is spent faster than it resets.
+            if (
+                self.readme_has_minor_changes
+                and not self._api_budget.can_afford_low_value()
+            ):
+                self.logger.warning(
+                    "Only the elapsed time of the badge/s has changed, and the rate limit is running low for the time left before it resets. Skipping the commit to save the rate limit for the next changes."
+                )
+                return False
+
+            try:
+                await self.exec_api_actions(
+                    GithubRunnerActions.COMMIT_CHANGES,
+                    data=[readme_data[0], readme_update],
                 )
 
-                return Base64Bytes(b64decode(ctx_inout))
+            # * The README was changed while the badge/s were being constructed. The badge/s are spliced to the recent README and committed once more.
+            # ! A second conflict is left to fail the stage, since the README is most likely being changed for the rest of the run.
+            except GithubAPIConflictError as e:
+                self.logger.warning(
+                    f"README has been changed while the badge/s were being constructed. Fetching the README again to retry the commit once... | Info: {e}"
+                )
+
+                readme_data = await self.exec_api_actions(
+                    GithubRunnerActions.FETCH_README
+                )
+                readme_update = await self.check_and_update_badge(
+                    readme_data[1], constructed_badges, published_badges
+                )
+
+                if not self.readme_has_changes:
+                    self._save_published_badges(constructed_badges, readme_data[0])
+
+                    return False
+
+                await self.exec_api_actions(
+                    GithubRunnerActions.COMMIT_CHANGES,
+                    data=[readme_data[0], readme_update],
+                )
+
+            self._save_published_badges(
+                constructed_badges, self.get_blob_sha(readme_update)
+            )
+
+            return True
+
+        stages.add_stage(RunnerStages.GATEWAY_READY, self._wait_for_presence)
+        stages.add_stage(
+            RunnerStages.BADGE_BUILD,
+            lambda _: self.construct_badges(),
+            depends_on=(RunnerStages.GATEWAY_READY,),
+        )
 
-            if action is Base64Actions.ENCODE_BUFFER_TO_B64:
+        # ! When the badge/s were published before, the README is only fetched once the badge/s are known to be different from the last published.
+        # * Otherwise, the README is fetched while waiting for the presence, since it's most likely needed.
+        if published_badges is not None:
+            await stages.run()
+
+            if (
+                stages.results[RunnerStages.BADGE_BUILD]["status"] is StageStatus.DONE
+                and stages.results[RunnerStages.BADGE_BUILD]["result"]
+                == published_badges["badges"]
+            ):
                 self.logger.info(
-                    "Conversion from README Readable Raw Content to a Base64 (Bytes) is done and is loaded into the variable for committing changes!"
+                    "The badge/s are the same as the last published badge/s%s. Skipping the README fetch and the commit."
+                    % (
+                        ""
+                        if self._get_presence_digest()
+                        == published_badges.get("presence_digest")
+                        else ", even though the presence has changed"
+                    )
                 )
-                return Base64Bytes(b64encode(bytes(str(ctx_inout), encoding="utf-8")))
+                self.readme_has_changes = False
+                return stages.results
+
+        stages.add_stage(
+            RunnerStages.README_FETCH,
+            lambda: self.exec_api_actions(GithubRunnerActions.FETCH_README),
+        )  # * Fetch README (expects READMERawContent from result()), which has nothing to do with the Discord Client.
+        stages.add_stage(
+            RunnerStages.BADGE_DIFF,
+            lambda readme_data, constructed_badges: self.check_and_update_badge(
+                readme_data[1], constructed_badges, published_badges
+            ),
+            depends_on=(RunnerStages.README_FETCH, RunnerStages.BADGE_BUILD),
+        )
+        stages.add_stage(
+            RunnerStages.COMMIT,
+            commit_stage,
+            depends_on=(
+                RunnerStages.README_FETCH,
+                RunnerStages.BADGE_BUILD,
+                RunnerStages.BADGE_DIFF,
+            ),
+        )
 
-            msg: str = f"Passed `action` parameter is not a {Base64Actions}! Please contact the developer if this issue occured in Online Runner."
-            self.logger.critical(msg)
+        return await stages.run()
 
-            self.print_exception(GithubRunnerLevelMessages.ERROR, msg, None)
-            terminate(ExitReturnCodes.ILLEGAL_CONDITION_EXIT)
+    async def _wait_for_presence(self) -> None:
+        """
+        Waits until the presence is ready, or until the Discord Client has exited before that (such as from a bad token or a network failure).
 
-        else:
-            msg = f"The given value in `ctx_inout` parameter is not a {Base64String.__name__}! Please contact the developer about this issue."
-            self.logger.error(msg)
+        Raises:
+            DiscordClientExitedError: When the Discord Client has exited before the presence was ready. The exception of the client is chained, if there's any.
+        """
+
+        if self.presence_ready.is_set():
+            return
 
-            self.print_exception(GithubRunnerLevelMessages.ERROR, msg, None)
-            terminate(ExitReturnCodes.ILLEGAL_CONDITION_EXIT)
+        presence_waiter: Task = create_task(
+            self.presence_ready.wait(), name="DiscordClient_PresenceWaiter"
+        )
 
-    async def check_and_update_badge(self, readme_ctx: Base64String) -> Base64Bytes:
+        try:
+            await wait(
+                {presence_waiter, self.discord_client_task},
+                return_when=FIRST_COMPLETED,
+            )
+
+        finally:
+            presence_waiter.cancel()
+
+        # ! The client closes itself once the presence is ready (unless it's on daemon mode), which means both may be done by now.
+        if self.presence_ready.is_set():
+            return
+
+        client_exception: Optional[BaseException] = (
+            None
+            if self.discord_client_task.cancelled()
+            else self.discord_client_task.exception()
+        )
+
+        raise DiscordClientExitedError(
+            "Discord client exited before presence was ready."
+            + (f" | Info: {client_exception}" if client_exception is not None else "")
+        ) from client_exception
+
+    def _get_presence_digest(self) -> str:
+        """
+        Returns:
+            str: The SHA-1 of the presence (`user_ctx`), which tells whether the presence has changed since the badge/s were last published.
         """
-        A method that checks the badge inside of README and updates it if possible.
 
-        Args:
-            readme_ctx (Base64String): The content of README to be decoded, this expects a Base64 in string form, not in bytes!
+        return sha1(
+            json_dumps(self.user_ctx.astuple(), default=str).encode("utf-8")
+        ).hexdigest()
 
+    def _get_signature_digests(self) -> dict[str, str]:
+        """
         Returns:
-            Base64Bytes: This returns a Base64 in bytes since the changes has been reflected and is encoded by `_handle_b64()`
+            dict[str, str]: The SHA-1 of the signature (without the time) of every badge, keyed by their identifier. See `BadgeRenderPlan.get_signature()`.
         """
 
-        self.logger.info("Converting README to a Readable Format...")
-        readme_decode: Task[Base64Bytes] = create_task(
-            self._handle_b64(Base64Actions.DECODE_B64_TO_BUFFER, readme_ctx),
-            name="READMEContents_Decode",
+        return {
+            each_definition.envs["BADGE_IDENTIFIER_NAME"]: sha1(
+                json_dumps(
+                    each_definition.render_plan.get_signature(
+                        self.user_ctx, include_time=False
+                    ),
+                    default=str,
+                ).encode("utf-8")
+            ).hexdigest()
+            for each_definition in self.badge_definitions
+        }
+
+    def _get_published_badges_path(self) -> str:
+        return (
+            self.get_state_path(PUBLISHED_BADGES_DIRECTORY, self.get_user_repo())
+            + ".json"
         )
 
-        self._re_pattern: Pattern = RE_COMPILE(BADGE_REGEX_STRUCT_IDENTIFIER)
-        self.logger.debug(
-            f"RegularExpression for Badge Identification in README was compiled successfully. | Pattern: {self._re_pattern}"
-        )
+    def _load_published_badges(self) -> Optional[PUBLISHED_BADGES_STRUCT]:
+        """
+        Loads the badge/s that were last published to the README, from STATE_DIRECTORY.
 
-        await wait([readme_decode])
+        Returns:
+            Optional[PUBLISHED_BADGES_STRUCT]: The last published badge/s, or None when they don't exist or are unreadable.
+        """
 
         try:
-            self.logger.info("Attempting to identify the badge inside README...")
+            with open(self._get_published_badges_path(), encoding="utf-8") as state_file:
+                published_badges: PUBLISHED_BADGES_STRUCT = json_load(state_file)
 
-            while True:
-                line_ctx: READMEContent = READMEContent(
-                    str(readme_decode.result(), "utf-8")
-                )
-                match: Optional[Match[Any]] = self._re_pattern.search(line_ctx)
+            # ! Records from other versions may lack some of the keys.
+            if not isinstance(published_badges.get("badges"), dict):
+                raise ValueError("The record does not contain the badge/s.")
 
-                self.logger.debug(
-                    f"re.Search Result: {match}"
-                )  # todo: Check if duplicating the badge would affect the other badge as well. This should be only one-to-one.
+        except FileNotFoundError:
+            return None
 
-                identifier_name: str = (
-                    match.group("badge_identifier") if match else None
-                )
-                is_badge_identified: bool = (
-                    identifier_name == self.envs["BADGE_IDENTIFIER_NAME"]
-                )
+        except (OSError, ValueError, AttributeError) as e:
+            self.logger.warning(
+                f"The last published badge/s cannot be loaded. The README will be fetched instead. | Info: {e}"
+            )
+            return None
+
+        return published_badges
+
+    def _save_published_badges(
+        self, constructed_badges: dict[str, BadgeStructure], readme_sha: str
+    ) -> None:
+        """
+        Records the badge/s that the README contains, so that the next cycle (and the next run, under STATE_DIRECTORY) can skip Github when the badge/s did not change.
+        Failing to write the record only loses it for the next run.
+
+        Args:
+            constructed_badges (dict[str, BadgeStructure]): The badges from `construct_badges()`.
+            readme_sha (str): The git blob SHA-1 of the README that contains the badge/s.
+        """
+
+        published_badges: PUBLISHED_BADGES_STRUCT = {
+            "badges": constructed_badges,  # type: ignore
+            "sha": readme_sha,
+            "presence_digest": self._get_presence_digest(),
+            "signature_digests": self._get_signature_digests(),
+            "published_at": time(),
+        }
+        self._published_badges = published_badges
+
+        if not self.envs["STATE_DIRECTORY"]:
+            return
+
+        state_path: str = self._get_published_badges_path()
+
+        try:
+            makedirs(path.dirname(state_path), exist_ok=True)
+
+            with open(state_path, "w", encoding="utf-8") as state_file:
+                json_dump(published_badges, state_file)
+
+        except OSError as e:
+            self.logger.warning(
+                f"The published badge/s cannot be recorded, the next run will fetch the README. | Info: {e}"
+            )
+
+    @cached_property
+    def render_plan(self) -> BadgeRenderPlan:
+        """
+        Returns:
+            BadgeRenderPlan: The options of the badge compiled from `envs`, which is compiled once on the first render.
+        """
+
+        return BadgeRenderPlan(self.envs)
+
+    @cached_property
+    def render_memo(self) -> BadgeRenderMemo:
+        """
+        Returns:
+            BadgeRenderMemo: The badges that were rendered from `render_plan`, which is only useful for the runs that render more than once (such as daemon mode).
+        """
+
+        return BadgeRenderMemo(self.render_plan, BADGE_RENDER_MEMO_SIZE)
+
+    async def construct_badges(self) -> dict[str, BadgeStructure]:
+        """
+        Constructs the badge of every definition (from `BADGE_DEFINITIONS`, or this instance alone) concurrently, from the same presence.
+
+        Returns:
+            dict[str, BadgeStructure]: The constructed badges, keyed by their identifier and ordered by their definition.
+        """
+
+        constructed_badges: list[BadgeStructure] = await gather(
+            *(
+                each_definition.construct_badge()
+                for each_definition in self.badge_definitions
+            )
+        )
+
+        return {
+            each_definition.envs["BADGE_IDENTIFIER_NAME"]: each_badge
+            for each_definition, each_badge in zip(
+                self.badge_definitions, constructed_badges
+            )
+        }
+
+    async def check_and_update_badge(
+        self,
+        readme_ctx: READMERawContent,
+        constructed_badges: dict[str, BadgeStructure],
+        published_badges: Optional[PUBLISHED_BADGES_STRUCT] = None,
+    ) -> READMERawContent:
+        """
+        A method that checks the badges inside of README and updates them if possible.
+
+        Args:
+            readme_ctx (READMERawContent): The content of README in raw bytes, straight from `exec_api_actions()`.
+            constructed_badges (dict[str, BadgeStructure]): The badges from `construct_badges()` to replace or to append in the README.
+            published_badges (Optional[PUBLISHED_BADGES_STRUCT], optional): The last published badge/s, which tells whether the changes are minor. Defaults to None.
+
+        Returns:
+            READMERawContent: The content of README in raw bytes, with the changes reflected. This is only encoded to Base64 once it gets committed.
+        """
 
+        self.logger.info("Attempting to identify the badge/s inside README...")
+
+        located_badges: dict[str, BADGE_LOCATION_STRUCT] = self._locate_badges(
+            readme_ctx, constructed_badges.keys()
+        )
+        badge_splices: list[tuple[int, int, bytes]] = []  # (start, end, badge_update)
+        missing_badges: list[bytes] = []
+        has_changes: bool = False
+        has_major_changes: bool = False
+
+        # * The signatures are compared instead of the badges, since the time is not the only part of the badge that may consist of numbers.
+        published_signature_digests: dict[str, str] = (
+            (published_badges.get("signature_digests") or {})
+            if published_badges is not None
+            else {}
+        )
+        signature_digests: dict[str, str] = (
+            self._get_signature_digests() if published_signature_digests else {}
+        )
+
+        # * The badges are compared (and later spliced) by the order of their location, so that the README is only copied once.
+        for badge_identifier, badge_ctx in sorted(
+            constructed_badges.items(),
+            key=lambda each_badge: located_badges.get(
+                each_badge[0], {"start": -1, "end": -1}
+            )["start"],
+        ):
+            if badge_identifier in located_badges:
                 self.logger.info(
-                    (
-                        f"Badge with Identifier {identifier_name} found! Substituting the old badge."
+                    f"Badge with Identifier {badge_identifier} found! Substituting the old badge."
+                )
+
+                badge_location: BADGE_LOCATION_STRUCT = located_badges[
+                    badge_identifier
+                ]
+                badge_update: bytes = badge_ctx.encode("utf-8")
+                badge_outdated: bytes = readme_ctx[
+                    badge_location["start"] : badge_location["end"]
+                ]
+
+                # ! A change is only considered minor when the README still contains the last published badge, and the signature (without the time) is the same as it was.
+                # Without a record of the last published badge/s, every change is considered major.
+                if badge_update != badge_outdated:
+                    has_changes = True
+                    has_major_changes |= not (
+                        published_badges is not None
+                        and published_badges["badges"]
+                        .get(badge_identifier, "")
+                        .encode("utf-8")
+                        == badge_outdated
+                        and badge_identifier in published_signature_digests
+                        and published_signature_digests[badge_identifier]
+                        == signature_digests.get(badge_identifier)
                     )
-                    if self.envs["BADGE_IDENTIFIER_NAME"] == identifier_name
-                    else "Badge with Identifier (%s) not found! New badge will append on the top of the contents of README.md. Please arrange/move the badge once changes has been pushed!"
-                    % self.envs["BADGE_IDENTIFIER_NAME"]
+
+                badge_splices.append(
+                    (badge_location["start"], badge_location["end"], badge_update)
                 )
 
+            else:
                 self.logger.info(
-                    "Awaiting for the badge construction task to finish..."
+                    "Badge with Identifier (%s) not found! New badge will append on the top of the contents of README.md. Please arrange/move the badge once changes has been pushed!"
+                    % badge_identifier
                 )
-                await wait([self.badge_task])
+                missing_badges.append(badge_ctx.encode("utf-8"))
 
-                constructed_badge: BadgeStructure = self.badge_task.result()
-
-                print("Constructed? > ", constructed_badge)
+        # ! Only the badges were compared, which means the README is only copied when one of them has changed.
+        # * This is evaluated for every call (instead of invoking `do_not_commit`) since daemon mode calls this method more than once.
+        self.readme_has_changes: bool = has_changes or bool(missing_badges)
+        self.readme_has_minor_changes: bool = has_changes and not (
+            has_major_changes or missing_badges
+        )
 
-                if match and is_badge_identified:
-                    line_ctx = READMEContent(
-                        line_ctx.replace(match.group(0), constructed_badge)
-                    )
-                else:
-                    line_ctx = READMEContent(f"{constructed_badge}\n\n{line_ctx}")
+        readme_update: READMERawContent = readme_ctx
 
-                break
+        if self.readme_has_changes:
+            # The missing badges are placed on top, in the same order as they were defined.
+            readme_parts: list[Union[bytes, memoryview]] = (
+                [b"\n\n".join(missing_badges) + b"\n\n"] if missing_badges else []
+            )
+            last_offset: int = 0
 
-        except IndexError as e:
-            msg: str = f"The RegEx can't find any badge with Identifier in README. If you think that this is a bug then please let the developer know. | Info: {e} at line {e.__traceback__.tb_lineno}."  # type: ignore
-            self.logger.warning(msg)
+            # * The parts in between the badges are referred (not copied) from the README, which means it is only copied once by the join.
+            readme_view: memoryview = memoryview(readme_ctx)
 
-            self.print_exception(GithubRunnerLevelMessages.WARNING, msg, e)
+            for badge_start, badge_end, badge_update in badge_splices:
+                readme_parts += (readme_view[last_offset:badge_start], badge_update)
+                last_offset = badge_end
 
-        readme_encode: Base64Bytes = await self._handle_b64(
-            Base64Actions.ENCODE_BUFFER_TO_B64, line_ctx
-        )
+            readme_parts.append(readme_view[last_offset:])
+            readme_update = READMERawContent(b"".join(readme_parts))
 
-        if readme_encode != bytes(readme_ctx, "utf-8"):
+        if self.readme_has_changes:
             self.logger.info(
                 "There are content changes with the recent README. Allowing to reflect changes!"
             )
@@ -201,9 +512,62 @@ class BadgeConstructor:
             self.logger.warning(msg)
             self.print_exception(GithubRunnerLevelMessages.WARNING, msg, None)
 
-            setattr(self.args, "do_not_commit", True)
+        return readme_update
+
+    def _locate_badges(
+        self,
+        readme_ctx: READMERawContent,
+        badge_identifiers: Optional[Collection[str]] = None,
+    ) -> dict[str, BADGE_LOCATION_STRUCT]:
+        """
+        Locates the badges ([![<badge_identifier>](<badge_url>)](<redirect_url>)) of the README, along with their offsets (in bytes).
+
+        Notes:
+            The badges are matched by BADGE_LOCATOR_PATTERN, which takes linear time even on near-miss input. When the identifiers are given,
+            the pattern is made for each of them instead, which lets the regex skip to the candidates of that identifier alone.
+            A badge can't span multiple lines (nor contain `[`), and only the first badge of each identifier is located.
+
+        Args:
+            readme_ctx (READMERawContent): The content of README in raw bytes.
+            badge_identifiers (Optional[Collection[str]], optional): The identifiers of the badges to locate. Defaults to every badge.
+
+        Returns:
+            dict[str, BADGE_LOCATION_STRUCT]: The location of every badge (that was found), keyed by their identifier.
+        """
+
+        located_badges: dict[str, BADGE_LOCATION_STRUCT] = {}
+
+        if badge_identifiers is None:
+            for badge_match in RE_COMPILE(
+                BADGE_LOCATOR_PATTERN % BADGE_LOCATOR_ANY_IDENTIFIER
+            ).finditer(readme_ctx):
+                located_badges.setdefault(
+                    badge_match.group(1).decode("utf-8", "replace"),
+                    {"start": badge_match.start(), "end": badge_match.end()},
+                )
+
+            return located_badges
+
+        for badge_identifier in badge_identifiers:
+            encoded_identifier: bytes = badge_identifier.encode("utf-8")
+
+            # ! Identifiers that contain these can't be part of a badge, and therefore can't be located.
+            if any(
+                each_char in encoded_identifier for each_char in (b"[", b"]", b"\n")
+            ):
+                continue
+
+            badge_match: Optional[Match[bytes]] = RE_COMPILE(
+                BADGE_LOCATOR_PATTERN % re_escape(encoded_identifier)
+            ).search(readme_ctx)
+
+            if badge_match is not None:
+                located_badges[badge_identifier] = {
+                    "start": badge_match.start(),
+                    "end": badge_match.end(),
+                }
 
-        return readme_encode
+        return located_badges
 
     async def construct_badge(self) -> BadgeStructure:
         """
@@ -218,7 +582,7 @@ class BadgeConstructor:
             - badge_url: The badge URL that is rendered in Markdown (README).
             - redirect_url: The url to redirect when the badge is clicked.
 
-        ! The badge itself should be recognizable by RegEx declared in elements/constants.py (BADGE_REGEX_STRUCT_IDENTIFIER)
+        ! The badge itself should be recognizable by `_locate_badges()`, which means the badge should be written in one line.
 
         There are two parts that makes up the whole structure:
             - Subject
@@ -245,414 +609,49 @@ class BadgeConstructor:
         Conditions for redirect_url:
             - The output of this would probably be the repository of the special repository or anything else.
 
-        """
+        Raises:
+            BadgeConstructionError: When the badge cannot be constructed from the environment (KeyError) or cannot be serialized (TypeError).
 
-        # * These variables shouldn't be de-alloc'd until we finish the whole method, not just from the try-except scope.
-        subject_output: Union[BadgeStructure, BadgeElements] = BadgeStructure("")
-        status_output: Union[BadgeStructure, BadgeElements] = BadgeStructure("")
-        picked_activity: ActivityDictName = ActivityDictName(
-            ""
-        )  # This inherits to preferred_activity but also used when the preferred_activity does not exist.
-        is_preferred_exists: bool = False  # This boolean contains true whenever the user's choice of activity to display exists.
+        """
 
+        # ! The options of the badge are compiled once (see `render_plan`), which leaves the parts that depend on the presence to be rendered here.
         try:
-            redirect_url: HttpsURL = BADGE_REDIRECT_BASE_DOMAIN + (
-                self.envs["URL_TO_REDIRECT_ON_CLICK"]
-                if self.envs["URL_TO_REDIRECT_ON_CLICK"]
-                else "{0}/{0}".format(self.envs["GITHUB_ACTOR"])
-            )  # Let's handle the redirect url while we wait for Discord Client Task to finish.
-
-            self.logger.info(
-                "Other non-important elements loaded, waiting for the Discord Client Task to finish before continuing..."
-            )
-            await wait([self.discord_client_task])
             self.logger.info("Discord Client Task is done. Processing the badge...")
 
-            presence_ctx: dict[str, Any] = self.user_ctx[
-                "activities"
-            ]  # * Append any activities here, if there's one. We assert that this variable will represent as dict even when len() is equal to 0.
-
-            contains_activities: bool = bool(
-                len(presence_ctx)
-            )  # To prevent other part of the code to call the method for bool evaluation, lets point to this variable for reference.
-
-            if contains_activities:  # Does presence_ctx contains something?
-
-                # If that's the case, then check for `PREFERRED_ACTIVITY_TO_DISPLAY` inside presence_ctx (dict).
-
-                # Since we cannot do key-to-value lookup, let's iterate through `Enums` instead.
-                for each_cls in PreferredActivityDisplay:
-                    if self.envs["PREFERRED_ACTIVITY_TO_DISPLAY"] is each_cls:
-                        if presence_ctx.get(each_cls.name) is not None:
-                            picked_activity = ActivityDictName(each_cls.name)
-                            is_preferred_exists = True
-                            break
-
-                # If we fail to lookup the preferred activity, then perform exporting keys and convert them to a list to use the first activity (if there's any).
-                if not is_preferred_exists:
-                    picked_activity = ActivityDictName(list(presence_ctx.keys())[0])
+            picked_activity: Optional[
+                ActivitySnapshot
+            ] = self.render_plan.pick_activity(self.user_ctx)
 
+            if picked_activity is not None:
                 self.logger.info(
                     f"Preferred Activity %s %s"
                     % (
                         self.envs["PREFERRED_ACTIVITY_TO_DISPLAY"],
                         "exists!"
-                        if is_preferred_exists
-                        else f"does not exists. Using other activity such as {picked_activity}.",
+                        if picked_activity.kind == self.render_plan.preferred_activity
+                        else f"does not exists. Using other activity such as {picked_activity.kind}.",
                     )
                 )
 
             else:
-
                 msg: str = "There's no activity detected by the time it was fetched!"
                 self.logger.warning(msg)
 
                 self.print_exception(GithubRunnerLevelMessages.WARNING, msg, None)
 
-            # # Badge Construction
-            # ! Keep in mind that every string manipulation is inlined and that's because I don't want to make things longer. I hope the formatter compensate this.
-
-            # This is a component of subject_output. Check if we should append User's State instead of Activity State in the Subject.
-            state_string = "%s_STRING" % (
-                picked_activity
-                if picked_activity != PreferredActivityDisplay.CUSTOM_ACTIVITY.name # ! Special handle for CustomActivity.
-                else "%s_STATUS" % self.user_ctx["statuses"]["status"].name.upper()
-            )
-
-            # Are there an no activity present and STATIC_SUBJECT_STRING is empty? Then use `BADGE_BASE_SUBJECT`.
-            # Only if, STATIC_SUBJECT_STRING is not empty, otherwise, use the string concatenation performed in variable `state_string`.
-            subject_output = (
-                BADGE_BASE_SUBJECT
-                if not contains_activities
-                and self.envs["STATIC_SUBJECT_STRING"] is None
-                else (
-                    self.envs[
-                        state_string
-                        if self.envs["STATIC_SUBJECT_STRING"] is None
-                        else "STATIC_SUBJECT_STRING"
-                    ]
-                )
-            )
-
-            # When dealing with seperators, sometiemes we have to do some management for dealing with spaces.
-            # Display the default if `STATUS_CONTEXT_SEPERATOR` is empty, otherwise, add spacing for both ends along with the custom seperator.
-            seperator: BadgeElements = BadgeElements(
-                (
-                    ", "
-                    if self.envs["STATUS_CONTEXT_SEPERATOR"] is None
-                    else " %s " % self.envs["STATUS_CONTEXT_SEPERATOR"]
-                )
-                # ! This only works whenever there's an activity and PREFERRED_PRESENCE_CONTEXT or TIME_DISPLAY_OUTPUT is not disabled.
-                # * Otherwise, we don't have to output anything since there's no context to seperate.
-                if (
-                    self.envs["PREFERRED_PRESENCE_CONTEXT"]
-                    is not ContextOnSubject.CONTEXT_DISABLED
-                    or self.envs["TIME_DISPLAY_OUTPUT"]
-                    is not PreferredTimeDisplay.TIME_DISABLED
-                )
-                and picked_activity != PreferredActivityDisplay.CUSTOM_ACTIVITY.name # Supposedly have to check for any activity, but we have to be specific here instead.
-                else ""
-            )
-
-            # As we handle the seperator, we have to handle how we display the string in the status part of the badge.
-            status_output = BadgeStructure(
-                (  # * Appends Activity or User's State if `STATIC_SUBJECT_STRING` is not None, otherwise, use the STATIC_SUBJECT_STRING.
-                    "%s " % self.envs[state_string]
-                    if self.envs["STATIC_SUBJECT_STRING"] is not None
-                    else ""
-                )
-                + (
-                    (  # * Appends the User's State whenever presence_ctx is zero or otherwise, append the activity's application name.
-                        self.envs[
-                            "%s_STATUS_STRING"
-                            % self.user_ctx["statuses"]["status"].name.upper()
-                        ]
-                    )
-                    if not contains_activities
-                    else presence_ctx[picked_activity]["name" if picked_activity != PreferredActivityDisplay.CUSTOM_ACTIVITY.name else "state"]
-                )
-                + (  # Append the seperator. This one is a condition-hell since we have to consider two other values and the state of the badge.
-                    (
-                        seperator  # ! Seperator #1, This contains the `PREFERRED_PRESENCE_CONTEXT` of the activity, if available and its a RICH_PRESENCE.
-                        + (
-                            presence_ctx[picked_activity][
-                                "state"
-                                if self.envs["PREFERRED_PRESENCE_CONTEXT"]
-                                is ContextOnSubject.STATE
-                                else "details"
-                            ]
-                        )
-                    )
-                    if picked_activity == PreferredActivityDisplay.RICH_PRESENCE.name
-                    and self.envs["PREFERRED_PRESENCE_CONTEXT"]
-                    is not ContextOnSubject.CONTEXT_DISABLED  # Other activities is not included at this point since it only gives minimal info.
-                    else ""
-                )
-                + (  # Append the spotify current music if the picked_activity is SPOTIFY_ACTIVITY or else...
-                    seperator
-                    + (
-                        "{0} by {1}".format(
-                            presence_ctx[picked_activity]["details"],
-                            presence_ctx[picked_activity]["state"],
-                        )
-                        + (
-                            (
-                                " (%s)"
-                                % presence_ctx[picked_activity]["assets"]["large_text"]
-                            )
-                            if self.envs["SPOTIFY_INCLUDE_ALBUM_PLAYLIST_NAME"]
-                            else ""
-                        )
-                    )
-                    if picked_activity == PreferredActivityDisplay.SPOTIFY_ACTIVITY.name
-                    else seperator
-                    if self.envs["TIME_DISPLAY_OUTPUT"]
-                    is not PreferredTimeDisplay.TIME_DISABLED
-                    and contains_activities
-                    else ""  # Display the seperator instead.
-                )
-            )
-
-            # Since we handled the RICH_PRESENCE, now it's time for the `time` to be handled.
-            if (
-                self.envs["TIME_DISPLAY_OUTPUT"]
-                is not PreferredTimeDisplay.TIME_DISABLED
-                and contains_activities  # This handles all activities, no exemptions.
-            ):
-                # ! Seperator #2, Literally invoke the seperator since we assert that the time display is enabled.
-                # * Also, since this mf doesn't like '+=', let's do the manual with type.
-
-                # Since activities can display time remaining or elapsed, check the context if timestamps exists so that it can display `remaining` instead of `elapsed`.
-
-                contains_timestamps: Union[None, str] = presence_ctx[
-                    picked_activity
-                ].get("timestamps")
-
-                if contains_timestamps:
-                    has_remaining: Union[None, str] = presence_ctx[picked_activity][
-                        "timestamps"
-                    ].get("end")
-
-                    # At this point, we have calculate from the time the application or activity has been started. Note that the epoch given by discord is by milliseconds.
-                    start_time: datetime = datetime.fromtimestamp(
-                        int(presence_ctx[picked_activity]["timestamps"]["start"]) / 1000
-                    )
-                    running_time: timedelta = (
-                        datetime.now() - start_time
-                    )  # This one calculates the current time to be compatible for any operations with `start_time`.
-
-                    # Resolve the time display as it was detected with `timestamps`, thus identified as `remaining`.
-                    if has_remaining:
-                        end_time: timedelta = (
-                            datetime.fromtimestamp(int(has_remaining) / 1000)
-                            - start_time
-                        )
-
-                        # ! Keep note, that this one is for Unspecified Activity (Spotify) only!!!
-                        # * The development of that case will be on post-time, since I'm still doing most of the parts.
-                        # For that case, we don't need to sterilize it for a while.
-                        if (
-                            picked_activity
-                            == PreferredActivityDisplay.SPOTIFY_ACTIVITY.name
-                        ):
-                            running_time = running_time - timedelta(
-                                microseconds=running_time.microseconds
-                            )
-                            end_time = end_time - timedelta(
-                                microseconds=end_time.microseconds
-                            )
-
-                            status_output = BadgeStructure(
-                                status_output + f" | {running_time} of {end_time}"
-                            )
-
-                    # * Resolve for the case of `elapsed`.
-                    else:
-                        time_option: PreferredTimeDisplay = self.envs[
-                            "TIME_DISPLAY_OUTPUT"
-                        ]
-                        parsed_time: int = int(
-                            running_time.total_seconds()
-                            / (
-                                3600
-                                if time_option is PreferredTimeDisplay.HOURS
-                                else 60
-                                if time_option is PreferredTimeDisplay.MINUTES
-                                or time_option is PreferredTimeDisplay.HOURS_MINUTES
-                                else 1  # # PreferredTimeDsplay.SECONDS.
-                            )
-                        )
-
-                        hours = (
-                            parsed_time
-                            if parsed_time >= 1
-                            and time_option is PreferredTimeDisplay.HOURS
-                            else 0
-                        )
-                        minutes = (
-                            parsed_time
-                            if parsed_time >= 1
-                            and time_option is PreferredTimeDisplay.MINUTES
-                            else 0
-                        )
-                        seconds = (
-                            parsed_time
-                            if parsed_time >= 1
-                            and time_option is PreferredTimeDisplay.SECONDS
-                            else 0
-                        )
-
-                        # * Timedelta() only returns seconds and microseconds. Sadly we have to do the computation on our own.
-                        if time_option is PreferredTimeDisplay.HOURS_MINUTES:
-                            # On this case, calculate if there some minute that can still be converted to hours.
-                            while True:
-                                if parsed_time / 60 >= 1:
-                                    hours += 1
-                                    parsed_time -= 60
-                                    continue
-
-                                break
-
-                            minutes = parsed_time
-
-                        # ! Resolve time strings based on numbers. This costs us readibility.
-                        for idx, each_time_string in enumerate(TIME_STRINGS):
-                            if self.envs["TIME_DISPLAY_SHORTHAND"]:
-                                TIME_STRINGS[idx] = each_time_string[0]
-
-                            # * We have to handle if we should append suffix 's' if the value for each time is greater than 1 or not.
-                            else:
-                                TIME_STRINGS[idx] = (
-                                    each_time_string[:-1]
-                                    if locals()[f"{each_time_string}"] < 1
-                                    else each_time_string
-                                )
-
-                        self.logger.debug(
-                            f"Resolved Time Output: {hours} %s {minutes} %s {seconds} %s."
-                            % (TIME_STRINGS[0], TIME_STRINGS[1], TIME_STRINGS[2])
-                        )
-
-                        is_time_displayable: bool = (
-                            hours >= 1 or minutes >= 1 or seconds >= 1
-                        )
-
-                        # Once we identified some constraints and how it should look, combine it and have it as one string.
-                        status_output = BadgeElements(
-                            status_output
-                            + (
-                                (f"{hours} %s" % TIME_STRINGS[0] if hours >= 1 else "")
-                                + (" " if hours and minutes else "")
-                                + (
-                                    f"{minutes} %s" % TIME_STRINGS[1]
-                                    if minutes >= 1
-                                    else ""
-                                )
-                                + (  # Since we can't display them as it is, no need to handle for spacing.
-                                    f"{seconds} %s" % TIME_STRINGS[2]
-                                    if seconds >= 1
-                                    else ""
-                                )
-                                + (
-                                    f" %s"
-                                    % self.envs[
-                                        "TIME_DISPLAY_%s_OVERRIDE_STRING" % "ELAPSED"
-                                        if not has_remaining
-                                        else "REMAINING"
-                                    ]
-                                )
-                            )
-                            if is_time_displayable
-                            else "Just started."
-                        )
-
-                    self.logger.debug(
-                        f"Application is identified to be running with remaining time. And is currently under {running_time} / %s."
-                        % end_time
-                        if has_remaining
-                        else f"The application is running endless and has been opened for {running_time}."
-                    )
-
-            # ! These logger debug output will not be changed, since it shows every possible aspect to which leads to the output of the badge.
-            self.logger.debug(
-                f"Activity Context (Chosen or Preferred) > {picked_activity}"
-            )
-            self.logger.debug(
-                f"State Output > {state_string} | Subject Output > {subject_output}"
-            )
-            self.logger.debug(f"Status Output > {status_output}")
-            self.logger.debug(f"Final Output > {subject_output} | {status_output}")
-
-            # ! Since we are done with the construction of the output. It's time to manage the colors.
-            # * I know that state_string is similar to this case. But I want more control and its reasonable to re-implement it and that's because its main focus was to display a string.
-            status_color: ColorHEX = ColorHEX(
-                (
-                    self.envs[
-                        "%s_COLOR"
-                        % state_string.removesuffix(
-                            "_STRING"
-                        )  # Same logic as output (first modification) except we change the suffix from _STRING to _COLOR.
-                        + (
-                            ""
-                            if picked_activity
-                            == PreferredActivityDisplay.RICH_PRESENCE.name
-                            or contains_activities
-                            else ""
-                        )
-                    ]
-                )
-                if self.envs["STATIC_SUBJECT_STRING"] is not None or contains_activities
-                else BADGE_NO_COLOR_DEFAULT
-            )
-
-            # For now, the color only supports HEX which is something that I have to limit for sometime in the future since some logical color declaration is not supported by Badgen.
-            if status_color.startswith("#"):
-                status_color = ColorHEX(status_color[1:])
-
-            # subject_color logic was the same as similar to state_string + subject_output.
-            # Except that instead of focusing in the picked_activity, it was now considering any activity.
-            subject_color: ColorHEX = ColorHEX(
-                self.envs[
-                    "%s_COLOR"
-                    % (
-                        "%s_STATUS" % self.user_ctx["statuses"]["status"].name.upper()
-                        if contains_activities
-                        or self.envs["STATIC_SUBJECT_STRING"] is None
-                        else state_string.removesuffix("_STRING")
-                    )
-                ]
-            )
-
-            # For now, the color only supports HEX which is something that I have to limit for sometime in the future since some logical color declaration is not supported by Badgen.
-            if subject_color.startswith("#"):
-                subject_color = ColorHEX(subject_color[1:])
-
-            self.logger.debug(
-                f"Status Color: {status_color} | Subject Color: {subject_color}."
-            )
-
-            # Sometimes, user's want to display the colors other way around, so we gave them that option since it also looks cool if you think about it.
-            if self.envs["SHIFT_STATUS_ACTIVITY_COLORS"]:
-                status_color, subject_color = subject_color, status_color
-
-            # At this point, construct the badge as fully as it is.
-
             try:
-                constructed_url: BadgeStructure = BadgeStructure(
-                    f"{BADGE_BASE_URL}{quote(subject_output)}/{quote(status_output)}?color={subject_color}&labelColor={status_color}&icon={BADGE_ICON}"
-                )
-
-                # Store it in a variable for a while, so that we can output it when Logging Level Coverage considers DEBUG.
-                final_output: BadgeStructure = BadgeStructure(
-                    BADGE_BASE_MARKDOWN.format(
-                        self.envs["BADGE_IDENTIFIER_NAME"],
-                        constructed_url,
-                        redirect_url,
-                    )
-                )
+                # * Presences that only differ in what the badge doesn't display reuse the badge that was rendered before.
+                final_output: BadgeStructure
+                is_reused: bool
+                final_output, is_reused = self.render_memo.render(self.user_ctx)
 
                 self.logger.info(
-                    f"The Badge URL has been generated. Link: {final_output}"
+                    (
+                        "The presence has no visible changes since the badge was rendered, reusing the badge. Link: %s"
+                        if is_reused
+                        else "The Badge URL has been generated. Link: %s"
+                    )
+                    % final_output
                 )
 
                 return final_output
@@ -662,11 +661,12 @@ class BadgeConstructor:
                 self.logger.critical(msg)
 
                 self.print_exception(GithubRunnerLevelMessages.WARNING, msg, e)
-                terminate(ExitReturnCodes.ILLEGAL_CONDITION_EXIT)
+                raise BadgeConstructionError(msg) from e
 
+        # ! These are raised to the stage (which marks it as FAILED) instead of terminating, so that the failure is contained to this badge (or tenant).
         except KeyError as e:
-            msg: str = f"Environment Processing has encountered an error. Please let the developer know about the following. | Info: {e} at line {e.__traceback__.tb_lineno}."  # type: ignore
+            msg = f"Environment Processing has encountered an error. Please let the developer know about the following. | Info: {e} at line {e.__traceback__.tb_lineno}."  # type: ignore
             self.logger.error(msg)
 
             self.print_exception(GithubRunnerLevelMessages.ERROR, msg, e)
-            terminate(ExitReturnCodes.ILLEGAL_CONDITION_EXIT)
+            raise BadgeConstructionError(msg) from e
@@ -0,0 +1,148 @@
+"""
+Copyright 2021 Janrey "CodexLink" Licas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+	http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from asyncio import sleep
+from logging import Logger
+from random import uniform
+from time import perf_counter, time
+from typing import Any, Mapping, Optional
+
+from elements.constants import (
+    GITHUB_API_FETCH_RESERVED_CALLS,
+    GITHUB_API_RATE_LIMIT_WINDOW,
+    GITHUB_API_RETRY_BASE_DELAY,
+    GithubRunnerActions,
+)
+
+
+class GithubRateLimitBudget:
+    """
+    A tracker of the rate limit of one token, which is shared by every request made with it (such as the tenants on batch mode).
+
+    The budget is updated from the headers of every response, and the requests that are still in-flight are counted against it since their cost is not reflected yet.
+    Before every request, `acquire()` decides whether the request can be made right away or should wait for the reset. The fetch requires room for the commit after it,
+    which means the commits are prioritized over the fetches once the budget runs low. Low-value requests can check `can_afford_low_value()` to drop themselves instead.
+    """
+
+    def __init__(self, logger: Logger) -> None:
+        self.logger: Logger = logger
+
+        # * These are unknown until the first response, which means every request is allowed until then.
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: float = 0.0  # In epoch seconds.
+
+        self._in_flight: int = 0
+
+    @property
+    def available(self) -> Optional[int]:
+        """
+        Returns:
+            Optional[int]: The number of requests that can still be made before the reset, or None when it's unknown (or the window has been reset).
+        """
+
+        if self.remaining is None or time() >= self.reset_at:
+            return None
+
+        return self.remaining - self._in_flight
+
+    async def acquire(self, action: GithubRunnerActions, deadline: float) -> bool:
+        """
+        Waits until the request can be made without running the rate limit dry, and then counts the request as in-flight.
+
+        Args:
+            action (GithubRunnerActions): The action of the request.
+            deadline (float): The time (from `perf_counter()`) where the request should no longer be made.
+
+        Returns:
+            bool: True when the request can be made, which should be followed by `release()` (in a `finally`, so that cancelled requests are released as well).
+            False when the budget can only be restored after the deadline.
+        """
+
+        required_calls: int = (
+            GITHUB_API_FETCH_RESERVED_CALLS
+            if action is GithubRunnerActions.FETCH_README
+            else 1
+        )
+        available: Optional[int] = self.available
+
+        if available is not None and available < required_calls:
+            # The reset is jittered so that the waiting requests won't be made all at once.
+            reset_delay: float = (
+                self.reset_at - time() + uniform(0, GITHUB_API_RETRY_BASE_DELAY)
+            )
+
+            if perf_counter() + reset_delay > deadline:
+                return False
+
+            self.logger.warning(
+                f"Rate limit budget has {available} request/s left, which is not enough for {action.name} ({required_calls} required). Waiting for the reset in {reset_delay:.2f} seconds..."
+            )
+            await sleep(reset_delay)
+
+        self._in_flight += 1
+        return True
+
+    def release(self, headers: Optional[Mapping[str, Any]] = None) -> None:
+        """
+        Removes the request from the in-flight requests, and updates the budget from its response (if there's any).
+
+        Args:
+            headers (Optional[Mapping[str, Any]], optional): The headers of the response. Defaults to None, which is when the request has failed to be made.
+        """
+
+        self._in_flight -= 1
+
+        if headers is None:
+            return
+
+        try:
+            limit: int = int(headers["X-RateLimit-Limit"])
+            remaining: int = int(headers["X-RateLimit-Remaining"])
+            reset_at: float = float(headers["X-RateLimit-Reset"])
+
+        except (KeyError, ValueError):
+            return
+
+        # ! Responses may arrive out of order. Only the lowest remaining of the latest window is trusted.
+        if reset_at > self.reset_at or self.remaining is None:
+            self.limit, self.remaining, self.reset_at = limit, remaining, reset_at
+
+        elif reset_at == self.reset_at:
+            self.remaining = min(self.remaining, remaining)
+
+        self.logger.debug(
+            f"Rate limit budget: {self.remaining}/{self.limit} (with {self._in_flight} in-flight request/s), resets at {self.reset_at}."
+        )
+
+    def can_afford_low_value(self) -> bool:
+        """
+        Checks whether a low-value request (such as a commit that only changes the elapsed time) can be made without running the rate limit dry before the reset.
+
+        Returns:
+            bool: True when the share of the budget left is at least the share of the window left, which means the budget is spent no faster than it resets.
+        """
+
+        available: Optional[int] = self.available
+
+        if available is None or not self.limit:
+            return True
+
+        return (
+            available > GITHUB_API_FETCH_RESERVED_CALLS
+            and available / self.limit
+            >= min(1.0, (self.reset_at - time()) / GITHUB_API_RATE_LIMIT_WINDOW)
+        )
@@ -15,32 +15,59 @@ limitations under the license.
 """
 
 from argparse import Namespace
-from asyncio import create_task
+from asyncio import Event, TimeoutError, create_task, gather, sleep, wait_for
+from json import dump as json_dump, load as json_load
 from logging import Logger
-from os import _exit as terminate
-from typing import Any, Callable, List, NoReturn, Optional, Union
-
-from discord import Activity, ActivityType, Client, ClientUser, Member, Status
-from discord.activity import CustomActivity, Game
-from discord.errors import HTTPException, NotFound
+from os import _exit as terminate, makedirs, path
+from math import ceil
+from random import randrange
+from time import perf_counter, time
+from typing import Any, Callable, Hashable, NoReturn, Optional
+
+from aiohttp import ClientError
+
+from discord import (
+    Activity,
+    ActivityType,
+    Client,
+    ClientUser,
+    Member,
+    MemberCacheFlags,
+    Status,
+)
+from discord.backoff import ExponentialBackoff
+from discord.errors import ConnectionClosed, GatewayNotFound, HTTPException, NotFound
+from discord.gateway import DiscordWebSocket, ReconnectWebSocket
+from discord.http import Route
 from discord.guild import Guild
 from discord.user import User
 
+from config import EnvConfig
 from elements.constants import (
-    BLUEPRINT_INIT_VALUES,
     DISCORD_CLIENT_INTENTS,
-    DISCORD_USER_STRUCT,
+    DISCORD_CLIENT_LOW_MEMORY_INTENTS,
+    DISCORD_GUILD_SCAN_CONCURRENCY,
+    DISCORD_GUILD_SCAN_TIMEOUT,
+    DISCORD_QUERY_MEMBERS_LIMIT,
+    GATEWAY_SESSION_CLOSE_CODE,
+    GATEWAY_SESSION_FILENAME,
+    GATEWAY_IDENTIFY_INTERVAL,
+    GATEWAY_SESSION_START_LIMIT_STRUCT,
+    GATEWAY_SESSION_START_LOW_BUDGET,
+    GATEWAY_SESSION_START_SPREAD_WINDOW,
+    GATEWAY_SESSION_STRUCT,
     ExitReturnCodes,
     GithubRunnerLevelMessages,
-    PreferredActivityDisplay,
 )
+from presence import ActivitySnapshot, PresenceSnapshot, get_activity_extractor
 
 
 class DiscordClientHandler(Client):
     # * The following variables are declared for weak reference since there's no hint-typing inheritance.
 
+    _wait_for_preconnect: Callable
     args: Namespace
-    envs: Any
+    envs: EnvConfig
     logger: Logger
     print_exception: Callable
     user: ClientUser
@@ -51,7 +78,335 @@ class DiscordClientHandler(Client):
     def __init__(self) -> None:
         # A constructor that initializes another constructor, which is directly referring to DiscordClient (known as discord.Client) to instantiate resources.
 
-        super().__init__(intents=DISCORD_CLIENT_INTENTS)
+        # ! `envs` only exists on the second instantiation (from `__ainit__()`), which is the one that connects.
+        envs: dict[str, Any] = getattr(self, "envs", {})
+
+        # On targeted presence fetch (or with a pinned guild), guilds are not chunked when connecting, since only the tracked users are requested after.
+        # * The connector is shared with the ClientSession (Github API), which is only available on the second instantiation as well.
+        client_options: dict[str, Any] = {
+            "connector": getattr(self, "_api_connector", None),
+            "intents": DISCORD_CLIENT_INTENTS,
+            "chunk_guilds_at_startup": not (
+                envs.get("TARGETED_PRESENCE_FETCH", False)
+                or envs.get("DISCORD_GUILD_ID")
+            ),
+        }
+
+        # On low-memory profile, messages are never cached, and the only members that will be cached are the ones requested by `_query_members_presence()`.
+        # Since we don't need the member list, the `members` intent is dropped as well so that the guilds were sent without them.
+        if envs.get("LOW_MEMORY_PROFILE", False):
+            client_options.update(
+                intents=DISCORD_CLIENT_LOW_MEMORY_INTENTS,
+                chunk_guilds_at_startup=False,
+                max_messages=None,
+                member_cache_flags=MemberCacheFlags.none(),
+            )
+
+        super().__init__(**client_options)
+
+        # * `presence_ready` is set once `user_ctx` contains the first snapshot, while `presence_changed` is set for every snapshot that differs from the last one.
+        self.presence_ready: Event = Event()
+        self.presence_changed: Event = Event()
+        self._last_presence_signature: Optional[Hashable] = None
+
+        # The snapshot is replaced (never modified) on every fetch, which is why it can be read by the badge/s while the next one is being made.
+        self.user_ctx: PresenceSnapshot = PresenceSnapshot()
+
+        # On batch mode, this is filled by the superclass with the tenants (`BadgeTenant`) to fetch the presence for.
+        self.tenants: list[Any] = []
+
+        # * Used to tell which path (RESUME or IDENTIFY) the connection took, and how long it took.
+        self._connect_started_at: float = 0.0
+        self._is_resuming_session: bool = False
+
+    async def login(self, token: str, *, bot: bool = True) -> None:
+        """
+        Logs in to Discord once the pre-connection to Discord is done, so that the login reuses that connection instead of establishing another one.
+        """
+
+        await self._wait_for_preconnect(Route.BASE)
+        await super().login(token, bot=bot)
+
+    async def connect(self, *, reconnect: bool = True) -> None:
+        """
+        Connects to Discord by resuming the session from the previous run (when GATEWAY_SESSION_RESUME is enabled), and falls back to IDENTIFY when it can't be resumed.
+
+        Notes:
+            Once the session was resumed, further disconnections are resumed as well (the same way discord.py does), since discord.py's `connect()` can only start from IDENTIFY.
+            The connection is only handed over to discord.py's `connect()` once Discord has invalidated the session, or the connection was closed for good.
+
+        Args:
+            reconnect (bool, optional): Whether to reconnect on disconnections, as in discord.py's `connect()`. Defaults to True.
+        """
+
+        self._connect_started_at = perf_counter()
+
+        gateway_session: Optional[GATEWAY_SESSION_STRUCT] = (
+            self._load_gateway_session()
+            if self.envs.GATEWAY_SESSION_RESUME
+            else None
+        )
+
+        if gateway_session is not None:
+            self.logger.info(
+                f"Attempting to RESUME the gateway session {gateway_session['session_id']} from the previous run..."
+            )
+            self._is_resuming_session = True
+
+            ws_params: dict[str, Any] = {
+                "initial": True,
+                "gateway": gateway_session["gateway"],
+                "session": gateway_session["session_id"],
+                "sequence": gateway_session["sequence"],
+                "resume": True,
+            }
+            backoff: ExponentialBackoff = ExponentialBackoff()
+
+            while not self.is_closed():
+                try:
+                    self.ws = await wait_for(
+                        DiscordWebSocket.from_client(self, **ws_params),
+                        timeout=60.0,
+                    )
+                    ws_params["initial"] = False
+
+                    while True:
+                        await self.ws.poll_event()
+
+                # ! Discord invalidates sessions that cannot be resumed, which discord.py raises as a request to reconnect.
+                except (
+                    ReconnectWebSocket,
+                    OSError,
+                    HTTPException,
+                    GatewayNotFound,
+                    ConnectionClosed,
+                    ClientError,
+                    TimeoutError,
+                ) as e:
+                    if self.is_closed():
+                        return
+
+                    # * `on_resumed()` marks the session as resumed, which means it was the session from the previous run that cannot be resumed.
+                    if self._is_resuming_session:
+                        self.logger.warning(
+                            f"Gateway session cannot be resumed. Falling back to IDENTIFY... | Info: {e.__class__.__name__}: {e}"
+                        )
+                        break
+
+                    self.dispatch("disconnect")
+
+                    if not reconnect:
+                        await self.close()
+                        return
+
+                    # The session is invalidated (or closed with a code that discord.py doesn't reconnect from), which leaves IDENTIFY as the only way back.
+                    if (isinstance(e, ReconnectWebSocket) and not e.resume) or (
+                        isinstance(e, ConnectionClosed) and e.code != 1000
+                    ):
+                        self.logger.warning(
+                            f"Gateway session has been invalidated after it was resumed. Falling back to IDENTIFY... | Info: {e.__class__.__name__}: {e}"
+                        )
+                        break
+
+                    ws_params.update(
+                        gateway=self.ws.gateway,
+                        session=self.ws.session_id,
+                        sequence=self.ws.sequence,
+                        resume=True,
+                    )
+
+                    # Requests to reconnect are resumed right away, the same as discord.py does.
+                    if not isinstance(e, ReconnectWebSocket):
+                        retry_delay: float = backoff.delay()
+
+                        self.logger.warning(
+                            f"Gateway has been disconnected. Resuming the session in {retry_delay:.2f}s... | Info: {e.__class__.__name__}: {e}"
+                        )
+                        await sleep(retry_delay)
+
+            # The client was closed (without falling back to IDENTIFY), which means there's nothing left to connect.
+            else:
+                return
+
+            self._is_resuming_session = False
+
+        await self._check_session_start_budget()
+        await super().connect(reconnect=reconnect)
+
+    async def _check_session_start_budget(self) -> None:
+        """
+        Checks the remaining session starts (IDENTIFY) of the bot before logging in, since Discord resets the token of the bots that have ran out of it.
+
+        When the budget is low, the login is delayed to one of the slots (of GATEWAY_IDENTIFY_INTERVAL) within GATEWAY_SESSION_START_SPREAD_WINDOW, picked at random,
+        so that the runs that were started at the same time won't log in together, and then the budget is checked again. When there's nothing left, the run is skipped.
+        """
+
+        session_start_limit: Optional[
+            GATEWAY_SESSION_START_LIMIT_STRUCT
+        ] = await self._get_session_start_limit()
+
+        if session_start_limit is None:
+            return
+
+        if (
+            0
+            < session_start_limit["remaining"]
+            <= GATEWAY_SESSION_START_LOW_BUDGET
+        ):
+            # * Each slot fits `max_concurrency` logins, which means the same number of runs needs lesser slots (and lesser delay) as the concurrency goes higher.
+            login_slots: int = max(
+                ceil(
+                    GATEWAY_SESSION_START_SPREAD_WINDOW
+                    / (
+                        GATEWAY_IDENTIFY_INTERVAL
+                        * max(session_start_limit["max_concurrency"], 1)
+                    )
+                ),
+                1,
+            )
+            login_slot: int = randrange(login_slots)
+            login_delay: float = login_slot * GATEWAY_IDENTIFY_INTERVAL
+
+            self.logger.warning(
+                f"Session start budget is low! Delaying the login by {login_delay:.2f}s (slot {login_slot + 1} of {login_slots}) to avoid logging in with the other runs at the same time..."
+            )
+            await sleep(login_delay)
+
+            session_start_limit = await self._get_session_start_limit()
+
+            if session_start_limit is None:
+                return
+
+        if not session_start_limit["remaining"]:
+            # ! This is not a failure of the run, since the badge will be updated on the next run once the session starts are reset.
+            msg: str = f"The bot has ran out of session starts, this run will be skipped to avoid having the token reset by Discord. Session starts will be reset after {session_start_limit['reset_after'] / 1000:.0f}s."
+            self.logger.warning(msg)
+
+            self.print_exception(GithubRunnerLevelMessages.WARNING, msg, None)
+
+            await self.close()
+            terminate(ExitReturnCodes.SKIPPED_EXIT)
+
+    async def _get_session_start_limit(
+        self,
+    ) -> Optional[GATEWAY_SESSION_START_LIMIT_STRUCT]:
+        """
+        Fetches the session start limit of the bot from `GET /gateway/bot`.
+
+        Returns:
+            Optional[GATEWAY_SESSION_START_LIMIT_STRUCT]: The session start limit, or None when it cannot be fetched, in which case the login proceeds as usual.
+        """
+
+        try:
+            session_start_limit: GATEWAY_SESSION_START_LIMIT_STRUCT = (
+                await self.http.request(Route("GET", "/gateway/bot"))
+            )["session_start_limit"]
+
+        except (HTTPException, KeyError) as e:
+            self.logger.warning(
+                f"Session start limit cannot be fetched, logging in without checking it. | Info: {e}"
+            )
+            return None
+
+        self.logger.info(
+            f"Session Start Budget | Remaining: {session_start_limit['remaining']} of {session_start_limit['total']}, resets after {session_start_limit['reset_after'] / 1000:.0f}s. (Max Concurrency: {session_start_limit['max_concurrency']})"
+        )
+        return session_start_limit
+
+    async def close(self) -> None:
+        """
+        Closes the connection to Discord. When GATEWAY_SESSION_RESUME is enabled, the session is persisted and closed in a way that it can be resumed on the next run.
+        """
+
+        if (
+            not self.envs.GATEWAY_SESSION_RESUME
+            or self.is_closed()
+            or self.ws is None
+            or not self.ws.open
+            or self.ws.session_id is None
+        ):
+            await super().close()
+            return
+
+        self._save_gateway_session()
+
+        # ! discord.py closes the gateway with code 1000, which tells Discord to invalidate the session. We mark it closed first so that it won't reconnect.
+        self._closed = True
+        await self.http.close()
+        await self.ws.close(code=GATEWAY_SESSION_CLOSE_CODE)
+
+        self._ready.clear()
+
+    def _load_gateway_session(self) -> Optional[GATEWAY_SESSION_STRUCT]:
+        """
+        Loads the gateway session that was persisted from the previous run.
+
+        Returns:
+            Optional[GATEWAY_SESSION_STRUCT]: The gateway session, or None when it doesn't exist, is unreadable or is too old to be resumed.
+        """
+
+        session_path: str = path.join(
+            self.envs.STATE_DIRECTORY, GATEWAY_SESSION_FILENAME
+        )
+
+        try:
+            with open(session_path, encoding="utf-8") as session_file:
+                gateway_session: GATEWAY_SESSION_STRUCT = json_load(session_file)
+
+        except FileNotFoundError:
+            self.logger.info(
+                f"There's no gateway session to resume from {session_path}. Connecting via IDENTIFY..."
+            )
+            return None
+
+        except (OSError, ValueError) as e:
+            self.logger.warning(
+                f"Gateway session from {session_path} cannot be loaded. Connecting via IDENTIFY... | Info: {e}"
+            )
+            return None
+
+        if (
+            time() - gateway_session["saved_at"]
+            > self.envs.GATEWAY_SESSION_RESUME_WINDOW
+        ):
+            self.logger.info(
+                f"Gateway session from the previous run is older than {self.envs.GATEWAY_SESSION_RESUME_WINDOW} seconds. Connecting via IDENTIFY..."
+            )
+            return None
+
+        return gateway_session
+
+    def _save_gateway_session(self) -> None:
+        """
+        Persists the current gateway session under STATE_DIRECTORY so that the next run can resume it. Failing to do so only loses the chance to resume.
+        """
+
+        gateway_session: GATEWAY_SESSION_STRUCT = {
+            "session_id": self.ws.session_id,
+            "sequence": self.ws.sequence,
+            "gateway": self.ws.gateway,
+            "saved_at": time(),
+        }
+
+        try:
+            makedirs(self.envs.STATE_DIRECTORY, exist_ok=True)
+
+            with open(
+                path.join(self.envs.STATE_DIRECTORY, GATEWAY_SESSION_FILENAME),
+                "w",
+                encoding="utf-8",
+            ) as session_file:
+                json_dump(gateway_session, session_file)
+
+        except OSError as e:
+            self.logger.warning(
+                f"Gateway session cannot be saved, the next run will connect via IDENTIFY. | Info: {e}"
+            )
+            return
+
+        self.logger.info(
+            f"Gateway session {gateway_session['session_id']} (sequence: {gateway_session['sequence']}) has been saved for the next run."
+        )
 
     async def on_ready(self) -> None:
         """
@@ -62,6 +417,9 @@ class DiscordClientHandler(Client):
         self.logger.debug(
             f"Connection to Discord via WebSocket is success! | Rate-Limited: {self.is_ws_ratelimited()}."
         )
+        self.logger.info(
+            f"Connected to Discord via IDENTIFY. (took {perf_counter() - self._connect_started_at:.3f}s)"
+        )
 
         create_task(  # This is optional, but I made it so that we can see if the Bot was active.
             (
@@ -78,24 +436,180 @@ class DiscordClientHandler(Client):
             f"Changed / Pushed Rich Presence to display {self.user}'s status."
         )
 
-        # I ! cannot do reference by variable of this blank blueprint because TypedDict and other elements associated to it is complaining about it.
-        self.user_ctx: DISCORD_USER_STRUCT = BLUEPRINT_INIT_VALUES
+        # With a pinned guild, the presence was already fetched by `on_guild_available()` as soon as that guild was available.
+        if self.envs.DISCORD_GUILD_ID:
+            pinned_guild: Optional[Guild] = self.get_guild(self.envs.DISCORD_GUILD_ID)
+
+            if pinned_guild is None or pinned_guild.unavailable:
+                await self._exit_client_on_error(
+                    f"The pinned guild (DISCORD_GUILD_ID: {self.envs.DISCORD_GUILD_ID}) is either unavailable or {self.user} is not a member of it. Please add the bot to your server, or leave DISCORD_GUILD_ID empty and try again."
+                )
+            return
 
-        # Perform two async actions with one on top of it as an input from the outer method.
-        # ! We cannot create_tasks for them since one of them is a dependency and there's no room for more actions.
-        await self._get_activities_via_guild(
-            await self._get_discord_user()
-        )  # * 3 [a, b]
+        await self._fetch_presence_and_notify()
+
+    async def on_resumed(self) -> None:
+        """
+        A called method from a dispatch method when the session has been resumed, which happens in place of `on_ready()` when `connect()` has resumed the previous run's session.
+
+        Since nothing was cached from the previous run, the pinned guild is fetched from the REST API and cached before requesting the presence from it.
+        """
+
+        # ! This is also dispatched when discord.py resumes on its own (from a disconnection), where the cache is intact.
+        if not self._is_resuming_session:
+            return
+
+        self._is_resuming_session = False
+
+        self.logger.info(
+            f"Connected to Discord via RESUME. (took {perf_counter() - self._connect_started_at:.3f}s)"
+        )
+
+        try:
+            pinned_guild: Guild = self._connection._add_guild_from_data(
+                await self.http.get_guild(self.envs.DISCORD_GUILD_ID)
+            )
+
+        except HTTPException as e:
+            await self._exit_client_on_error(
+                f"The pinned guild (DISCORD_GUILD_ID: {self.envs.DISCORD_GUILD_ID}) cannot be fetched after resuming the session. Please check if the bot is still a member of it. | Info: {e}"
+            )
+
+        await self._fetch_presence_and_notify(pinned_guild)
+
+    async def on_guild_available(self, guild: Guild) -> None:
+        """
+        A called method from a dispatch method whenever a guild becomes available, which happens for every guild before `on_ready()` gets called.
+
+        When the guild is pinned (DISCORD_GUILD_ID), the presence is fetched from that guild right away instead of waiting for the rest of the guilds.
+        This way, the time it takes to produce the badge doesn't depend on the number of guilds the bot is in.
+
+        Args:
+            guild (Guild): The guild that has become available.
+        """
+
+        if guild.id != self.envs.DISCORD_GUILD_ID:
+            return
+
+        self.logger.info(
+            f"Pinned guild {guild} is available via IDENTIFY! Fetching the presence without waiting for other guilds... (took {perf_counter() - self._connect_started_at:.3f}s)"
+        )
+        await self._fetch_presence_and_notify(guild)
+
+    async def _fetch_presence_and_notify(
+        self, pinned_guild: Optional[Guild] = None
+    ) -> None:
+        """
+        Fetches the presence of the user (or the tenants, on batch mode), notifies the superclass that it's ready, then closes the client unless it's on daemon mode.
+
+        Args:
+            pinned_guild (Optional[Guild], optional): The guild to fetch the presence from. When None, the guilds are looked up from the user instead. Defaults to None.
+        """
+
+        if self.tenants:
+            await self._get_activities_of_tenants(pinned_guild)
+
+        elif pinned_guild is not None:
+            await self._get_activities_via_pinned_guild(pinned_guild)
+
+        else:
+            # Perform two async actions with one on top of it as an input from the outer method.
+            # ! We cannot create_tasks for them since one of them is a dependency and there's no room for more actions.
+            await self._get_activities_via_guild(
+                await self._get_discord_user()
+            )  # * 3 [a, b]
 
         self.logger.info(
             "Discord Client is finished fetching data and is saved for badge processing."
         )
 
+        self.presence_ready.set()
+        self.presence_changed.set()
+
+        # On daemon mode, the connection stays open so that `on_member_update` can keep `user_ctx` in sync with the user's presence.
+        if self.envs.DAEMON_MODE:
+            self.logger.info(
+                "Daemon mode is enabled, keeping the connection open to listen for presence changes."
+            )
+            return
+
+        # ! When the presence was fetched from the pinned guild, discord.py is still waiting for the other guilds to dispatch `on_ready()`, which we no longer need.
+        if pinned_guild is not None and self._connection._ready_task is not None:
+            self._connection._ready_task.cancel()
+
         await self.close()
         self.logger.info("Closing Sessions (1 of 2) | discord.Client -> Done.")
 
         # We might wanna catch it here to provide accurate information about the possible occurence of the error.
 
+    async def on_member_update(self, before: Member, after: Member) -> None:
+        """
+        A called method from a dispatch method whenever a member's state has been changed. For discord.py 1.7.x, this includes presence updates.
+        """
+
+        await self._on_tracked_presence_update(after)
+
+    async def on_presence_update(self, before: Member, after: Member) -> None:
+        """
+        The same as `on_member_update`, but for discord.py 2.x where presence updates were separated from the member updates.
+        """
+
+        await self._on_tracked_presence_update(after)
+
+    async def _on_tracked_presence_update(self, member: Member) -> None:
+        """
+        Refreshes `user_ctx` whenever the tracked user's presence has changed, which lets the daemon mode re-render the badge.
+
+        Args:
+            member (Member): The member that has been updated, straight from the dispatched event.
+
+        Notes:
+            The event is dispatched for every mutual guild that the user is in, where each guild only has its own copy of the presence.
+            The snapshot is merged from every mutual guild (the same way as the first fetch does), and its signature is compared to skip the duplicates.
+        """
+
+        if (
+            not self.envs.DAEMON_MODE
+            or not self.presence_ready.is_set()
+            or member.id != self.envs.DISCORD_USER_ID
+        ):
+            return
+
+        fetched_members: list[Member] = [
+            each_member
+            for each_member in (
+                each_guild.get_member(member.id) for each_guild in member.mutual_guilds
+            )
+            if each_member is not None
+        ] or [member]
+
+        user_ctx: PresenceSnapshot = self._merge_member_presence(fetched_members)
+        presence_signature: Hashable = self._get_presence_signature(user_ctx)
+
+        if presence_signature == self._last_presence_signature:
+            self.logger.debug(
+                f"Presence update of {member} has no visible changes. Ignoring."
+            )
+            return
+
+        self.logger.info(f"Presence of {member} has changed. Updating the context...")
+        self.user_ctx = user_ctx
+        self._last_presence_signature = presence_signature
+        self.presence_changed.set()
+
+    def _get_presence_signature(self, user_ctx: PresenceSnapshot) -> Hashable:
+        """
+        Reduces the presence to the elements that can change the output of the badge, which are the status and the activities (without the device statuses).
+
+        Args:
+            user_ctx (PresenceSnapshot): The presence to evaluate, merged from every mutual guild.
+
+        Returns:
+            Hashable: A tuple that can be compared with the previous signature.
+        """
+
+        return (user_ctx.status, user_ctx.activities)
+
     async def _get_discord_user(self) -> User:
         """
         A private method that obtains Discord User's Information for further query with the Mutual Guilds.
@@ -108,15 +622,10 @@ class DiscordClientHandler(Client):
         self.logger.info("Fetching Discord User's info...")
 
         try:
-            user_info = await self.fetch_user(self.envs["DISCORD_USER_ID"])
-
-            self.user_ctx["id"] = user_info.id
-            self.user_ctx["name"] = user_info.name
-            self.user_ctx["discriminator"] = user_info.discriminator
+            user_info = await self.fetch_user(self.envs.DISCORD_USER_ID)
 
             self.logger.info(
-                "Discord User %s Fetched."
-                % (self.user_ctx["name"] + self.user_ctx["discriminator"])
+                "Discord User %s Fetched." % (user_info.name + user_info.discriminator)
             )
 
         except NotFound as e:
@@ -139,15 +648,32 @@ class DiscordClientHandler(Client):
             fetched_user (User): Discord User's Information, which is the inner scope method returned.
 
         Notes:
-            (3) Fetch all activities from the user and serialize it in a way where it can be contained in self.__client_container under key "presence" (self.__client_container["presence"])
-            (3) Every attributes can be a dict() by calling to_dict() that is embedded from the activity.
-            (3) Each Activity Type will be renamed to accomodate the lower-case, underscore-space key and consistency.
-            (3) Once done, push the activity name (__cls_name__) to __activity_picked__ (List) so that no other duplicates can be inserted to the container.
+            (3) Fetch all activities from the user and take a snapshot of them (PresenceSnapshot), which replaces `user_ctx`.
+            (3) Each Activity Type is dispatched to its extractor (see `get_activity_extractor()`), which only reads the fields that can be displayed.
+            (3) Only the first activity of each type is kept, so that no other duplicates can be inserted to the snapshot.
             (4) The discord.user.User itself doesn't provide much information of the user in real-time. I have to go through Guilds to see what's their current status.
             (4) This is the exact reason of why this scope is not included to the DiscordClientHandler.__get_user() context.
 
         """
 
+        if self.envs.TARGETED_PRESENCE_FETCH:
+            self.logger.info(
+                f"Requesting the presence of {fetched_user} from the guilds..."
+            )
+
+            fetched_members: list[Member] = (
+                await self._query_members_presence([fetched_user.id])
+            ).get(fetched_user.id, [])
+
+            if not fetched_members:
+                await self._exit_client_on_error(
+                    f"Discord User {fetched_user.name} doesn't have any Mutual Guilds with {self.user}. Please add the bot to your server and try again.",
+                    fetched_user,
+                )
+
+            self._serialize_member_presence(fetched_members)
+            return
+
         self.logger.info("Fetching mutual guild from the cached instance client...")
 
         # Before we get the guild, check if we mutual guilds between the User and the Bot.
@@ -157,97 +683,307 @@ class DiscordClientHandler(Client):
                 fetched_user,
             )
 
-        # If there is a mutual guild, then ensure that it is class 'discord.guild.Guild'> and fetch the first one.
-        if not isinstance(fetched_user.mutual_guilds[0], Guild):
+        # If there is a mutual guild, then ensure that it is class 'discord.guild.Guild'> before fetching from them.
+        if not all(
+            isinstance(each_guild, Guild) for each_guild in fetched_user.mutual_guilds
+        ):
             await self._exit_client_on_error(
                 f"The list of mutual guild/s is/are expected to be {Guild}. This is an issue that the developer can solve. Please report this issue in https://github.com/CodexLink/discord-activity-badge",
                 fetched_user,
             )
 
-        # Once type checked, fetch the user from guild and fetch it as a member from that guild.
-        fetched_member: Optional[Member] = fetched_user.mutual_guilds[0].get_member(
-            fetched_user.id
-        )
+        # Once type checked, fetch the user as a member from every mutual guild, since the presence from one guild may be stale.
+        fetched_members = [
+            each_member
+            for each_member in (
+                each_guild.get_member(fetched_user.id)
+                for each_guild in fetched_user.mutual_guilds
+            )
+            if each_member is not None
+        ]
 
         if (
-            fetched_member
-        ):  # ! Since `get_member` enforce Optional, then we assert here that it will never be Optional or lead to None.
-            if not fetched_member.activities:
-                self.logger.warning(f"User {fetched_member} doesn't have any activity.")
+            fetched_members
+        ):  # ! Since `get_member` enforce Optional, then we assert here that there's at least one that didn't lead to None.
+            self._serialize_member_presence(fetched_members)
 
-            else:
-                self.logger.info(
-                    f"User {fetched_member} contains {len(fetched_member.activities)} activit%s."
-                    % ("y" if not len(fetched_member.activities) > 1 else "ies")
-                )
+        else:
+
+            msg: str = "The requested user -> member (from the guild) does not exists! This was already asserted on the previous methods which means this shoudn't happen in the first place. Please contact the developer about this issue, if persists."
+            self.logger.error(msg)
+
+            self.print_exception(GithubRunnerLevelMessages.ERROR, msg, None)
+            terminate(ExitReturnCodes.ILLEGAL_CONDITION_EXIT)
+
+    async def _get_activities_via_pinned_guild(self, pinned_guild: Guild) -> None:
+        """
+        Retrieves User Activities by requesting the user as a member of the pinned guild (DISCORD_GUILD_ID).
+
+        Notes:
+            Unlike `_get_activities_via_guild()`, this doesn't fetch the user from the REST API since the member itself contains the user's information.
+
+        Args:
+            pinned_guild (Guild): The guild declared under DISCORD_GUILD_ID.
+        """
+
+        fetched_members: list[Member] = (
+            await self._query_members_presence(
+                [self.envs.DISCORD_USER_ID], [pinned_guild]
+            )
+        ).get(self.envs.DISCORD_USER_ID, [])
+
+        if not fetched_members:
+            await self._exit_client_on_error(
+                f"Discord User {self.envs.DISCORD_USER_ID} is not a member of the pinned guild {pinned_guild}. Please join the server, or leave DISCORD_GUILD_ID empty and try again."
+            )
+
+        self._serialize_member_presence(fetched_members)
+
+    async def _get_activities_of_tenants(
+        self, pinned_guild: Optional[Guild] = None
+    ) -> None:
+        """
+        Retrieves the activities of every tenant (on batch mode) from the guilds that were cached by the connection.
+
+        Notes:
+            Unlike `_get_activities_via_guild()`, this doesn't fetch the user from the REST API since the members were already cached, saving one request per tenant.
+            On targeted presence fetch (or with a pinned guild), the members of every tenant are requested instead.
+            Tenants that can't be found from any guild are left with `presence_ready` unset, so that the superclass can skip them.
+
+        Args:
+            pinned_guild (Optional[Guild], optional): The guild to request the members from, instead of every guild. Defaults to None.
+        """
+
+        is_requesting_members: bool = (
+            self.envs.TARGETED_PRESENCE_FETCH or pinned_guild is not None
+        )
+
+        self.logger.info(
+            f"Fetching the presence of {len(self.tenants)} tenant/s from {len(self.guilds)} guild/s..."
+        )
 
-                # For every activity exists, we store them uniquely. This means duplicated activities (same activity) will be ignored.
-                unique_activities: List[str] = []
+        queried_members: dict[int, list[Member]] = (
+            await self._query_members_presence(
+                [each_tenant.envs.DISCORD_USER_ID for each_tenant in self.tenants],
+                [pinned_guild] if pinned_guild is not None else None,
+            )
+            if is_requesting_members
+            else {}
+        )
 
-                # For each activities stored in-memory, iterate through them so that we can store them in unique_activities.
-                for idx, each_activities in enumerate(fetched_member.activities):
-                    self.logger.debug(
-                        f"Activity Assessment {idx + 1}/{len(fetched_member.activities)} | {each_activities}"
+        for each_tenant in self.tenants:
+            fetched_members: list[Member] = queried_members.get(
+                each_tenant.envs.DISCORD_USER_ID, []
+            )
+
+            if not is_requesting_members:
+                fetched_members = [
+                    each_member
+                    for each_member in (
+                        each_guild.get_member(each_tenant.envs.DISCORD_USER_ID)
+                        for each_guild in self.guilds
                     )
+                    if each_member is not None
+                ]
 
-                    if not each_activities.__class__.__name__ in unique_activities:
-                        self.logger.debug(
-                            f"Activity {each_activities.__class__.__name__} was not in the list. (The list contains {unique_activities})"
-                        )
+            if not fetched_members:
+                self.logger.error(
+                    f"Tenant {each_tenant} doesn't have any Mutual Guilds with {self.user}. This tenant will be skipped."
+                )
+                continue
 
-                        # ! I can't type `activity_ctx` because BaseActivity and Spotify doesn't have `to_dict` method.
-                        activity_ctx: dict[Union[str, dict[Any, Any]], Any] = each_activities.to_dict()  # type: ignore # * Extract the activity in dictionary form.
-
-                        cls_name: str = (
-                            each_activities.__class__.__name__
-                        )  # Get the activity class name.
-
-                        resolved_activity_name = (  # Then we resolve it with Enums.
-                            PreferredActivityDisplay.CUSTOM_ACTIVITY.name
-                            if cls_name == CustomActivity.__name__
-                            else PreferredActivityDisplay.RICH_PRESENCE.name
-                            if cls_name == Activity.__name__
-                            else PreferredActivityDisplay.GAME_ACTIVITY.name
-                            if cls_name == Game.__name__
-                            else PreferredActivityDisplay.SPOTIFY_ACTIVITY.name
-                        )
+            self._serialize_member_presence(fetched_members, each_tenant)
+            each_tenant.presence_ready.set()
 
-                        self.user_ctx["activities"][
-                            resolved_activity_name
-                        ] = activity_ctx  # ! Once we resolve the name, have it as key and store the activity context.
+    async def _query_members_presence(
+        self, user_ids: list[int], guilds: Optional[list[Guild]] = None
+    ) -> dict[int, list[Member]]:
+        """
+        Requests the members (along with their presence) of the given users only, instead of relying from the members that were chunked on startup.
 
-                        unique_activities.append(cls_name)
-                        self.logger.debug(
-                            f"Activity '{resolved_activity_name}' has been pushed in the list of unique activities!"
-                        )
+        Guilds are requested concurrently by waves (of DISCORD_GUILD_SCAN_CONCURRENCY), where each guild has its own time budget (DISCORD_GUILD_SCAN_TIMEOUT).
+        The scan stops after the wave where every user was found, which means the cost of this method depends on the number of users rather than the size of the guilds.
 
-                    else:
-                        self.logger.debug(
-                            f"Activity {each_activities} is ignored since one data of the same type was appended in unique_activities. (Contains: {unique_activities})"
-                        )
+        Args:
+            user_ids (list[int]): The IDs of the users to request.
+            guilds (Optional[list[Guild]], optional): The guilds to request from. Defaults to None, which requests from every guild.
+
+        Returns:
+            dict[int, list[Member]]: The members that were found from every guild, keyed by their ID. Users that can't be found from any guild are not included.
+        """
+
+        found_members: dict[int, list[Member]] = {}
+        scanned_guilds: list[Guild] = guilds if guilds is not None else self.guilds
 
-            # As we handle the Activities, we have to handle the state of the user as a fallback output.
-            self.user_ctx["statuses"]["status"] = fetched_member.status  # type: ignore # I didn't expect this one to be different from other Enums.
+        for idx in range(0, len(scanned_guilds), DISCORD_GUILD_SCAN_CONCURRENCY):
+            remaining_ids: list[int] = [
+                each_id for each_id in user_ids if each_id not in found_members
+            ]
 
-            # ! Other states may be utilized in the future, they are subject to change.
-            self.user_ctx["statuses"]["on_web"] = fetched_member.web_status
-            self.user_ctx["statuses"]["on_desktop"] = fetched_member.desktop_status
-            self.user_ctx["statuses"]["on_mobile"] = fetched_member.mobile_status
+            if not remaining_ids:
+                break
+
+            for each_queried_members in await gather(
+                *(
+                    self._query_guild_members(each_guild, remaining_ids)
+                    for each_guild in scanned_guilds[
+                        idx : idx + DISCORD_GUILD_SCAN_CONCURRENCY
+                    ]
+                )
+            ):
+                for each_member in each_queried_members:
+                    found_members.setdefault(each_member.id, []).append(each_member)
+
+        self.logger.info(
+            f"{len(found_members)} of {len(user_ids)} user/s were found by requesting their presence from the guilds."
+        )
+        return found_members
 
+    async def _query_guild_members(
+        self, guild: Guild, user_ids: list[int]
+    ) -> list[Member]:
+        """
+        Requests the members of the given users from one guild, within the time budget of DISCORD_GUILD_SCAN_TIMEOUT per request.
+
+        Args:
+            guild (Guild): The guild to request from.
+            user_ids (list[int]): The IDs of the users to request.
+
+        Returns:
+            list[Member]: The members that were found. A guild that did not respond in time only returns what it has responded so far.
+        """
+
+        queried_members: list[Member] = []
+
+        try:
+            # The gateway only accepts a maximum of 100 users per request.
+            for idx in range(0, len(user_ids), DISCORD_QUERY_MEMBERS_LIMIT):
+                requested_ids: list[int] = user_ids[
+                    idx : idx + DISCORD_QUERY_MEMBERS_LIMIT
+                ]
+
+                queried_members += await wait_for(
+                    guild.query_members(
+                        user_ids=requested_ids,
+                        limit=len(requested_ids),
+                        presences=True,
+                    ),
+                    timeout=DISCORD_GUILD_SCAN_TIMEOUT,
+                )
+
+        except TimeoutError:
+            self.logger.warning(
+                f"Guild {guild} did not respond in time with the requested members. Skipping this guild..."
+            )
+
+        return queried_members
+
+    def _serialize_member_presence(
+        self,
+        fetched_members: list[Member],
+        owner: Optional[Any] = None,
+    ) -> None:
+        """
+        Takes a snapshot (PresenceSnapshot) of the activities and the statuses of the member, which replaces the `user_ctx` of the owner.
+
+        Args:
+            fetched_members (list[Member]): The members (from the mutual guilds) that represents the user. This should contain at least one member.
+            owner (Optional[Any], optional): The owner of the snapshot, used by batch mode for the tenants (BadgeTenant). Defaults to self.
+        """
+
+        user_ctx: PresenceSnapshot = self._merge_member_presence(fetched_members)
+
+        if owner is None:
+            owner = self
+            self._last_presence_signature = self._get_presence_signature(user_ctx)
+
+        if not user_ctx.activities:
+            self.logger.warning(
+                f"User {user_ctx.name}#{user_ctx.discriminator} doesn't have any activity."
+            )
+
+        else:
             self.logger.info(
-                "Step 2 of 2 | Finished fetching discord user's rich presence and other activities."
+                f"User {user_ctx.name}#{user_ctx.discriminator} contains {len(user_ctx.activities)} activit%s from {len(fetched_members)} guild/s."
+                % ("y" if not len(user_ctx.activities) > 1 else "ies")
             )
+
+        owner.user_ctx = user_ctx
+
+        self.logger.info(
+            "Step 2 of 2 | Finished fetching discord user's rich presence and other activities."
+        )
+        self.logger.debug(
+            f"User Context Container now contains the following: {owner.user_ctx}"
+        )
+
+    def _merge_member_presence(self, fetched_members: list[Member]) -> PresenceSnapshot:
+        """
+        Merges the presence of the user from the members of every guild into one snapshot.
+
+        The activities of every member are merged, where only the first activity of each type is kept.
+        The member that has the most activities is preferred first, since the presence from the other guilds may be stale or empty.
+
+        Args:
+            fetched_members (list[Member]): The members (from the mutual guilds) that represents the user. This should contain at least one member.
+
+        Returns:
+            PresenceSnapshot: The presence of the user.
+        """
+
+        fetched_members = sorted(
+            fetched_members,
+            key=lambda each_member: (
+                each_member.status is not Status.offline,
+                len(each_member.activities),
+            ),
+            reverse=True,
+        )
+        fetched_member: Member = fetched_members[0]
+        merged_activities: list[Any] = [
+            each_activities
+            for each_member in fetched_members
+            for each_activities in each_member.activities
+        ]
+
+        # ! Keyed by the type of the activity. Only the first activity of each type is kept, since the same activity (or a stale one of the same type) may come from another guild.
+        activities: dict[str, ActivitySnapshot] = {}
+
+        for idx, each_activities in enumerate(merged_activities):
             self.logger.debug(
-                f"User Context Container now contains the following: {self.user_ctx}"
+                f"Activity Assessment {idx + 1}/{len(merged_activities)} | {each_activities}"
             )
 
-        else:
+            # * The type of the activity is resolved by its class, which also tells which fields to extract from it.
+            resolved_activity_name, extractor = get_activity_extractor(
+                type(each_activities)
+            )
 
-            msg: str = "The requested user -> member (from the guild) does not exists! This was already asserted on the previous methods which means this shoudn't happen in the first place. Please contact the developer about this issue, if persists."
-            self.logger.error(msg)
+            if resolved_activity_name in activities:
+                self.logger.debug(
+                    f"Activity {each_activities} is ignored since one data of the same type ({resolved_activity_name}) was already extracted."
+                )
+                continue
 
-            self.print_exception(GithubRunnerLevelMessages.ERROR, msg, None)
-            terminate(ExitReturnCodes.ILLEGAL_CONDITION_EXIT)
+            activities[resolved_activity_name] = extractor(
+                resolved_activity_name, each_activities
+            )
+            self.logger.debug(
+                f"Activity '{resolved_activity_name}' has been extracted!"
+            )
+
+        # As we handle the Activities, we have to handle the state of the user as a fallback output.
+        # ! Other states (per device) may be utilized in the future, they are subject to change.
+        return PresenceSnapshot(
+            fetched_member.id,
+            fetched_member.name,
+            fetched_member.discriminator,
+            tuple(activities.values()),
+            fetched_member.status,  # type: ignore # I didn't expect this one to be different from other Enums.
+            fetched_member.web_status,
+            fetched_member.desktop_status,
+            fetched_member.mobile_status,
+        )
 
     async def _exit_client_on_error(
         self, err_message: str, user_to_dm: Optional[User] = None
@@ -0,0 +1,150 @@
+"""
+Copyright 2021 Janrey "CodexLink" Licas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+	http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from typing import Any, Iterator, Mapping, Optional
+
+from elements.constants import (
+    ENV_STRUCT_CONSTRAINTS,
+    ContextOnSubject,
+    PreferredActivityDisplay,
+    PreferredTimeDisplay,
+)
+from elements.typing import ColorHEX
+
+
+class EnvConfig(Mapping[str, Any]):
+    """
+    The resolved environment (from ENV_STRUCT_CONSTRAINTS), which is frozen once it has been resolved.
+
+    Every option is a slot of its own, which means the options that are read on every run (such as the ones of the render plan and the client) are read as attributes
+    (`envs.DAEMON_MODE`), without looking up a string. The options can still be read by key (`envs["DAEMON_MODE"]`), which is a lookup on the dictionary of the options.
+    Since nothing can modify it, one EnvConfig can be shared by every badge and tenant that resolves to the same options. Changes are made with `replace()`,
+    which returns a new EnvConfig instead.
+    """
+
+    # The slots are declared from ENV_STRUCT_CONSTRAINTS (without the `INPUT_` prefix), so that they can't drift from the options that are resolved.
+    __slots__ = ("_values",) + tuple(
+        each_key.removeprefix("INPUT_") for each_key in ENV_STRUCT_CONSTRAINTS
+    )
+
+    GITHUB_API_URL: str
+    GITHUB_ACTOR: str
+    BADGE_IDENTIFIER_NAME: str
+    COMMIT_MESSAGE: str
+    DISCORD_BOT_TOKEN: str
+    DISCORD_USER_ID: int
+    DISCORD_GUILD_ID: Optional[int]
+    PROFILE_REPOSITORY: Optional[str]
+    URL_TO_REDIRECT_ON_CLICK: Optional[str]
+    WORKFLOW_TOKEN: str
+    CUSTOM_ACTIVITY_STRING: str
+    GAME_ACTIVITY_STRING: str
+    RICH_PRESENCE_STRING: str
+    STREAM_ACTIVITY_STRING: str
+    SPOTIFY_ACTIVITY_STRING: str
+    ONLINE_STATUS_STRING: str
+    IDLE_STATUS_STRING: str
+    DND_STATUS_STRING: str
+    OFFLINE_STATUS_STRING: str
+    CUSTOM_ACTIVITY_COLOR: ColorHEX
+    GAME_ACTIVITY_COLOR: ColorHEX
+    RICH_PRESENCE_COLOR: ColorHEX
+    STREAM_ACTIVITY_COLOR: ColorHEX
+    SPOTIFY_ACTIVITY_COLOR: ColorHEX
+    ONLINE_STATUS_COLOR: ColorHEX
+    IDLE_STATUS_COLOR: ColorHEX
+    DND_STATUS_COLOR: ColorHEX
+    OFFLINE_STATUS_COLOR: ColorHEX
+    STATIC_SUBJECT_STRING: Optional[str]
+    TIME_DISPLAY_SHORTHAND: bool
+    PREFERRED_PRESENCE_CONTEXT: ContextOnSubject
+    TIME_DISPLAY_OUTPUT: PreferredTimeDisplay
+    TIME_DISPLAY_ELAPSED_OVERRIDE_STRING: str
+    TIME_DISPLAY_REMAINING_OVERRIDE_STRING: str
+    PREFERRED_ACTIVITY_TO_DISPLAY: PreferredActivityDisplay
+    SHIFT_STATUS_ACTIVITY_COLORS: bool
+    SPOTIFY_INCLUDE_ALBUM_PLAYLIST_NAME: bool
+    STATUS_CONTEXT_SEPERATOR: Optional[str]
+    BADGE_DEFINITIONS: Optional[str]
+    TARGETED_PRESENCE_FETCH: bool
+    LOW_MEMORY_PROFILE: bool
+    STATE_DIRECTORY: Optional[str]
+    GATEWAY_SESSION_RESUME: bool
+    GATEWAY_SESSION_RESUME_WINDOW: int
+    DAEMON_MODE: bool
+    TENANTS_CONFIG_FILE: Optional[str]
+    IS_DRY_RUN: bool
+
+    def __init__(self, values: Mapping[str, Any]) -> None:
+        """
+        Args:
+            values (Mapping[str, Any]): The resolved environment, where the keys are removed from their `INPUT_` prefix.
+
+        Raises:
+            KeyError: One of the keys is not an option (from ENV_STRUCT_CONSTRAINTS).
+        """
+
+        unknown_options: set[str] = values.keys() - set(EnvConfig.__slots__[1:])
+
+        if unknown_options:
+            raise KeyError(
+                f"{EnvConfig.__name__} has no option/s named {sorted(unknown_options)}."
+            )
+
+        object.__setattr__(self, "_values", dict(values))
+
+        for each_option, each_value in self._values.items():
+            object.__setattr__(self, each_option, each_value)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            f"{EnvConfig.__name__} is frozen, use `replace()` to change {name} instead."
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            f"{EnvConfig.__name__} is frozen, {name} can't be deleted."
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"<{EnvConfig.__name__} {self._values}>"
+
+    def replace(self, **changes: Any) -> "EnvConfig":
+        """
+        Args:
+            **changes (Any): The options to change, keyed by their name.
+
+        Returns:
+            EnvConfig: A copy of this EnvConfig with the changes applied.
+        """
+
+        unknown_options: set[str] = changes.keys() - self._values.keys()
+
+        if unknown_options:
+            raise KeyError(
+                f"{EnvConfig.__name__} has no option/s named {sorted(unknown_options)}."
+            )
+
+        return EnvConfig({**self._values, **changes})
@@ -0,0 +1,53 @@
+"""
+Copyright 2021 Janrey "CodexLink" Licas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+	http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from argparse import Namespace
+from logging import Logger
+from typing import Any
+
+from badge import BadgeConstructor
+from config import EnvConfig
+from presence import PresenceSnapshot
+from utils import UtilityMethods
+
+
+class BadgeDefinition(UtilityMethods, BadgeConstructor):
+    """
+    A child class that represents one of the badges declared under `BADGE_DEFINITIONS`.
+
+    This only constructs the badge. Fetching the README and committing the changes are left to the owner (DiscordActivityBadge or BadgeTenant),
+    which splices every badge of its definitions into one README update. The presence is read from the owner so that every badge renders the same snapshot.
+    """
+
+    def __init__(self, parent: Any, envs: EnvConfig) -> None:
+        """
+        Args:
+            parent (Any): The owner of this badge, which is either the superclass (DiscordActivityBadge) or a tenant (BadgeTenant).
+            envs (EnvConfig): The resolved environment of this badge, from `resolve_badge_definitions()`.
+        """
+
+        self.args: Namespace = parent.args
+        self.envs: EnvConfig = envs
+        self.logger: Logger = parent.logger
+
+        self._parent: Any = parent
+
+    @property
+    def user_ctx(self) -> PresenceSnapshot:  # type: ignore
+        return self._parent.user_ctx
+
+    def __repr__(self) -> str:
+        return f"<{BadgeDefinition.__name__} BADGE_IDENTIFIER_NAME={self.envs['BADGE_IDENTIFIER_NAME']}>"
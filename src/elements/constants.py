@@ -22,7 +22,6 @@ from typing import Any, Final, Optional, TypedDict
 from aiohttp import BasicAuth
 
 from discord import Intents
-from discord.enums import Enum as DiscordEnum
 
 from .typing import (
     BadgeElements,
@@ -31,7 +30,6 @@ from .typing import (
     HttpsURL,
     READMEContent,
     READMEIntegritySHA,
-    RegExp,
 )
 
 # # Badge Generator Constants
@@ -45,16 +43,14 @@ BADGE_BASE_MARKDOWN: BadgeStructure = BadgeStructure(
     "[![{0}]({1})]({2})"
 )  # [0] Represents the Generated Badge, [1] Represents Generate Badge URL, [3] Represents Any Redirect Link
 
-BADGE_REGEX_STRUCT_IDENTIFIER: Final[RegExp] = RegExp(
-    r"(?P<Delimiter>\[\!\[)(?P<badge_identifier>([a-zA-Z0-9_()-]+(\s|\b)){1,6})\]\((?P<badge_url>https://[a-z]+.[a-z]{2,4})/(?P<entrypoint>\w+)/(?P<subject_badge>[^...]+\b)/(?P<status_badge>[^?]+)\?(?P<params>[^)]+)\)\]\((?P<redirect_url>https://[a-z]+.[a-z]{2,4}/[^)]+)\)"
-)
-
-# # Base64 Actions and Related Classiications
-@unique
-class Base64Actions(IntEnum):
-    DECODE_B64_TO_BUFFER = auto()
-    ENCODE_BUFFER_TO_B64 = auto()
+# # Badge Locator Pattern, where `%s` is either the (escaped) identifier of the badge or BADGE_LOCATOR_ANY_IDENTIFIER.
+# * A badge can't span multiple lines, and none of its parts can contain `[` (which is percent-encoded in URLs anyway).
+# ! Which means a failed match can't scan past the next candidate (`[![`), and therefore the lookup stays linear even on near-miss input.
+BADGE_LOCATOR_PATTERN: Final[bytes] = rb"\[!\[(%s)\]\(([^\[)\n]*)\)\]\(([^\[)\n]*)\)"
+BADGE_LOCATOR_ANY_IDENTIFIER: Final[bytes] = rb"[^\[\]\n]*"
 
+# * The badges that were rendered are remembered (per badge) by the fields they display, where the least recently used are evicted past this size.
+BADGE_RENDER_MEMO_SIZE: Final[int] = 32
 
 # # Classified Arguments Information
 ARG_CONSTANTS: Final[dict[str, str]] = {
@@ -76,23 +72,53 @@ DISCORD_CLIENT_INTENTS.guilds = True
 DISCORD_CLIENT_INTENTS.members = True
 DISCORD_CLIENT_INTENTS.presences = True
 
+# * The `members` intent is only needed to cache every member of the guilds, which the low-memory profile doesn't do.
+DISCORD_CLIENT_LOW_MEMORY_INTENTS: Intents = Intents.none()
+DISCORD_CLIENT_LOW_MEMORY_INTENTS.guilds = True
+DISCORD_CLIENT_LOW_MEMORY_INTENTS.presences = True
 
-# # Discord User Client Dictionary Structure
-class DISCORD_USER_STRUCT(TypedDict):
-    id: int
-    name: str
-    discriminator: str  # I don't know why it was declared as `str` when its a 4-digit which should be `int`.
-    statuses: dict[str, DiscordEnum]
-    activities: dict[str, Any]  # To many elements to cover, let it be Any.
+DISCORD_QUERY_MEMBERS_LIMIT: Final[int] = 100  # The maximum number of users that can be requested per guild, per request.
+DISCORD_GUILD_SCAN_CONCURRENCY: Final[int] = 10  # The number of guilds to request the members from at the same time.
+DISCORD_GUILD_SCAN_TIMEOUT: Final[float] = 5.0  # The time budget (in seconds) of each guild to respond with the requested members.
 
+# * Closing the gateway with a code other than 1000 (or 1001) keeps the session resumable.
+GATEWAY_SESSION_CLOSE_CODE: Final[int] = 4000
+GATEWAY_SESSION_FILENAME: Final[str] = "gateway_session.json"
+GATEWAY_SESSION_RESUME_WINDOW: Final[int] = 300  # The default of INPUT_GATEWAY_SESSION_RESUME_WINDOW. Sessions older than this (in seconds) are not attempted, since Discord would most likely reject them.
 
-BLUEPRINT_INIT_VALUES: DISCORD_USER_STRUCT = {
-    "id": 0,
-    "name": "",
-    "discriminator": "",
-    "statuses": {},
-    "activities": {},
-}
+# * Every IDENTIFY consumes one from the bot's daily session starts, and Discord resets the token once they ran out.
+GATEWAY_SESSION_START_LOW_BUDGET: Final[int] = 25  # When the remaining session starts are at or below this, logins are spread out.
+GATEWAY_SESSION_START_SPREAD_WINDOW: Final[float] = 30.0  # The maximum delay (in seconds) of a login when the budget is low.
+GATEWAY_IDENTIFY_INTERVAL: Final[float] = 5.0  # Discord allows `max_concurrency` logins (IDENTIFY) for every interval (in seconds).
+
+# # HTTP Connector Constants
+# * The connector is shared by the ClientSession (Github API) and the Discord Client, so that both share one DNS cache and one pool of kept-alive connections.
+HTTP_CONNECTOR_LIMIT: Final[int] = 100  # The maximum number of connections, regardless of the host.
+HTTP_CONNECTOR_LIMIT_PER_HOST: Final[int] = 10  # Github discourages too many concurrent requests, even on batch mode.
+HTTP_CONNECTOR_KEEPALIVE_TIMEOUT: Final[float] = 60.0  # The time (in seconds) to keep an idle connection, which covers the wait for the presence.
+HTTP_CONNECTOR_DNS_CACHE_TTL: Final[int] = 600  # The time (in seconds) to cache the resolved hosts.
+HTTP_PRECONNECT_TIMEOUT: Final[float] = 5.0  # The time budget (in seconds) to pre-connect to each host.
+
+# # Github API Retry Constants
+# * Retries are spaced with bounded exponential backoff (with full jitter), unless Github tells us when to come back.
+GITHUB_API_RETRY_BASE_DELAY: Final[float] = 1.0  # The delay cap (in seconds) of the first retry, which doubles for every retry after.
+GITHUB_API_RETRY_MAX_DELAY: Final[float] = 60.0  # The maximum delay (in seconds) of the backoff.
+GITHUB_API_RETRY_MAX_ATTEMPTS: Final[int] = 6  # The maximum number of requests per action, including the first one.
+GITHUB_API_RETRY_DEADLINE: Final[float] = 300.0  # The time budget (in seconds) of each action. Retries that would end after this are not attempted.
+GITHUB_API_SECONDARY_RATE_LIMIT_DELAY: Final[float] = 60.0  # Github asks to wait at least a minute when a secondary rate limit has no `Retry-After`.
+
+# * The rate limit of a token resets every hour, and each fetch is usually followed by a commit.
+GITHUB_API_RATE_LIMIT_WINDOW: Final[float] = 3600.0
+GITHUB_API_FETCH_RESERVED_CALLS: Final[int] = 2  # The fetch is only made when there's room for both the fetch and the commit after it.
+
+# * The README is encoded to Base64 by chunks (straight into the payload of the commit), which should be a multiple of 3 so that there's no padding in between.
+GITHUB_API_PAYLOAD_CHUNK_SIZE: Final[int] = 3 * 2 ** 16
+
+# * The README is cached per repository, under the following directory of STATE_DIRECTORY.
+README_CACHE_DIRECTORY: Final[str] = "readme_cache"
+
+# * The last published badge/s are recorded per repository, under the following directory of STATE_DIRECTORY.
+PUBLISHED_BADGES_DIRECTORY: Final[str] = "published_badges"
 
 
 # # Enumerations
@@ -105,6 +131,7 @@ class ContextOnSubject(IntEnum):
 
 class ExitReturnCodes(IntEnum):
     EXIT_HELP: Final[int] = 0
+    SKIPPED_EXIT: Final[int] = 0
     ENV_KEY_DOES_NOT_EXISTS_ON_DICT: Final[int] = 1
     ENV_KEY_DOES_NOT_EXISTS_ON_MACHINE: Final[int] = 1
     EXCEPTION_EXIT: Final[int] = 1
@@ -120,6 +147,15 @@ class GithubRunnerActions(IntEnum):
     COMMIT_CHANGES: int = auto()
 
 
+@unique
+class GithubResponseClass(IntEnum):
+    SUCCESS: int = auto()
+    TRANSIENT: int = auto()  # 5xx and connection errors.
+    RATE_LIMITED: int = auto()  # 403 and 429 from the primary or the secondary rate limit.
+    CONFLICT: int = auto()  # 409, the README was changed after it was fetched.
+    FATAL: int = auto()
+
+
 @unique
 class GithubRunnerLevelMessages(Enum):
     WARNING: Final[str] = "warning"
@@ -160,6 +196,24 @@ class PreferredTimeDisplay(IntEnum):
     SECONDS: int = auto()
 
 
+@unique
+class RunnerStages(IntEnum):
+    ENV_RESOLUTION: int = auto()
+    GATEWAY_READY: int = auto()
+    README_FETCH: int = auto()
+    BADGE_BUILD: int = auto()
+    BADGE_DIFF: int = auto()
+    COMMIT: int = auto()
+
+
+@unique
+class StageStatus(IntEnum):
+    DONE: int = auto()
+    FAILED: int = auto()
+    SKIPPED: int = auto()
+    CANCELLED: int = auto()
+
+
 # # HTTPS Request Header Dictionary Structure
 class REQUEST_HEADER(TypedDict):
     headers: dict[str, str]
@@ -173,6 +227,52 @@ class COMMIT_REQUEST_PAYLOAD(TypedDict):
     committer: Optional[dict[str, str]]
 
 
+# # Stage Scheduler Result Structure
+class STAGE_RESULT_STRUCT(TypedDict):
+    stage: RunnerStages
+    status: StageStatus
+    elapsed: float  # In seconds, from the moment the stage has started.
+    result: Any
+    exception: Optional[BaseException]
+
+
+# # Badge Location Structure, the offsets (in bytes) of a badge inside the README.
+class BADGE_LOCATION_STRUCT(TypedDict):
+    start: int
+    end: int  # Exclusive, which means this is where the content after the badge starts.
+
+
+# # Gateway Session Structure, persisted under STATE_DIRECTORY to RESUME on the next run.
+class GATEWAY_SESSION_STRUCT(TypedDict):
+    session_id: str
+    sequence: Optional[int]
+    gateway: str
+    saved_at: float  # In seconds, since epoch.
+
+
+# # README Cache Structure, persisted under STATE_DIRECTORY (along with the README itself) to fetch the README conditionally.
+class README_CACHE_STRUCT(TypedDict):
+    etag: str
+    sha: str  # The git blob SHA-1 of the cached README, which is also used to verify it.
+
+
+# # Published Badges Structure, persisted under STATE_DIRECTORY to skip Github entirely when the badge/s did not change.
+class PUBLISHED_BADGES_STRUCT(TypedDict):
+    badges: dict[str, str]  # The markdown of every badge, keyed by their identifier.
+    sha: str  # The git blob SHA-1 of the README that contains the badge/s.
+    presence_digest: str  # The SHA-1 of the presence that the badge/s were rendered from.
+    signature_digests: dict[str, str]  # The SHA-1 of the signature (without the time) of every badge, keyed by their identifier.
+    published_at: float  # In seconds, since epoch.
+
+
+# # Session Start Limit Structure, from Discord's `GET /gateway/bot`.
+class GATEWAY_SESSION_START_LIMIT_STRUCT(TypedDict):
+    total: int
+    remaining: int
+    reset_after: int  # In milliseconds.
+    max_concurrency: int
+
+
 # # Logger Constants
 ROOT_LOCATION: Final[str] = "../"
 ENV_FILENAME: Final[str] = ".env"
@@ -219,6 +319,11 @@ ENV_STRUCT_CONSTRAINTS: Final[  # * If you have been referred to action.yml, thi
         "fallback_value": None,
         "is_required": True,
     },
+    "INPUT_DISCORD_GUILD_ID": {
+        "expected_type": int,
+        "fallback_value": None,
+        "is_required": False,
+    },
     "INPUT_PROFILE_REPOSITORY": {
         "expected_type": str,
         "fallback_value": None,
@@ -377,6 +482,47 @@ ENV_STRUCT_CONSTRAINTS: Final[  # * If you have been referred to action.yml, thi
         "fallback_value": None,
         "is_required": False,
     },
+    "INPUT_BADGE_DEFINITIONS": {
+        "expected_type": str,
+        "fallback_value": None,
+        "is_required": False,
+    },
+    # # Optional Parameters — Runtime
+    "INPUT_TARGETED_PRESENCE_FETCH": {
+        "expected_type": bool,
+        "fallback_value": False,
+        "is_required": False,
+    },
+    "INPUT_LOW_MEMORY_PROFILE": {
+        "expected_type": bool,
+        "fallback_value": False,
+        "is_required": False,
+    },
+    "INPUT_STATE_DIRECTORY": {
+        "expected_type": str,
+        "fallback_value": None,
+        "is_required": False,
+    },
+    "INPUT_GATEWAY_SESSION_RESUME": {
+        "expected_type": bool,
+        "fallback_value": False,
+        "is_required": False,
+    },
+    "INPUT_GATEWAY_SESSION_RESUME_WINDOW": {
+        "expected_type": int,
+        "fallback_value": GATEWAY_SESSION_RESUME_WINDOW,
+        "is_required": False,
+    },
+    "INPUT_DAEMON_MODE": {
+        "expected_type": bool,
+        "fallback_value": False,
+        "is_required": False,
+    },
+    "INPUT_TENANTS_CONFIG_FILE": {
+        "expected_type": str,
+        "fallback_value": None,
+        "is_required": False,
+    },
     # # Development Parameters
     "INPUT_IS_DRY_RUN": {
         "expected_type": bool,
@@ -385,5 +531,21 @@ ENV_STRUCT_CONSTRAINTS: Final[  # * If you have been referred to action.yml, thi
     },
 }
 
+# * These keys are expected to be declared per tenant on batch mode, and therefore are not required in the environment.
+TENANT_SCOPED_ENV_KEYS: Final[tuple[str, ...]] = ("DISCORD_USER_ID",)
+
 # # Time Constants
-TIME_STRINGS: list[str] = ["hours", "minutes", "seconds"]
+# * Every unit of the displayed time, as (size in seconds, singular, plural, shorthand). These are never modified since they are shared by every render.
+TIME_UNITS: Final[dict[str, tuple[int, str, str, str]]] = {
+    "hours": (3600, "hour", "hours", "h"),
+    "minutes": (60, "minute", "minutes", "m"),
+    "seconds": (1, "second", "seconds", "s"),
+}
+
+# * The units to display for every option of `TIME_DISPLAY_OUTPUT`, from the largest to the smallest.
+TIME_DISPLAY_UNITS: Final[dict[PreferredTimeDisplay, tuple[str, ...]]] = {
+    PreferredTimeDisplay.HOURS: ("hours",),
+    PreferredTimeDisplay.HOURS_MINUTES: ("hours", "minutes"),
+    PreferredTimeDisplay.MINUTES: ("minutes",),
+    PreferredTimeDisplay.SECONDS: ("seconds",),
+}
@@ -0,0 +1,52 @@
+"""
+Copyright 2021 Janrey "CodexLink" Licas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+	http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from typing import Any
+
+
+# # Stage Exceptions
+# * These are raised inside of the stages (see StageScheduler), which marks the stage as FAILED instead of terminating the whole run.
+class RunnerError(Exception):
+    pass
+
+
+class DiscordClientExitedError(RunnerError):
+    pass
+
+
+class GithubAPIError(RunnerError):
+    """
+    The request to Github API has failed and cannot be retried any further.
+
+    Attributes:
+        action (GithubRunnerActions): The action of the request.
+        response_class (GithubResponseClass): How the last response was classified.
+    """
+
+    def __init__(self, message: str, action: Any, response_class: Any) -> None:
+        super().__init__(message)
+        self.action = action
+        self.response_class = response_class
+
+
+class GithubAPIConflictError(GithubAPIError):
+    # The README has been changed (409 Conflict) while the badge was being constructed, which means the README has to be fetched again.
+    pass
+
+
+class BadgeConstructionError(RunnerError):
+    # The badge cannot be constructed from the environment or the presence, which is most likely an issue from the developer.
+    pass
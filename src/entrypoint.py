@@ -16,21 +16,37 @@ limitations under the License.
 
 from asyncio import (
 	AbstractEventLoop,
+	CancelledError,
 	Task,
-	all_tasks,
 	create_task,
-	current_task,
 	gather,
 	get_event_loop,
 	sleep,
 	wait,
 )
-from typing import Any, Generator, Set
+from os import _exit as terminate
+from sys import platform
+from typing import Any, Generator
+
+try:
+	from resource import RUSAGE_SELF, getrusage
+
+except ImportError:
+	getrusage = None  # type: ignore
 
 from api import AsyncGithubAPILite
 from badge import BadgeConstructor
 from client import DiscordClientHandler
-from elements.constants import ENV_FILENAME, GithubRunnerActions
+from definition import BadgeDefinition
+from elements.constants import (
+	ENV_FILENAME,
+	ExitReturnCodes,
+	GithubRunnerLevelMessages,
+	RunnerStages,
+	StageStatus,
+)
+from scheduler import StageScheduler
+from tenant import BadgeTenant
 from utils import UtilityMethods
 
 
@@ -70,104 +86,227 @@ class DiscordActivityBadge(
 				f"Running local mode invocation not detected. Skipping checks for '{ENV_FILENAME}'."
 			)
 
-		# Once the extra step is done or skipped, evaluate the envs for other modules to use.
+		# Once the extra step is done or skipped, evaluate the envs for other modules to use. This stage is declared alone since the rest of the stages depends on the mode it resolves.
+		self.stages: StageScheduler = StageScheduler(self.logger)
+		self.failed_tenants: dict[BadgeTenant, str] = {}  # * Filled on batch mode, along with the reason why each tenant was not served.
+		self.stages.add_stage(RunnerStages.ENV_RESOLUTION, self._prepare_runtime)
+		await self.stages.run()
+
+		if (
+			self.stages.results[RunnerStages.ENV_RESOLUTION]["status"]
+			is not StageStatus.DONE
+		):
+			msg: str = f"The runtime cannot be prepared, there's nothing left to do. | Info: {self.stages.results[RunnerStages.ENV_RESOLUTION]['exception']}"
+			self.logger.critical(msg)
+
+			self.print_exception(GithubRunnerLevelMessages.ERROR, msg, None)
+			terminate(ExitReturnCodes.ILLEGAL_CONDITION_EXIT)
+
+		if self.envs["TENANTS_CONFIG_FILE"]:
+			await self.__batch__()
+
+		elif self.envs["DAEMON_MODE"]:
+			await self.__daemon__()
+
+		else:
+			await self.update_readme_badge(self.stages)
+
+		await self.__end__()  # Once every stage is done, await `__end__` to close the sessions and display the result of the stages.
+
+	async def _prepare_runtime(self) -> None:
+		"""
+		Resolves the environment variables, instantiates the other subclasses and then starts the Discord Client on the background.
+		"""
+
+		# The connections are established on the background while the rest of the runtime is being prepared.
+		super()._prepare_connector()
+		await sleep(0)  # * Yields once, so that the pre-connections (which were just created) start before the blocking part of the preparation. The requests wait for them with `_wait_for_preconnect()`.
+
 		super().resolve_envs()
 
+		# The low-memory profile doesn't cache the members of the guilds, so the tracked users have to be requested instead.
+		if self.envs["LOW_MEMORY_PROFILE"] and not self.envs["TARGETED_PRESENCE_FETCH"]:
+			self.logger.warning(
+				"Low-memory profile requires the targeted presence fetch since the members are not cached when connecting. Enabling TARGETED_PRESENCE_FETCH..."
+			)
+			self.envs = self.envs.replace(TARGETED_PRESENCE_FETCH=True)
+
+		# After resuming, nothing is cached from the previous run. Which means the pinned guild is the only guild we know where to request the presence from.
+		if self.envs["GATEWAY_SESSION_RESUME"] and not (
+			self.envs["STATE_DIRECTORY"] and self.envs["DISCORD_GUILD_ID"]
+		):
+			self.logger.warning(
+				"Gateway session resume requires both STATE_DIRECTORY and DISCORD_GUILD_ID to be declared. Disabling GATEWAY_SESSION_RESUME..."
+			)
+			self.envs = self.envs.replace(GATEWAY_SESSION_RESUME=False)
+
 		# Since every pre-requisite methods were done loading, we have to instantiate other subclasses to load other assets.
-		self._cascade_init_cls: Task = create_task(  # (5)
-			super().__ainit__(),
-			name="Classes_AsyncGithubAPI_Child_Initialization",
+		await super().__ainit__()  # (5)
+
+		# Without any badge definitions, the superclass is the only badge to construct.
+		self.badge_definitions: list[Any] = (
+			[
+				BadgeDefinition(self, each_envs)
+				for each_envs in super().resolve_badge_definitions()
+			]
+			if self.envs["BADGE_DEFINITIONS"]
+			else [self]
 		)
 
-		# # The two tasks (`discord_client_task` and `readme_data`) is supposed to be a pair or in `gather()` but they are seperated
-		# # because of static cooperative await. Meaning some `await wait()` is waiting at certain codeblocks.
+		# The tenants borrow the ClientSession, and they should be known before the Discord Client is ready.
+		if self.envs["TENANTS_CONFIG_FILE"]:
+			self.tenants = [
+				BadgeTenant(self, each_source, each_envs)
+				for each_source, each_envs in super().resolve_tenants()
+			]
+
 		self.discord_client_task: Task = create_task(
 			self.start(self.envs["DISCORD_BOT_TOKEN"]),
 			name="DiscordClient_UserFetching",
 		)  # * Load the Discord Client so that it can take some time while we load other stuff.
 
-		self.readme_data: Task = create_task(
-			self.exec_api_actions(GithubRunnerActions.FETCH_README),
-			name="GithubAPI_README_Fetching",
-		)  # * Fetch README (expects Base64String from result())
+	async def __batch__(self) -> None:
+		"""
+		Serves every tenant declared under `TENANTS_CONFIG_FILE` with one Discord Client and one ClientSession.
+		Each tenant fetches its README as soon as possible, and then constructs its badge once the Discord Client has fetched every tenant's presence.
+		"""
 
-		self.badge_task: Task = create_task(
-			self.construct_badge(), name="BadgeConstructor_Construct"
-		)  # * Runs badge construction and wait for Task `discord_client_task` to finish before continuing.
+		if self.envs["DAEMON_MODE"]:
+			self.logger.warning(
+				"Daemon mode is not supported on batch mode. The Discord Client will be closed after the tenants were served."
+			)
+			self.envs = self.envs.replace(DAEMON_MODE=False)
 
-		# Implicitly declare this wait instead of inside of the method. There's nothing much to do (in `badge_updater`) while we wait to fetch README data.
-		await wait({self.readme_data})
+		tenant_tasks: dict[BadgeTenant, Task] = {
+			each_tenant: create_task(
+				each_tenant.update_readme_badge(),
+				name=f"Tenant_{each_tenant.envs['DISCORD_USER_ID']}_README_BadgeUpdater",
+			)
+			for each_tenant in self.tenants
+		}
 
-		badge_updater: Task = create_task(
-			self.check_and_update_badge(self.readme_data.result()[1]),
-			name="README_BadgeChecker_Updater",
-		)  # ! Once we got the README, check it and wait for Task `badge_task` to finish before checking if changes is required to commit.
+		await self.presence_ready.wait()
 
-		# Voluntarily invoke this `wait` outside of method `exec_api_action` to avoid confusion due to abstraction.
-		await wait({badge_updater})
+		# Tenants that were not found from any guild will wait forever, so cancel them.
+		for each_tenant, each_task in tenant_tasks.items():
+			if not each_tenant.presence_ready.is_set():
+				each_task.cancel()
 
-		if not getattr(self.args, "do_not_commit") and not self.envs["IS_DRY_RUN"]:
-			create_task(
-				self.exec_api_actions(
-					GithubRunnerActions.COMMIT_CHANGES,
-					data=[self.readme_data.result()[0], badge_updater.result()],
+		tenant_results: list[Any] = await gather(
+			*tenant_tasks.values(), return_exceptions=True
+		)
+
+		# * Each tenant fails on its own (the failures are contained in its stages), which means the rest of the tenants are still served.
+		# A tenant is considered served when it has reached the last stage, regardless if there's something to commit or not.
+		# Tenants whose badge/s are the same as the last published badge/s stop at BADGE_BUILD.
+		for each_tenant, each_result in zip(tenant_tasks, tenant_results):
+			if isinstance(each_result, CancelledError):
+				self.failed_tenants[each_tenant] = "The presence was not found from any guild."
+
+			elif isinstance(each_result, BaseException):
+				self.failed_tenants[each_tenant] = f"{type(each_result).__name__}: {each_result}"
+
+			elif (
+				each_result.get(RunnerStages.COMMIT, each_result[RunnerStages.BADGE_BUILD])["status"]
+				is not StageStatus.DONE
+			):
+				self.failed_tenants[each_tenant] = ", ".join(
+					f"{each_stage.name} -> {each_stage_result['status'].name}%s"
+					% (
+						f" ({type(each_stage_result['exception']).__name__}: {each_stage_result['exception']})"
+						if each_stage_result["exception"] is not None
+						else ""
+					)
+					for each_stage, each_stage_result in each_result.items()
+					if each_stage_result["status"] is not StageStatus.DONE
 				)
-			)
 
-		else:
-			self.logger.warning(
-				"Argument -dnc / --do-not-commit was invoked, will skip updating README."
-			)
+		for each_tenant, each_reason in self.failed_tenants.items():
+			self.logger.error(f"Tenant {each_tenant} was not served. | Info: {each_reason}")
 
-		await self.__end__()  # Once every task/s is done spawning in the loop, await `__end__` to show the status of the tasks whenever there's a blank space in runtime.
+		n_served: int = len(tenant_results) - len(self.failed_tenants)
+		self.logger.info(
+			f"Batch mode is done. {n_served} of {len(tenant_results)} tenant/s were served, {len(self.failed_tenants)} have failed."
+		)
+
+	async def __daemon__(self) -> None:
+		"""
+		Keeps the process alive for as long as the Discord Client is connected, re-running the badge update cycle whenever the presence of the user changes.
+		"""
+
+		self.logger.info(
+			"Running in daemon mode. The badge will be updated whenever the user's presence changes."
+		)
+
+		presence_watcher: Task = create_task(
+			self._watch_presence_changes(), name="DiscordClient_PresenceWatcher"
+		)
+
+		await wait({self.discord_client_task})  # * This only finishes when the client has been closed or has been disconnected for good.
+		presence_watcher.cancel()
+
+		self.logger.info("Discord Client has been closed. Leaving daemon mode...")
+
+	async def _watch_presence_changes(self) -> None:
+		"""
+		Waits for `presence_changed` and runs the update cycle for every change. Changes that arrive while a cycle is running are coalesced into the next cycle.
+		"""
+
+		while True:
+			await self.presence_changed.wait()
+			self.presence_changed.clear()
+
+			await self.update_readme_badge()
 
 	async def __end__(self) -> None:
 		"""
-		A method that handles the script whenever it waits for any other tasks to finish.
+		A method that closes the sessions once every stage is done, and then displays the result of each stage.
 		"""
 
-		self.logger.info("Done loading modules and necessary elements for the process.")
-		prev_tasks: Set[Any] = set({})
+		self.logger.info("All stages were finished! Closing Client Sessions...")
 
-		while True:  # We do infinite loop while we wait for other tasks to finish.
+		await gather(
+			self.close(), self._api_session.close()
+		)  # Discord API and aiohttp.ClientSession.
+		await wait({self.discord_client_task})  # * Let the client finish its own cleanup before the loop closes.
+		await self._api_connector.shutdown()  # ! Both sessions were closed at this point, which means nothing uses the connector anymore.
 
-			if (
-				len(all_tasks()) <= 1
-			):  # If thre are no other tasks aside from the loop (it's considered a task) then end the loop by closing other sessions.
-				self.logger.info(
-					"All tasks successfully finished! Closing Client Sessions..."
-				)
+		self.logger.info(
+			"Connection Sessions were successfully closed. (Discord Client, Github API and their shared connector)"
+		)
 
-				await gather(
-					self.close(), self._api_session.close()
-				)  # Discord API and aiohttp.ClientSession.
-				self.logger.info(
-					"Connection Sessions were successfully closed. (Discord Client and Github API)"
-				)
+		for each_stage, each_result in self.stages.results.items():
+			self.logger.debug(
+				f"Stage Result | {each_stage.name} -> {each_result['status'].name} ({each_result['elapsed']:.3f}s)"
+			)
 
-				break
+		# ! `resource` is only available on Unix, which is where the container runs.
+		if getrusage is not None:
+			self.logger.info(
+				f"Peak Memory Usage (RSS) of this run: {getrusage(RUSAGE_SELF).ru_maxrss / (1024 if platform == 'darwin' else 1) / 1024:.2f} MiB."
+			)
 
-			# * Otherwise, we display a string (non-redundantly) that counts the number of remaining tasks in the loop.
-			tasks: Set[Task] = all_tasks()
-			n_tasks: int = len(tasks)
+		# The sessions are closed before exiting, so that the failures can't leave anything behind.
+		failed_stages: dict[str, str] = {
+			each_stage.name: f"{type(each_result['exception']).__name__}: {each_result['exception']}"
+			for each_stage, each_result in self.stages.results.items()
+			if each_result["status"] is StageStatus.FAILED
+		}
 
-			try:
-				if (
-					prev_tasks != tasks
-				):  # * We also check by the context of all_tasks() if they were in the same length as before but different context, inevitably display it redundantly.
-					self.logger.info(
-						f"{n_tasks} task/s left to finish the runtime process."
-					)
-					prev_tasks = tasks
-					self.logger.debug(
-						f"Current Task: {current_task()} | Other Task/s in Queue | {all_tasks()}"
-					)
-			except TypeError:
-				prev_tasks = tasks
+		if failed_stages:
+			msg: str = f"Stage/s {list(failed_stages)} have failed, the badge/s may not be up to date. | Info: {failed_stages}"
+			self.logger.critical(msg)
+
+			self.print_exception(GithubRunnerLevelMessages.ERROR, msg, None)
+			terminate(ExitReturnCodes.EXCEPTION_EXIT)
+
+		# * The failed tenants were already logged by `__batch__()`, after the rest of the tenants were served. This only decides the exit code.
+		if self.failed_tenants:
+			msg = f"{len(self.failed_tenants)} tenant/s have failed, their badge/s may not be up to date. | Info: {list(self.failed_tenants)}"
+			self.logger.critical(msg)
 
-			await sleep(
-				0
-			)  # We don't need await for certain n of time, we just let other tasks do their own job without disruption from this sleep.
+			self.print_exception(GithubRunnerLevelMessages.ERROR, msg, None)
+			terminate(ExitReturnCodes.EXCEPTION_EXIT)
 
 
 # # Entrypoint Code
@@ -0,0 +1,344 @@
+"""
+Copyright 2021 Janrey "CodexLink" Licas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+	http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from typing import Any, Callable, Mapping, Optional
+
+from discord import Activity, CustomActivity, Game, Spotify, Status, Streaming
+
+from elements.constants import PreferredActivityDisplay
+from elements.typing import ActivityDictName
+
+
+class _FrozenSnapshot:
+    """
+    The base of the snapshots, which compares and hashes them by their fields (`__slots__`, in order).
+
+    Snapshots can't be modified once they were made, which lets them be shared without copying them.
+    The hash is computed once since every snapshot is compared at least once (such as against the last snapshot).
+    """
+
+    __slots__ = ("_hash",)
+
+    # The slots are set through their descriptors, since `__setattr__` is disabled. These are resolved once for every subclass.
+    _field_setters: tuple[Callable[[Any, Any], None], ...] = ()
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        cls._field_setters = tuple(
+            cls.__dict__[each_field].__set__ for each_field in cls.__slots__
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen, {name} can't be set.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            f"{type(self).__name__} is frozen, {name} can't be deleted."
+        )
+
+    def _set_fields(self, *values: Any) -> None:
+        for each_setter, each_value in zip(self._field_setters, values):
+            each_setter(self, each_value)
+
+        object.__setattr__(self, "_hash", hash(values))
+
+    def astuple(self) -> tuple[Any, ...]:
+        """
+        Returns:
+            tuple[Any, ...]: The fields of the snapshot (in order), where the nested snapshots are converted as well.
+        """
+
+        return tuple(
+            self._astuple_value(getattr(self, each_field))
+            for each_field in type(self).__slots__
+        )
+
+    @staticmethod
+    def _astuple_value(value: Any) -> Any:
+        if isinstance(value, _FrozenSnapshot):
+            return value.astuple()
+
+        if type(value) is tuple:
+            return tuple(map(_FrozenSnapshot._astuple_value, value))
+
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return self._hash == other._hash and all(  # type: ignore
+            getattr(self, each_field) == getattr(other, each_field)
+            for each_field in type(self).__slots__
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return "<%s %s>" % (
+            type(self).__name__,
+            " ".join(
+                "%s=%r" % (each_field, getattr(self, each_field))
+                for each_field in type(self).__slots__
+            ),
+        )
+
+
+class ActivitySnapshot(_FrozenSnapshot):
+    """
+    An activity of the user, reduced to the fields that can be displayed on the badge.
+
+    The timestamps are kept in milliseconds since epoch (as given by Discord), and the strings are left empty when the activity doesn't have them.
+    """
+
+    __slots__ = ("kind", "name", "state", "details", "large_text", "start", "end")
+
+    kind: ActivityDictName
+    name: str
+    state: str
+    details: str
+    large_text: str
+    start: Optional[int]
+    end: Optional[int]
+
+    def __init__(
+        self,
+        kind: ActivityDictName,
+        name: str = "",
+        state: str = "",
+        details: str = "",
+        large_text: str = "",
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            kind (ActivityDictName): The type of the activity, which is one of the names in PreferredActivityDisplay.
+            name (str, optional): The name of the activity. Defaults to "".
+            state (str, optional): The state of the activity, which is the text of the custom activity. Defaults to "".
+            details (str, optional): The details of the activity, which is the title of the song on Spotify. Defaults to "".
+            large_text (str, optional): The text of the large image, which is the album on Spotify. Defaults to "".
+            start (Optional[int], optional): When the activity has started. Defaults to None.
+            end (Optional[int], optional): When the activity will end. Defaults to None.
+        """
+
+        self._set_fields(kind, name, state, details, large_text, start, end)
+
+
+class PresenceSnapshot(_FrozenSnapshot):
+    """
+    The presence of the user (its activities and statuses), reduced to the fields that can be displayed on the badge.
+
+    A new snapshot is made for every presence that was fetched, which replaces the last one instead of modifying it.
+    Since the snapshots are immutable and hashable, they can be shared by every badge (and tenant) that renders them, and compared against the last snapshot cheaply.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "discriminator",
+        "activities",
+        "status",
+        "on_web",
+        "on_desktop",
+        "on_mobile",
+    )
+
+    id: int
+    name: str
+    discriminator: str
+    activities: tuple[ActivitySnapshot, ...]
+    status: Status
+    on_web: Status
+    on_desktop: Status
+    on_mobile: Status
+
+    def __init__(
+        self,
+        id: int = 0,
+        name: str = "",
+        discriminator: str = "",
+        activities: tuple[ActivitySnapshot, ...] = (),
+        status: Status = Status.offline,
+        on_web: Status = Status.offline,
+        on_desktop: Status = Status.offline,
+        on_mobile: Status = Status.offline,
+    ) -> None:
+        """
+        Args:
+            id (int, optional): The ID of the user. Defaults to 0.
+            name (str, optional): The name of the user. Defaults to "".
+            discriminator (str, optional): The 4-digit discriminator of the user. Defaults to "".
+            activities (tuple[ActivitySnapshot, ...], optional): The activities of the user, where there's only one activity for each type. Defaults to ().
+            status (Status, optional): The status of the user. Defaults to Status.offline.
+            on_web (Status, optional): The status of the user on the web client. Defaults to Status.offline.
+            on_desktop (Status, optional): The status of the user on the desktop client. Defaults to Status.offline.
+            on_mobile (Status, optional): The status of the user on the mobile client. Defaults to Status.offline.
+        """
+
+        self._set_fields(
+            id,
+            name,
+            discriminator,
+            activities,
+            status,
+            on_web,
+            on_desktop,
+            on_mobile,
+        )
+
+    def get_activity(self, kind: str) -> Optional[ActivitySnapshot]:
+        """
+        Args:
+            kind (str): The type of the activity, which is one of the names in PreferredActivityDisplay.
+
+        Returns:
+            Optional[ActivitySnapshot]: The activity of the given type, or None when the user doesn't have one.
+        """
+
+        for each_activity in self.activities:
+            if each_activity.kind == kind:
+                return each_activity
+
+        return None
+
+
+# # Activity Extractors
+# * Each type of activity is dispatched (by its class) to an extractor, which reads the fields of that type only. See `get_activity_extractor()`.
+ActivityExtractor = Callable[[ActivityDictName, Any], ActivitySnapshot]
+
+ACTIVITY_EXTRACTORS: dict[type, tuple[ActivityDictName, ActivityExtractor]] = {}
+
+
+def _extracts(
+    activity_type: type, kind: PreferredActivityDisplay
+) -> Callable[[ActivityExtractor], ActivityExtractor]:
+    def register(extractor: ActivityExtractor) -> ActivityExtractor:
+        ACTIVITY_EXTRACTORS[activity_type] = (ActivityDictName(kind.name), extractor)
+        return extractor
+
+    return register
+
+
+def _get_epoch_ms(timestamps: Mapping[str, Any], key: str) -> Optional[int]:
+    # ! Discord gives the timestamps in milliseconds, which may be left out (or zero) when the activity doesn't have them.
+    epoch_ms: Any = timestamps.get(key)
+    return int(epoch_ms) if epoch_ms else None
+
+
+@_extracts(Activity, PreferredActivityDisplay.RICH_PRESENCE)
+def _extract_rich_presence(kind: ActivityDictName, activity: Any) -> ActivitySnapshot:
+    return ActivitySnapshot(
+        kind,
+        activity.name or "",
+        activity.state or "",
+        activity.details or "",
+        activity.large_image_text or "",
+        _get_epoch_ms(activity.timestamps, "start"),
+        _get_epoch_ms(activity.timestamps, "end"),
+    )
+
+
+@_extracts(Game, PreferredActivityDisplay.GAME_ACTIVITY)
+def _extract_game(kind: ActivityDictName, activity: Any) -> ActivitySnapshot:
+    # ! The timestamps of Game and Spotify are only exposed as (naive) datetimes, which costs more to convert back than the rest of the extraction.
+    return ActivitySnapshot(
+        kind,
+        str(activity.name),
+        start=int(activity._start) or None,
+        end=int(activity._end) or None,
+    )
+
+
+@_extracts(CustomActivity, PreferredActivityDisplay.CUSTOM_ACTIVITY)
+def _extract_custom_activity(kind: ActivityDictName, activity: Any) -> ActivitySnapshot:
+    # ! The text of the custom activity is its name, which is displayed as its state.
+    return ActivitySnapshot(kind, state=str(activity.name or activity.state or ""))
+
+
+@_extracts(Spotify, PreferredActivityDisplay.SPOTIFY_ACTIVITY)
+def _extract_spotify(kind: ActivityDictName, activity: Any) -> ActivitySnapshot:
+    return ActivitySnapshot(
+        kind,
+        activity.name,
+        activity.artist or "",
+        activity.title or "",
+        activity.album or "",
+        _get_epoch_ms(activity._timestamps, "start"),
+        _get_epoch_ms(activity._timestamps, "end"),
+    )
+
+
+@_extracts(Streaming, PreferredActivityDisplay.STREAM_ACTIVITY)
+def _extract_stream(kind: ActivityDictName, activity: Any) -> ActivitySnapshot:
+    return ActivitySnapshot(
+        kind,
+        activity.name or "",
+        activity.game or "",
+        activity.details or "",
+        (activity.assets or {}).get("large_text") or "",
+    )
+
+
+def _extract_unknown_activity(
+    kind: ActivityDictName, activity: Any
+) -> ActivitySnapshot:
+    # The fields are looked up loosely, since there's no telling which of them exists.
+    return ActivitySnapshot(
+        kind,
+        str(getattr(activity, "name", None) or ""),
+        str(getattr(activity, "state", None) or ""),
+        str(getattr(activity, "details", None) or ""),
+        start=_get_epoch_ms(getattr(activity, "timestamps", None) or {}, "start"),
+        end=_get_epoch_ms(getattr(activity, "timestamps", None) or {}, "end"),
+    )
+
+
+def get_activity_extractor(
+    activity_type: type,
+) -> tuple[ActivityDictName, ActivityExtractor]:
+    """
+    Looks up the extractor of the activity type, which is resolved once for every type.
+
+    Subclasses are resolved to the extractor of their closest registered class. Types that are unknown (such as the ones added by a newer `discord.py`)
+    are resolved to a loose extractor instead, which displays them as a rich presence.
+
+    Args:
+        activity_type (type): The class of the activity.
+
+    Returns:
+        tuple[ActivityDictName, ActivityExtractor]: The type of the activity (one of the names in PreferredActivityDisplay) and its extractor.
+    """
+
+    try:
+        return ACTIVITY_EXTRACTORS[activity_type]
+
+    except KeyError:
+        resolved: tuple[ActivityDictName, ActivityExtractor] = next(
+            (
+                ACTIVITY_EXTRACTORS[each_cls]
+                for each_cls in activity_type.__mro__
+                if each_cls in ACTIVITY_EXTRACTORS
+            ),
+            (
+                ActivityDictName(PreferredActivityDisplay.RICH_PRESENCE.name),
+                _extract_unknown_activity,
+            ),
+        )
+
+        ACTIVITY_EXTRACTORS[activity_type] = resolved
+        return resolved
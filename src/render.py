@@ -0,0 +1,519 @@
+"""
+Copyright 2021 Janrey "CodexLink" Licas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+	http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Hashable, Optional
+from urllib.parse import quote
+
+from discord import Status
+
+from config import EnvConfig
+from elements.constants import (
+    BADGE_BASE_MARKDOWN,
+    BADGE_BASE_SUBJECT,
+    BADGE_BASE_URL,
+    BADGE_ICON,
+    BADGE_NO_COLOR_DEFAULT,
+    BADGE_REDIRECT_BASE_DOMAIN,
+    TIME_DISPLAY_UNITS,
+    TIME_UNITS,
+    ContextOnSubject,
+    PreferredActivityDisplay,
+    PreferredTimeDisplay,
+)
+from elements.typing import (
+    ActivityDictName,
+    BadgeElements,
+    BadgeStructure,
+    ColorHEX,
+    HttpsURL,
+)
+from presence import ActivitySnapshot, PresenceSnapshot
+
+
+class ElapsedTimeFormatter:
+    """
+    Formats the elapsed time of an activity in the units of `TIME_DISPLAY_OUTPUT`, as in `2 hours 15 minutes elapsed.`
+
+    The unit strings are resolved once (per shorthand and plural), which leaves `format()` with integer arithmetic. Nothing is modified after it was compiled,
+    which means one formatter can be shared by every render, even concurrently.
+    """
+
+    __slots__ = ("resolution", "units", "suffix")
+
+    def __init__(
+        self, time_display: PreferredTimeDisplay, is_shorthand: bool, suffix: str
+    ) -> None:
+        """
+        Args:
+            time_display (PreferredTimeDisplay): The units to display, which should not be `TIME_DISABLED`.
+            is_shorthand (bool): Whether the units are displayed in their shorthand (such as `h`) or not.
+            suffix (str): The string to append after the time, from `TIME_DISPLAY_ELAPSED_OVERRIDE_STRING`.
+        """
+
+        unit_names: tuple[str, ...] = TIME_DISPLAY_UNITS[time_display]
+
+        # The time is counted in the smallest unit to display, and every unit is sized relative to it.
+        self.resolution: int = TIME_UNITS[unit_names[-1]][0]
+        self.units: tuple[tuple[int, str, str], ...] = tuple(
+            (
+                unit_size // self.resolution,
+                " %s" % (shorthand if is_shorthand else singular),
+                " %s" % (shorthand if is_shorthand else plural),
+            )
+            for unit_size, singular, plural, shorthand in (
+                TIME_UNITS[each_unit] for each_unit in unit_names
+            )
+        )
+        self.suffix: str = " %s" % suffix
+
+    def format(self, elapsed_seconds: float) -> Optional[str]:
+        """
+        Args:
+            elapsed_seconds (float): The elapsed time, in seconds.
+
+        Returns:
+            Optional[str]: The elapsed time in the units to display, or None when it's less than the smallest unit.
+        """
+
+        time_left: int = int(elapsed_seconds) // self.resolution
+
+        if time_left < 1:
+            return None
+
+        time_parts: list[str] = []
+
+        for unit_size, singular, plural in self.units:
+            unit_value, time_left = divmod(time_left, unit_size)
+
+            if unit_value:
+                time_parts.append(
+                    "%i%s" % (unit_value, singular if unit_value == 1 else plural)
+                )
+
+        return " ".join(time_parts) + self.suffix
+
+
+class BadgeRenderPlan:
+    """
+    The options of a badge (from the resolved environment) compiled into the strings, colors and separators that the badge is rendered with.
+
+    The plan is compiled once per badge, which leaves `render()` with the parts that depend on the presence. This means rendering does no key formatting nor enum lookups,
+    and the plan itself is never modified after it was compiled. Keys that are missing from the environment are left out of the tables, which means rendering a badge that
+    needs them raises a KeyError, the same way as looking them up from the environment does.
+    """
+
+    __slots__ = (
+        "markdown_prefix",
+        "markdown_suffix",
+        "preferred_activity",
+        "static_subject",
+        "separator",
+        "presence_context_key",
+        "time_display",
+        "time_formatter",
+        "spotify_include_album",
+        "shift_colors",
+        "state_strings",
+        "state_colors",
+    )
+
+    def __init__(self, envs: EnvConfig) -> None:
+        """
+        Args:
+            envs (EnvConfig): The resolved environment of the badge.
+        """
+
+        redirect_url: HttpsURL = BADGE_REDIRECT_BASE_DOMAIN + (
+            envs.URL_TO_REDIRECT_ON_CLICK
+            if envs.URL_TO_REDIRECT_ON_CLICK
+            else "{0}/{0}".format(envs.GITHUB_ACTOR)
+        )
+
+        # * The markdown is split to the parts before and after the badge URL, since it's the only part that depends on the presence.
+        self.markdown_prefix, self.markdown_suffix = BADGE_BASE_MARKDOWN.format(
+            envs.BADGE_IDENTIFIER_NAME, "\0", redirect_url
+        ).split("\0")
+
+        # Only the activities are accepted, even though the other enums can be resolved to this key.
+        self.preferred_activity: Optional[str] = (
+            envs.PREFERRED_ACTIVITY_TO_DISPLAY.name
+            if isinstance(envs.PREFERRED_ACTIVITY_TO_DISPLAY, PreferredActivityDisplay)
+            else None
+        )
+        self.static_subject: Optional[str] = envs.STATIC_SUBJECT_STRING
+
+        # ! The separator is only displayed when there's a context or a time to separate.
+        self.separator: BadgeElements = BadgeElements(
+            (
+                ", "
+                if envs.STATUS_CONTEXT_SEPERATOR is None
+                else " %s " % envs.STATUS_CONTEXT_SEPERATOR
+            )
+            if envs.PREFERRED_PRESENCE_CONTEXT is not ContextOnSubject.CONTEXT_DISABLED
+            or envs.TIME_DISPLAY_OUTPUT is not PreferredTimeDisplay.TIME_DISABLED
+            else ""
+        )
+        self.presence_context_key: Optional[str] = (
+            None
+            if envs.PREFERRED_PRESENCE_CONTEXT is ContextOnSubject.CONTEXT_DISABLED
+            else (
+                "state"
+                if envs.PREFERRED_PRESENCE_CONTEXT is ContextOnSubject.STATE
+                else "details"
+            )
+        )
+
+        self.time_display: Any = envs.TIME_DISPLAY_OUTPUT
+        self.time_formatter: Optional[ElapsedTimeFormatter] = (
+            ElapsedTimeFormatter(
+                self.time_display,
+                envs.TIME_DISPLAY_SHORTHAND,
+                envs.TIME_DISPLAY_ELAPSED_OVERRIDE_STRING,
+            )
+            if isinstance(self.time_display, PreferredTimeDisplay)
+            and self.time_display is not PreferredTimeDisplay.TIME_DISABLED
+            else None
+        )  # ! Other enums can be resolved to this key, which have no time to display.
+        self.spotify_include_album: bool = envs.SPOTIFY_INCLUDE_ALBUM_PLAYLIST_NAME
+        self.shift_colors: bool = envs.SHIFT_STATUS_ACTIVITY_COLORS
+
+        # * The strings and the colors are keyed by their state, which is either an activity (such as `RICH_PRESENCE`) or a status (such as `ONLINE_STATUS`).
+        badge_states: list[str] = [
+            each_cls.name for each_cls in PreferredActivityDisplay
+        ] + ["%s_STATUS" % each_status.name.upper() for each_status in Status]
+
+        self.state_strings: dict[str, str] = {
+            each_state: envs["%s_STRING" % each_state]
+            for each_state in badge_states
+            if "%s_STRING" % each_state in envs
+        }
+        self.state_colors: dict[str, ColorHEX] = {
+            each_state: self._strip_color(envs["%s_COLOR" % each_state])
+            for each_state in badge_states
+            if "%s_COLOR" % each_state in envs
+        }
+
+    def pick_activity(self, user_ctx: PresenceSnapshot) -> Optional[ActivitySnapshot]:
+        """
+        Picks the activity to display, which is the preferred activity when it exists. Otherwise, the first activity is used instead.
+
+        Args:
+            user_ctx (PresenceSnapshot): The presence of the user.
+
+        Returns:
+            Optional[ActivitySnapshot]: The activity to display, or None when there's no activity.
+        """
+
+        if not user_ctx.activities:
+            return None
+
+        if self.preferred_activity is not None:
+            preferred_activity: Optional[ActivitySnapshot] = user_ctx.get_activity(
+                self.preferred_activity
+            )
+
+            if preferred_activity is not None:
+                return preferred_activity
+
+        return user_ctx.activities[0]
+
+    def get_signature(
+        self,
+        user_ctx: PresenceSnapshot,
+        now: Optional[datetime] = None,
+        include_time: bool = True,
+    ) -> Hashable:
+        """
+        Reduces the presence to the fields that this badge displays, which means two presences with the same signature render the same badge.
+        The elapsed time is counted in the smallest unit displayed, so that the signature only changes once the displayed time does.
+
+        Args:
+            user_ctx (PresenceSnapshot): The presence of the user.
+            now (Optional[datetime], optional): The time to count the elapsed time until, which should be the same as the render's. Defaults to now.
+            include_time (bool, optional): Whether to include the time part. Without it, two presences with the same signature render badges that only differ in their time. Defaults to True.
+
+        Returns:
+            Hashable: A tuple that can be compared with the signatures of the other renders.
+        """
+
+        activity: Optional[ActivitySnapshot] = self.pick_activity(user_ctx)
+
+        if activity is None:
+            return (user_ctx.status,)
+
+        signature: list[Any] = [
+            user_ctx.status,
+            activity.kind,
+            (
+                activity.state
+                if activity.kind == PreferredActivityDisplay.CUSTOM_ACTIVITY.name
+                else activity.name
+            ),
+        ]
+
+        if (
+            activity.kind == PreferredActivityDisplay.RICH_PRESENCE.name
+            and self.presence_context_key is not None
+        ):
+            signature.append(getattr(activity, self.presence_context_key))
+
+        elif activity.kind == PreferredActivityDisplay.SPOTIFY_ACTIVITY.name:
+            signature.extend(
+                (
+                    activity.details,
+                    activity.state,
+                    activity.large_text if self.spotify_include_album else None,
+                )
+            )
+
+        if (
+            include_time
+            and self.time_display is not PreferredTimeDisplay.TIME_DISABLED
+            and activity.start is not None
+        ):
+            running_time: timedelta = self._get_running_time(activity, now)
+            running_seconds: int = running_time.days * 86400 + running_time.seconds
+
+            if activity.end is not None:
+                # ! The remaining time (Spotify only) is displayed in seconds, which is the same as the running time.
+                signature.extend(
+                    (activity.start, activity.end, running_seconds)
+                    if activity.kind == PreferredActivityDisplay.SPOTIFY_ACTIVITY.name
+                    else ()
+                )
+
+            elif self.time_formatter is not None:
+                signature.append(
+                    max(running_seconds // self.time_formatter.resolution, 0)
+                )
+
+        return tuple(signature)
+
+    def render(
+        self, user_ctx: PresenceSnapshot, now: Optional[datetime] = None
+    ) -> BadgeStructure:
+        """
+        Renders the badge from the presence of the user, as in `[![<badge_identifier>](<badge_url>)](<redirect_url>)`.
+
+        Args:
+            user_ctx (PresenceSnapshot): The presence of the user.
+            now (Optional[datetime], optional): The time to count the elapsed time until. Defaults to now.
+
+        Returns:
+            BadgeStructure: The badge in markdown, which is written in one line.
+        """
+
+        status_state: str = "%s_STATUS" % user_ctx.status.name.upper()
+        activity: Optional[ActivitySnapshot] = self.pick_activity(user_ctx)
+        picked_activity: ActivityDictName = (
+            activity.kind if activity is not None else ActivityDictName("")
+        )
+        is_custom_activity: bool = (
+            picked_activity == PreferredActivityDisplay.CUSTOM_ACTIVITY.name
+        )
+
+        # ! The custom activity is displayed along with the status, since it doesn't have a name.
+        badge_state: str = status_state if is_custom_activity else picked_activity
+        separator: str = "" if is_custom_activity else self.separator
+
+        subject_output: str = (
+            BADGE_BASE_SUBJECT
+            if activity is None and self.static_subject is None
+            else (
+                self.state_strings[badge_state]
+                if self.static_subject is None
+                else self.static_subject
+            )
+        )
+
+        status_output: str = (
+            "%s " % self.state_strings[badge_state]
+            if self.static_subject is not None
+            else ""
+        ) + (
+            self.state_strings[status_state]
+            if activity is None
+            else activity.state if is_custom_activity else activity.name
+        )
+
+        if (
+            picked_activity == PreferredActivityDisplay.RICH_PRESENCE.name
+            and self.presence_context_key is not None
+        ):
+            status_output += separator + getattr(activity, self.presence_context_key)
+
+        if (
+            activity is not None
+            and activity.kind == PreferredActivityDisplay.SPOTIFY_ACTIVITY.name
+        ):
+            status_output += separator + "{0} by {1}".format(
+                activity.details, activity.state
+            )
+
+            if self.spotify_include_album:
+                status_output += " (%s)" % activity.large_text
+
+        elif (
+            self.time_display is not PreferredTimeDisplay.TIME_DISABLED
+            and activity is not None
+        ):
+            status_output += separator
+
+        if (
+            self.time_display is not PreferredTimeDisplay.TIME_DISABLED
+            and activity is not None
+            and activity.start is not None
+        ):
+            status_output = self._render_time(status_output, activity, now)
+
+        # The status color is the same as the state, and the subject color is the same as the status (unless it displays the state instead).
+        status_color: ColorHEX = (
+            self.state_colors[badge_state]
+            if self.static_subject is not None or activity is not None
+            else self._strip_color(BADGE_NO_COLOR_DEFAULT)
+        )
+        subject_color: ColorHEX = self.state_colors[
+            (
+                status_state
+                if activity is not None or self.static_subject is None
+                else badge_state
+            )
+        ]
+
+        if self.shift_colors:
+            status_color, subject_color = subject_color, status_color
+
+        return BadgeStructure(
+            f"{self.markdown_prefix}{BADGE_BASE_URL}{quote(subject_output)}/{quote(status_output)}?color={subject_color}&labelColor={status_color}&icon={BADGE_ICON}{self.markdown_suffix}"
+        )
+
+    def _render_time(
+        self,
+        status_output: str,
+        activity: ActivitySnapshot,
+        now: Optional[datetime] = None,
+    ) -> str:
+        """
+        Renders the time of the activity to the status, which is either the elapsed time or the remaining time (Spotify only).
+
+        Args:
+            status_output (str): The status of the badge, without the time.
+            activity (ActivitySnapshot): The activity to display, which has a start time.
+            now (Optional[datetime], optional): The time to count the elapsed time until. Defaults to now.
+
+        Returns:
+            str: The status of the badge, with the time.
+        """
+
+        running_time: timedelta = self._get_running_time(activity, now)
+
+        if activity.end is not None:
+            # ! The remaining time is only displayed for Spotify.
+            if activity.kind == PreferredActivityDisplay.SPOTIFY_ACTIVITY.name:
+                end_time: timedelta = datetime.fromtimestamp(
+                    activity.end / 1000
+                ) - datetime.fromtimestamp(
+                    activity.start / 1000  # type: ignore
+                )
+
+                return status_output + " | {0} of {1}".format(
+                    running_time - timedelta(microseconds=running_time.microseconds),
+                    end_time - timedelta(microseconds=end_time.microseconds),
+                )
+
+            return status_output
+
+        elapsed_time: Optional[str] = (
+            self.time_formatter.format(running_time.total_seconds())
+            if self.time_formatter is not None
+            else None
+        )
+
+        return (
+            status_output + elapsed_time
+            if elapsed_time is not None
+            else "Just started."
+        )
+
+    @staticmethod
+    def _get_running_time(
+        activity: ActivitySnapshot, now: Optional[datetime] = None
+    ) -> timedelta:
+        # Note that the epoch given by Discord is in milliseconds.
+        return (now or datetime.now()) - datetime.fromtimestamp(
+            activity.start / 1000  # type: ignore
+        )
+
+    @staticmethod
+    def _strip_color(color: str) -> ColorHEX:
+        # For now, the color only supports HEX, which is passed to Badgen without its `#`.
+        return ColorHEX(color[1:] if color.startswith("#") else color)
+
+
+class BadgeRenderMemo:
+    """
+    Remembers the badges that were rendered by a plan, keyed by the signature of the presence (see `BadgeRenderPlan.get_signature()`).
+
+    When the presence changes in the fields that the badge doesn't display (such as the device statuses or the details that were not preferred),
+    the badge that was rendered before is reused instead of rendering it again. Only the `maxsize` most recently used badges are remembered.
+    """
+
+    __slots__ = ("plan", "maxsize", "hits", "misses", "_badges")
+
+    def __init__(self, plan: BadgeRenderPlan, maxsize: int) -> None:
+        """
+        Args:
+            plan (BadgeRenderPlan): The plan to render the badges with.
+            maxsize (int): The number of badges to remember.
+        """
+
+        self.plan: BadgeRenderPlan = plan
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._badges: OrderedDict[Hashable, BadgeStructure] = OrderedDict()
+
+    def render(self, user_ctx: PresenceSnapshot) -> tuple[BadgeStructure, bool]:
+        """
+        Args:
+            user_ctx (PresenceSnapshot): The presence of the user.
+
+        Returns:
+            tuple[BadgeStructure, bool]: The badge, and whether it was reused from the badges that were rendered before.
+        """
+
+        # ! The signature and the render should count the elapsed time until the same time, or else the badge may be remembered under the wrong signature.
+        now: datetime = datetime.now()
+        signature: Hashable = self.plan.get_signature(user_ctx, now)
+        badge: Optional[BadgeStructure] = self._badges.get(signature)
+
+        if badge is not None:
+            self._badges.move_to_end(signature)
+            self.hits += 1
+            return badge, True
+
+        badge = self.plan.render(user_ctx, now)
+        self.misses += 1
+
+        self._badges[signature] = badge
+
+        if len(self._badges) > self.maxsize:
+            self._badges.popitem(last=False)
+
+        return badge, False
@@ -0,0 +1,264 @@
+"""
+Copyright 2021 Janrey "CodexLink" Licas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+	http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from asyncio import CancelledError, FIRST_COMPLETED, Task, create_task, gather, wait
+from inspect import isawaitable
+from logging import Logger
+from os import _exit as terminate
+from time import perf_counter
+from typing import Any, Callable
+
+from elements.constants import (
+    STAGE_RESULT_STRUCT,
+    ExitReturnCodes,
+    RunnerStages,
+    StageStatus,
+)
+
+
+class StageScheduler:
+    """
+    A scheduler that runs a declared graph of stages (RunnerStages) where every stage starts as soon as all of its dependencies are done.
+
+    Each stage receives the results of its dependencies as positional arguments (in the order of `depends_on`), and may either be a coroutine function or a plain function.
+    Stages whose dependencies have failed, were skipped or were cancelled will be skipped as well. The scheduler waits on the running stages instead of polling them.
+
+    Stages can be declared again after `run()` has finished. They may depend on the stages from the previous runs since the results are kept.
+    """
+
+    def __init__(self, logger: Logger) -> None:
+        self.logger: Logger = logger
+        self.results: dict[RunnerStages, STAGE_RESULT_STRUCT] = {}
+
+        self._declared_stages: dict[
+            RunnerStages, tuple[Callable[..., Any], tuple[RunnerStages, ...]]
+        ] = {}
+
+    def add_stage(
+        self,
+        stage: RunnerStages,
+        stage_fn: Callable[..., Any],
+        depends_on: tuple[RunnerStages, ...] = (),
+    ) -> None:
+        """
+        Declares a stage to the graph.
+
+        Args:
+            stage (RunnerStages): The stage to declare, this should only be declared once.
+            stage_fn (Callable[..., Any]): The function to call once the dependencies are done.
+            depends_on (tuple[RunnerStages, ...], optional): The stages that should be done before running this stage. Defaults to ().
+        """
+
+        if stage in self._declared_stages or stage in self.results:
+            self.logger.critical(
+                f"Stage {stage.name} was declared more than once! This is an issue from the developer, please report this issue."
+            )
+            terminate(ExitReturnCodes.ILLEGAL_CONDITION_EXIT)
+
+        self._declared_stages[stage] = (stage_fn, depends_on)
+
+    async def run(self) -> dict[RunnerStages, STAGE_RESULT_STRUCT]:
+        """
+        Runs every declared stage until all of them have their own result.
+
+        When this is cancelled (or fails), the stages that are still running are cancelled and awaited before leaving, so that none of them outlives the run.
+        Those stages, along with the stages that were never started, are marked as CANCELLED.
+
+        Returns:
+            dict[RunnerStages, STAGE_RESULT_STRUCT]: The result of every stage, including the stages from the previous runs.
+        """
+
+        running_stages: dict[Task, RunnerStages] = {}
+
+        try:
+            while True:
+                self._dispatch_ready_stages(running_stages)
+
+                if not running_stages:
+                    if not self._declared_stages:
+                        break
+
+                    # There's nothing to wait for but there are stages left, which means they depend on stages that will never exist.
+                    self.logger.critical(
+                        f"Stage/s {[each_stage.name for each_stage in self._declared_stages]} cannot be resolved due to missing or circular dependencies! This is an issue from the developer, please report this issue."
+                    )
+                    terminate(ExitReturnCodes.ILLEGAL_CONDITION_EXIT)
+
+                done_tasks, _ = await wait(
+                    running_stages.keys(), return_when=FIRST_COMPLETED
+                )
+
+                for each_task in done_tasks:
+                    self._collect_stage(running_stages.pop(each_task), each_task)
+
+        finally:
+            if running_stages or self._declared_stages:
+                await self._cancel_stages(running_stages)
+
+        return self.results
+
+    async def _cancel_stages(self, running_stages: dict[Task, RunnerStages]) -> None:
+        """
+        Cancels the running stages and waits for them to finish, then marks them (along with the stages that were never started) as CANCELLED.
+
+        Args:
+            running_stages (dict[Task, RunnerStages]): The running stages, which this method will empty.
+        """
+
+        for each_task in running_stages:
+            each_task.cancel()
+
+        await gather(*running_stages.keys(), return_exceptions=True)
+
+        for each_task, each_stage in running_stages.items():
+            self._collect_stage(each_stage, each_task)
+
+        for each_stage in self._declared_stages:
+            self.results[each_stage] = {
+                "stage": each_stage,
+                "status": StageStatus.CANCELLED,
+                "elapsed": 0.0,
+                "result": None,
+                "exception": None,
+            }
+
+        running_stages.clear()
+        self._declared_stages.clear()
+
+    def _collect_stage(self, stage: RunnerStages, stage_task: Task) -> None:
+        """
+        Stores the result of the stage that has finished (or was cancelled).
+
+        Args:
+            stage (RunnerStages): The stage of the task.
+            stage_task (Task): The task of the stage, which should be done.
+        """
+
+        self.results[stage] = (
+            {
+                "stage": stage,
+                "status": StageStatus.CANCELLED,
+                "elapsed": 0.0,
+                "result": None,
+                "exception": None,
+            }
+            if stage_task.cancelled()
+            else stage_task.result()
+        )
+
+        self.logger.info(
+            f"Stage {stage.name} -> {self.results[stage]['status'].name} (took {self.results[stage]['elapsed']:.3f}s)."
+        )
+
+    def _dispatch_ready_stages(self, running_stages: dict[Task, RunnerStages]) -> None:
+        """
+        Starts every stage whose dependencies are done, and skips every stage whose dependencies will never be done.
+
+        Args:
+            running_stages (dict[Task, RunnerStages]): The container of the running stages, which this method will add to.
+        """
+
+        has_changes: bool = True
+
+        # Skipping a stage may lead to skipping its dependents, so we loop until nothing has changed.
+        while has_changes:
+            has_changes = False
+
+            for stage, (stage_fn, depends_on) in list(self._declared_stages.items()):
+                if not all(
+                    each_dependency in self.results for each_dependency in depends_on
+                ):
+                    continue
+
+                del self._declared_stages[stage]
+                has_changes = True
+
+                if any(
+                    self.results[each_dependency]["status"] is not StageStatus.DONE
+                    for each_dependency in depends_on
+                ):
+                    self.results[stage] = {
+                        "stage": stage,
+                        "status": StageStatus.SKIPPED,
+                        "elapsed": 0.0,
+                        "result": None,
+                        "exception": None,
+                    }
+                    self.logger.warning(
+                        f"Stage {stage.name} was skipped since one of its dependencies ({', '.join(each_dependency.name for each_dependency in depends_on)}) did not finish."
+                    )
+                    continue
+
+                running_stages[
+                    create_task(
+                        self._run_stage(
+                            stage,
+                            stage_fn,
+                            *(
+                                self.results[each_dependency]["result"]
+                                for each_dependency in depends_on
+                            ),
+                        ),
+                        name=f"Stage_{stage.name}",
+                    )
+                ] = stage
+
+    async def _run_stage(
+        self, stage: RunnerStages, stage_fn: Callable[..., Any], *args: Any
+    ) -> STAGE_RESULT_STRUCT:
+        """
+        Runs the stage and packs its outcome to a STAGE_RESULT_STRUCT. Exceptions are contained here so that they won't leak out to the loop.
+
+        Args:
+            stage (RunnerStages): The stage to run.
+            stage_fn (Callable[..., Any]): The function of the stage.
+            *args (Any): The results of the dependencies.
+
+        Returns:
+            STAGE_RESULT_STRUCT: The outcome of the stage.
+        """
+
+        started_at: float = perf_counter()
+
+        try:
+            stage_result: Any = stage_fn(*args)
+
+            if isawaitable(stage_result):
+                stage_result = await stage_result
+
+        except CancelledError:
+            raise
+
+        except Exception as e:
+            self.logger.error(
+                f"Stage {stage.name} has failed! | Info: {e} at line {e.__traceback__.tb_lineno}."  # type: ignore
+            )
+
+            return {
+                "stage": stage,
+                "status": StageStatus.FAILED,
+                "elapsed": perf_counter() - started_at,
+                "result": None,
+                "exception": e,
+            }
+
+        return {
+            "stage": stage,
+            "status": StageStatus.DONE,
+            "elapsed": perf_counter() - started_at,
+            "result": stage_result,
+            "exception": None,
+        }
@@ -0,0 +1,86 @@
+"""
+Copyright 2021 Janrey "CodexLink" Licas
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+	http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from argparse import Namespace
+from asyncio import Event, Task
+from copy import copy
+from logging import Logger
+from typing import Any, Mapping
+
+from aiohttp import ClientSession
+
+from api import AsyncGithubAPILite
+from badge import BadgeConstructor
+from budget import GithubRateLimitBudget
+from config import EnvConfig
+from definition import BadgeDefinition
+from presence import PresenceSnapshot
+from utils import UtilityMethods
+
+
+class BadgeTenant(UtilityMethods, AsyncGithubAPILite, BadgeConstructor):
+    """
+    A child class that represents one DISCORD_USER_ID → PROFILE_REPOSITORY pair when the script runs on batch mode.
+
+    Unlike the superclass (DiscordActivityBadge), this does not contain a Discord Client. Instead, it borrows the logger, the arguments
+    and the ClientSession of the superclass so that every tenant shares one gateway connection and one connection pool.
+    The superclass is responsible for filling `user_ctx` and setting `presence_ready` once the tenant's presence has been fetched.
+    """
+
+    def __init__(
+        self, parent: Any, env_source: Mapping[str, Any], envs: EnvConfig
+    ) -> None:
+        """
+        Args:
+            parent (Any): The superclass (DiscordActivityBadge) instance, which is expected to be done with `__ainit__()`.
+            env_source (Mapping[str, Any]): The source of this tenant's environment, which is the tenant stacked on top of the environment.
+            envs (EnvConfig): The resolved environment of this tenant, from `resolve_tenants()`.
+        """
+
+        # The arguments are copied since some of them may be modified per tenant.
+        self.args: Namespace = copy(parent.args)
+        self.env_source: Mapping[str, Any] = env_source
+        self.envs: EnvConfig = envs
+        self.logger: Logger = parent.logger
+
+        self._api_session: ClientSession = parent._api_session
+        self._api_preconnect_tasks: dict[str, Task] = parent._api_preconnect_tasks
+
+        self._api_budget: GithubRateLimitBudget = parent._api_budgets.setdefault(
+            envs["WORKFLOW_TOKEN"], GithubRateLimitBudget(self.logger)
+        )  # The budget is shared with everyone that uses the same token.
+
+        self._parent: Any = parent
+
+        self.presence_ready: Event = Event()
+        self.user_ctx: PresenceSnapshot = PresenceSnapshot()
+
+        self.badge_definitions: list[Any] = (
+            [
+                BadgeDefinition(self, each_envs)
+                for each_envs in self.resolve_badge_definitions()
+            ]
+            if self.envs["BADGE_DEFINITIONS"]
+            else [self]
+        )
+
+    @property
+    def discord_client_task(self) -> Task:  # type: ignore
+        # The Discord Client is started after the tenants were instantiated, which is why it's looked up from the superclass instead.
+        return self._parent.discord_client_task
+
+    def __repr__(self) -> str:
+        return f"<{BadgeTenant.__name__} DISCORD_USER_ID={self.envs['DISCORD_USER_ID']} PROFILE_REPOSITORY={self.envs['PROFILE_REPOSITORY']}>"
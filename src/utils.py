@@ -15,14 +15,31 @@ limitations under the License.
 """
 
 from argparse import ArgumentParser
+from collections import ChainMap
 from distutils.util import strtobool
 from enum import Enum
+from hashlib import sha1
+from json import dumps as json_dumps
+from json import load as json_load
+from json import loads as json_loads
 from logging import FileHandler, Formatter, Logger, StreamHandler, getLogger
 from os import _exit as terminate
 from os import environ as env
+from os import path
 from sys import stdout
-from typing import Any, Optional, Type, Union
+from typing import Any, Collection, Mapping, Optional, Union
 
+try:
+    from tomllib import load as toml_load
+
+except ImportError:
+    try:
+        from tomli import load as toml_load  # type: ignore
+
+    except ImportError:
+        toml_load = None  # type: ignore
+
+from config import EnvConfig
 from elements.constants import (
     ARG_CONSTANTS,
     ENV_FILENAME,
@@ -30,13 +47,11 @@ from elements.constants import (
     LOGGER_FILENAME,
     LOGGER_OUTPUT_FORMAT,
     ROOT_LOCATION,
-    ContextOnSubject,
+    TENANT_SCOPED_ENV_KEYS,
     ExitReturnCodes,
     GithubRunnerLevelMessages,
     LoggerLevelCoverage,
     LoggerRootLevel,
-    PreferredActivityDisplay,
-    PreferredTimeDisplay,
 )
 
 
@@ -146,19 +161,6 @@ class UtilityMethods:
     def resolve_args(self) -> None:
         # Resolves the arguments given to which was handled by ArgumentParser.
 
-        # Two of the choices require immediate evaluation of values to Enum, thus, we programmatically load it in the script.
-        _ll_choices: dict = {}
-        _v_choices: dict = {}
-
-        # Each dictionary (_ll_choices and _v_choices) will contain all of their Enum elements, respectively.
-        # This will help me adjust the enums and have their possible values assigned correctly.
-        for each_enum in [LoggerLevelCoverage, LoggerRootLevel]:
-            for each_element in each_enum:
-                locals()[
-                    ("_ll" if each_element in LoggerLevelCoverage else "_v")
-                    + "_choices"
-                ][each_element.name] = each_element
-
         parser = ArgumentParser(
             prog=ARG_CONSTANTS["ENTRY_PARSER_PROG"],
             description=ARG_CONSTANTS["ENTRY_PARSER_DESC"],
@@ -203,7 +205,7 @@ class UtilityMethods:
         parser.add_argument(
             "-ll",
             "--logger-level",
-            choices=_ll_choices.keys(),
+            choices=LoggerLevelCoverage.__members__.keys(),
             default=LoggerLevelCoverage.INFO,
             help=ARG_CONSTANTS["HELP_DESC_LOGGER_LEVEL"],
             required=False,
@@ -211,7 +213,7 @@ class UtilityMethods:
         parser.add_argument(
             "-v",
             "--verbosity",
-            choices=_v_choices.keys(),
+            choices=LoggerRootLevel.__members__.keys(),
             default=LoggerRootLevel.SCRIPT_LEVEL,
             help=ARG_CONSTANTS["HELP_DESC_VERBOSITY"],
             required=False,
@@ -222,20 +224,15 @@ class UtilityMethods:
             self.args = parser.parse_args()
 
             # Ever since `parser.add_arguments()` don't have the extensibility to invoke a function when it receives a value, we will do it after parsing them.
-            for args_to_resolve in [
-                "logger_level",
-                "verbosity",
-            ]:  # Get the arguments to resolve.
-
-                arg = getattr(self.args, args_to_resolve)  # Assign their value here.
+            # * The choices were limited to the names of their enum, which means they can be looked up directly. (Defaults are already enums.)
+            for args_to_resolve, arg_enum in (
+                ("logger_level", LoggerLevelCoverage),
+                ("verbosity", LoggerRootLevel),
+            ):
+                arg: Any = getattr(self.args, args_to_resolve)
 
-                for each_enum in [LoggerLevelCoverage, LoggerRootLevel]:
-                    for each_elem in each_enum:
-                        if arg == each_elem.name:
-                            setattr(
-                                self.args, args_to_resolve, each_elem
-                            )  # As the values given by the user matched the name of Enum elements, we use setAttr() as we loop to those Enums.
-                            break
+                if isinstance(arg, str):
+                    setattr(self.args, args_to_resolve, arg_enum[arg])
 
         #  ArgumentParser invoke raising SystemExit by default. Catching this exception will ensure that there will be no exceptions shown upon exit.
         except SystemExit:
@@ -251,186 +248,322 @@ class UtilityMethods:
         This is intentional so that other modules won't need to evaluate them individually. And also to keep the user inputs serialized respectively.
         """
 
-        self.envs: dict[str, Any] = {}  # Setup our container here.
+        # * The source is kept so that the badge definitions can be stacked on top of it later on.
+        self.env_source: Mapping[str, Any] = env
 
-        for idx, (env_key, _) in enumerate(
-            ENV_STRUCT_CONSTRAINTS.items()
-        ):  # We don't need the value, just the key.
+        # On batch mode, the tenant-scoped keys are given by the tenants instead. Which means they are no longer required in the environment.
+        self.envs: EnvConfig = self._resolve_env_source(
+            env,
+            optional_keys=TENANT_SCOPED_ENV_KEYS
+            if env.get("INPUT_TENANTS_CONFIG_FILE")
+            else (),
+        )
 
-            try:
-                # * Attempt to fetch the parameter (3.a) and remove any unnecessary from the environment variable name (3.b).
-                env_literal_val: Any = env.get(env_key)
-                env_cleaned_name: str = env_key.removeprefix(
-                    "INPUT_"
-                )  # Since, the script will run in Github Runner, we expect that every environment variable has a pre-fix of "INPUT", so we remove them here.
-
-                # * Assert the existance of environment variables by displaying it in the Console.
-                self.logger.debug(
-                    "[%i] Env. Var. %s contains %s to be evaluated in %s."
-                    % (
-                        idx + 1,
-                        env_key,
-                        env_literal_val if len(env_literal_val) else "None",
-                        ENV_STRUCT_CONSTRAINTS[env_key]["expected_type"]
-                        if not hasattr(
-                            ENV_STRUCT_CONSTRAINTS[env_key]["expected_type"], "__call__"
-                        )
-                        else ENV_STRUCT_CONSTRAINTS[env_key]["expected_type"].__name__,
+        self.logger.info(
+            f"Environment Variables stored in-memory are successfully resolved!"
+        )
+        self.logger.debug(f"Env. Serialization Context -> {self.envs}")
+
+    def resolve_tenants(self) -> list[tuple[Mapping[str, Any], EnvConfig]]:
+        """
+        Loads the tenants from the file declared under `TENANTS_CONFIG_FILE` and resolves each of them the same way as `resolve_envs()`.
+
+        The file should contain a JSON list of objects (or a TOML array of tables named `tenants`), where every object overrides the inputs (without the `INPUT_` prefix) of the environment.
+        Keep in mind that `DISCORD_USER_ID` is required for every tenant.
+
+        Returns:
+            list[tuple[Mapping[str, Any], EnvConfig]]: The source and the resolved environment of every tenant, in the same structure as `self.env_source` and `self.envs`.
+        """
+
+        self.logger.info(
+            f"Batch mode detected, loading tenants from {self.envs['TENANTS_CONFIG_FILE']}..."
+        )
+
+        try:
+            # * TOML files declare the tenants as an array of tables (`[[tenants]]`), which is the same list of objects as in JSON.
+            if self.envs["TENANTS_CONFIG_FILE"].endswith(".toml"):
+                if toml_load is None:
+                    raise ValueError(
+                        "TOML files require Python 3.11 or the `tomli` package."
                     )
+
+                with open(self.envs["TENANTS_CONFIG_FILE"], "rb") as tenants_file:
+                    tenants_ctx: Any = toml_load(tenants_file).get("tenants")
+
+            else:
+                with open(
+                    self.envs["TENANTS_CONFIG_FILE"], encoding="utf-8"
+                ) as tenants_file:
+                    tenants_ctx = json_load(tenants_file)
+
+            if (
+                not isinstance(tenants_ctx, list)
+                or not tenants_ctx
+                or not all(isinstance(each_tenant, dict) for each_tenant in tenants_ctx)
+            ):
+                raise ValueError("Expected a non-empty list of objects.")
+
+        except (IOError, ValueError) as e:
+            msg: str = f"File {self.envs['TENANTS_CONFIG_FILE']} is malformed or does not exists! It should contain a list of objects in JSON, or an array of tables named `tenants` in TOML. | Info: {e} at line {e.__traceback__.tb_lineno}."  # type: ignore
+            self.logger.critical(msg)
+
+            self.print_exception(GithubRunnerLevelMessages.ERROR, msg, e)
+            terminate(ExitReturnCodes.ILLEGAL_CONDITION_EXIT)
+
+        resolved_tenants: list[tuple[Mapping[str, Any], EnvConfig]] = []
+
+        for each_tenant in tenants_ctx:
+            # The tenant is stacked on top of the environment so that it inherits everything that it didn't declare.
+            tenant_source: ChainMap = ChainMap(
+                self._stringify_overrides(each_tenant), env
+            )
+            resolved_tenants.append(
+                (tenant_source, self._resolve_env_source(tenant_source))
+            )
+
+        self.logger.info(f"{len(resolved_tenants)} tenant/s were loaded and resolved!")
+        return resolved_tenants
+
+    def resolve_badge_definitions(self) -> list[EnvConfig]:
+        """
+        Resolves the badges declared under `BADGE_DEFINITIONS` the same way as `resolve_envs()`, so that one README can contain multiple badges.
+
+        The input should contain a JSON list of objects, where every object overrides the inputs (without the `INPUT_` prefix) of `self.env_source`.
+        Keep in mind that every badge should have its own `BADGE_IDENTIFIER_NAME`, otherwise they will replace each other.
+
+        Returns:
+            list[EnvConfig]: The resolved environment of every badge, in the same structure as `self.envs`.
+        """
+
+        try:
+            definitions_ctx: Any = json_loads(self.envs["BADGE_DEFINITIONS"])
+
+            if (
+                not isinstance(definitions_ctx, list)
+                or not definitions_ctx
+                or not all(
+                    isinstance(each_definition, dict)
+                    for each_definition in definitions_ctx
                 )
+            ):
+                raise ValueError("Expected a non-empty list of objects.")
 
-            # ! This except block expects only Dictionary Errors. If you think there's something else to consider, please let me know.
-            except KeyError as e:
-                msg: str = f"Dictionary Key doesn't exists under `constants.py`. This is a bug or a left-out problem, please report this to the developer! | Info: {e} in line {e.__traceback__.tb_lineno}."  # type: ignore
-                self.logger.critical(msg)
+        except ValueError as e:
+            msg: str = f"BADGE_DEFINITIONS is malformed! It should contain a list of objects in JSON. | Info: {e} at line {e.__traceback__.tb_lineno}."  # type: ignore
+            self.logger.critical(msg)
 
-                self.print_exception(GithubRunnerLevelMessages.ERROR, msg, e)
-                terminate(ExitReturnCodes.ENV_KEY_DOES_NOT_EXISTS_ON_DICT)
+            self.print_exception(GithubRunnerLevelMessages.ERROR, msg, e)
+            terminate(ExitReturnCodes.ILLEGAL_CONDITION_EXIT)
 
-            except TypeError as e:
-                msg: str = f"Environment Variable {env_key} cannot be found. Are you running on local? Check if you invoked -rol / --running-on-local otherwise it won't run in local. If persisting, check your environment file. If this was deployed, please report this issue to the developer. | Info: {e} in line {e.__traceback__.tb_lineno}."  # type: ignore
-                self.logger.critical(msg)
+        resolved_definitions: list[EnvConfig] = [
+            self._resolve_env_source(
+                ChainMap(self._stringify_overrides(each_definition), self.env_source)
+            )
+            for each_definition in definitions_ctx
+        ]
 
-                self.print_exception(GithubRunnerLevelMessages.ERROR, msg, e)
-                terminate(ExitReturnCodes.ENV_KEY_DOES_NOT_EXISTS_ON_MACHINE)
+        badge_identifiers: list[str] = [
+            each_definition["BADGE_IDENTIFIER_NAME"]
+            for each_definition in resolved_definitions
+        ]
 
-            # !!! At this point, the environment must assert that it contains data! If codeblock still hits with an exception, there will be an improvment later on.
+        if len(set(badge_identifiers)) != len(badge_identifiers):
+            msg = f"BADGE_DEFINITIONS contains badges with the same BADGE_IDENTIFIER_NAME! Every badge should have its own identifier. | Identifiers: {badge_identifiers}"
+            self.logger.critical(msg)
 
-            # * The value seemes None (""). Are they optional environments?
-            if not env_literal_val:
+            self.print_exception(GithubRunnerLevelMessages.ERROR, msg, None)
+            terminate(ExitReturnCodes.ILLEGAL_CONDITION_EXIT)
+
+        self.logger.info(
+            f"{len(resolved_definitions)} badge definition/s were loaded and resolved!"
+        )
+        return resolved_definitions
+
+    def _stringify_overrides(self, overrides: dict[str, Any]) -> dict[str, str]:
+        """
+        Converts the overrides from a JSON object to the same form as the environment variables, so that they can be stacked on top of them.
+
+        Args:
+            overrides (dict[str, Any]): The object from JSON, where the keys are the inputs without the `INPUT_` prefix.
+
+        Returns:
+            dict[str, str]: The overrides, where the keys are prefixed with `INPUT_` and the values are strings. Nested values (lists and objects) are kept as JSON.
+        """
+
+        return {
+            f"INPUT_{override_key.upper()}": override_value
+            if isinstance(override_value, str)
+            else json_dumps(override_value)
+            if isinstance(override_value, (dict, list))
+            else str(override_value)
+            for override_key, override_value in overrides.items()
+        }
+
+    def _resolve_env_source(
+        self, source: Mapping[str, Any], optional_keys: Collection[str] = ()
+    ) -> EnvConfig:
+        """
+        Resolves every key declared in ENV_STRUCT_CONSTRAINTS from the given source, in one pass.
+
+        Keys that can't be resolved (such as required keys without a value) are collected instead of terminating right away,
+        so that every one of them is reported together. Invalid booleans and enums are reverted to their fallback value with a warning.
+
+        Args:
+            source (Mapping[str, Any]): The environment to resolve from. This is usually `os.environ`, or a tenant stacked on top of it.
+            optional_keys (Collection[str], optional): Keys (without the `INPUT_` prefix) that will be treated as optional regardless of their `is_required`. Defaults to ().
+
+        Returns:
+            EnvConfig: The resolved environment, where the keys are removed from their `INPUT_` prefix.
+        """
+
+        resolved_envs: dict[str, Any] = {}  # Setup our container here.
+        resolution_errors: list[str] = []
 
-                self.logger.debug(
-                    f"Env. Var. {env_key} doesn't have any value but exists. Checking if they are `required`."
+        for env_key, env_constraint in ENV_STRUCT_CONSTRAINTS.items():
+            # Since the script will run in Github Runner, we expect that every environment variable has a prefix of "INPUT_", so we remove them here.
+            env_cleaned_name: str = env_key.removeprefix("INPUT_")
+            env_literal_val: Optional[str] = source.get(env_key)
+
+            if env_literal_val is None:
+                resolution_errors.append(
+                    f"{env_key} cannot be found. Are you running on local? Check if you invoked -rol / --running-on-local, otherwise check your environment file."
                 )
+                continue
 
-                # We handle some Environment Variables that is not required (is_required -> False).
-                if not ENV_STRUCT_CONSTRAINTS[env_key]["is_required"]:
-                    self.logger.debug(
-                        "Fallback Value of %s for Optional | %s (is None?) -> %s"
-                        % (
-                            env_key,
-                            ENV_STRUCT_CONSTRAINTS[env_key]["fallback_value"] is None,
-                            ENV_STRUCT_CONSTRAINTS[env_key]["fallback_value"],
-                        )
-                    )
+            # * The value is empty. Are they optional environments?
+            if not env_literal_val:
+                if (
+                    env_constraint["is_required"]
+                    and env_cleaned_name not in optional_keys
+                ):
+                    resolution_errors.append(f"{env_key} is required but is empty.")
+                    continue
 
-                    # Do they have fallback_value assigne> Then typecast their expected_type to the actual value to ensure type-safe.
-                    self.envs[env_cleaned_name] = (
-                        ENV_STRUCT_CONSTRAINTS[env_key]["expected_type"](
-                            ENV_STRUCT_CONSTRAINTS[env_key]["fallback_value"]
-                        )
-                        if ENV_STRUCT_CONSTRAINTS[env_key]["fallback_value"] is not None
-                        else None
+                resolved_envs[env_cleaned_name] = self._get_env_fallback(env_key)
+
+            else:
+                try:
+                    resolved_envs[env_cleaned_name] = self._resolve_env_value(
+                        env_key, env_literal_val
                     )
 
-                    self.logger.debug(
-                        "Env. Var. `%s` has a resolved value of `%s`! (fallback type: %s, expected type: %s, has type: %s)"
-                        % (
-                            env_key,
-                            ENV_STRUCT_CONSTRAINTS[env_key]["fallback_value"],
-                            type(ENV_STRUCT_CONSTRAINTS[env_key]["fallback_value"]),
-                            ENV_STRUCT_CONSTRAINTS[env_key]["expected_type"],
-                            type(env_key)
-                        )
+                except ValueError as e:
+                    resolution_errors.append(
+                        f"{env_key} cannot be resolved as {getattr(env_constraint['expected_type'], '__name__', env_constraint['expected_type'])}. ({e})"
                     )
                     continue
 
-                # If they are required (is_required -> False) then terminate the script.
-                else:
-                    msg = f"Env. Var. {env_key} does not exist in local environment file or the repository secret does not exists or invalid! To the developer: Please fill up the required fields (in constants.py) to be able to use this script."
-                    self.logger.critical(msg)
+            self.logger.debug(
+                "Env. Var. %s has a resolved value of `%s`.",
+                env_key,
+                resolved_envs[env_cleaned_name],
+            )
 
-                    self.print_exception(GithubRunnerLevelMessages.ERROR, msg, None)
-                    terminate(ExitReturnCodes.ILLEGAL_CONDITION_EXIT)
+        if resolution_errors:
+            msg: str = (
+                f"{len(resolution_errors)} environment variable/s cannot be resolved! Please fill up the required fields to be able to use this script. | Errors: "
+                + " | ".join(resolution_errors)
+            )
+            self.logger.critical(msg)
 
-            # ! If the Environment Variable has a value, then we will check their `expected_type` and evaluate them with respect to their type.
+            self.print_exception(GithubRunnerLevelMessages.ERROR, msg, None)
+            terminate(ExitReturnCodes.ILLEGAL_CONDITION_EXIT)
 
-            if ENV_STRUCT_CONSTRAINTS[env_key]["expected_type"] in [int, str]:
-                # Type cast the given value with the `expected_type` or else assign the `fallback_value` with typecast of `expected_type`.
-                # This ensures that the output will be the respected type.
+        return EnvConfig(resolved_envs)
 
-                self.envs[env_cleaned_name] = (
-                    ENV_STRUCT_CONSTRAINTS[env_key]["expected_type"](env_literal_val)
-                    if len(env_literal_val)
-                    else ENV_STRUCT_CONSTRAINTS[env_key]["expected_type"](
-                        ENV_STRUCT_CONSTRAINTS[env_key]["fallback_value"]
-                    )
-                )
+    def _get_env_fallback(self, env_key: str) -> Any:
+        """
+        Args:
+            env_key (str): The key of the environment variable, as declared in ENV_STRUCT_CONSTRAINTS.
 
-            elif ENV_STRUCT_CONSTRAINTS[env_key]["expected_type"] is bool:
-                # For the case of boolean values, we have to use the distutils.util.strtobool to evalute them.
-                # If the utility method can't serialize it, then we have to use the fallback_value instead.
+        Returns:
+            Any: The fallback value of the key, typecasted to its `expected_type` (unless it's None).
+        """
 
-                try:
-                    self.envs[env_cleaned_name] = bool(strtobool(env_literal_val))
-                except ValueError:
-                    fallback_bool_val: bool = ENV_STRUCT_CONSTRAINTS[env_key][
-                        "fallback_value"
-                    ]
-                    self.envs[env_cleaned_name] = fallback_bool_val
-
-                    msg = f"Env. Var. {env_key} has an invalid key that can't be serialized to boolean. Using a fallback value {fallback_bool_val} instead."
-                    self.logger.warning(msg)
-
-                    self.print_exception(GithubRunnerLevelMessages.WARNING, msg, None)
-
-            elif issubclass(ENV_STRUCT_CONSTRAINTS[env_key]["expected_type"], Enum):
-                # Handling Enums and resolving them is such a pain in the [...].
-
-                enum_candidates: list[Type[Enum]] = [
-                    ContextOnSubject,
-                    PreferredActivityDisplay,
-                    PreferredTimeDisplay,
-                ]  # * We have to fetch these Enums and iterate through them as we try to match the user input's to the names of those Enum elements.
-
-                # is_valid: Union[None, bool] = None
-
-                # Since all enums are declared in upper case. User might intend to apply values in non-case-sensitive form. Hence, we gonna explicitly uppercase them.
-                enum_case_env_val: str = env_literal_val.upper()
-                assigned_enum_val: Optional[Enum] = None
-
-                if enum_case_env_val:
-                    for each_enums in enum_candidates:
-                        for each_cls in each_enums:
-                            # `is_valid` will be used to break
-                            is_valid: bool = bool(
-                                enum_case_env_val == each_cls.name
-                            )  # If the name matches, then set to `True` or otherwise.
-
-                            self.envs[env_cleaned_name] = (
-                                each_cls
-                                if enum_case_env_val == each_cls.name
-                                else ENV_STRUCT_CONSTRAINTS[env_key]["fallback_value"]
-                            )
-
-                            if is_valid:
-                                assigned_enum_val = each_cls
-                                break
-
-                        if is_valid:
-                            break
-
-                    self.logger.info(
-                        (
-                            f"Env. Var. {env_key} now has a value of %s!"
-                            % assigned_enum_val
-                        )
-                        if is_valid
-                        else f"Env. Var. {env_key} was unable to resolve the given argument ({enum_case_env_val}). Reverting to %s..."
-                        % (ENV_STRUCT_CONSTRAINTS[env_key]["fallback_value"])
-                    )
+        fallback_value: Any = ENV_STRUCT_CONSTRAINTS[env_key]["fallback_value"]
 
-            else:
-                msg = f"Env. Var. '{enum_case_env_val}' cannot be resolved / serialized due to its `expected_type` not a candidate for serialization. Please contact the developer about this for more information."
-                self.logger.critical(msg)
+        return (
+            ENV_STRUCT_CONSTRAINTS[env_key]["expected_type"](fallback_value)
+            if fallback_value is not None
+            else None
+        )
 
-                self.print_exception(GithubRunnerLevelMessages.ERROR, msg, None)
-                terminate(ExitReturnCodes.NO_CONDITION_IMPLEMENTED_EXIT)
+    def _resolve_env_value(self, env_key: str, env_literal_val: str) -> Any:
+        """
+        Resolves the (non-empty) value of an environment variable with respect to its `expected_type`.
 
-        self.logger.info(
-            f"Environment Variables stored in-memory are successfully resolved!"
+        Args:
+            env_key (str): The key of the environment variable, as declared in ENV_STRUCT_CONSTRAINTS.
+            env_literal_val (str): The value of the environment variable.
+
+        Raises:
+            ValueError: The value can't be typecasted to its `expected_type`.
+
+        Returns:
+            Any: The resolved value.
+        """
+
+        expected_type: Any = ENV_STRUCT_CONSTRAINTS[env_key]["expected_type"]
+
+        if expected_type is bool:
+            # For the case of boolean values, we have to use the distutils.util.strtobool to evalute them.
+            try:
+                return bool(strtobool(env_literal_val))
+
+            except ValueError:
+                msg = f"Env. Var. {env_key} has an invalid key that can't be serialized to boolean. Using a fallback value {self._get_env_fallback(env_key)} instead."
+                self.logger.warning(msg)
+
+                self.print_exception(GithubRunnerLevelMessages.WARNING, msg, None)
+                return self._get_env_fallback(env_key)
+
+        if isinstance(expected_type, type) and issubclass(expected_type, Enum):
+            # * Since all enums are declared in upper case, the user's input is matched against the names of its own enum (only).
+            resolved_enum: Optional[Enum] = expected_type.__members__.get(
+                env_literal_val.upper()
+            )
+
+            if resolved_enum is None:
+                msg = f"Env. Var. {env_key} was unable to resolve the given argument ({env_literal_val}), which should be one of {list(expected_type.__members__)}. Reverting to {self._get_env_fallback(env_key)}..."
+                self.logger.warning(msg)
+
+                self.print_exception(GithubRunnerLevelMessages.WARNING, msg, None)
+                return self._get_env_fallback(env_key)
+
+            return resolved_enum
+
+        # ! Types such as ColorHEX (from `elements.typing`) are only hints, which means their values are resolved from their supertype.
+        return getattr(expected_type, "__supertype__", expected_type)(env_literal_val)
+
+    def get_state_path(self, state_directory: str, user_repo: str) -> str:
+        """
+        Builds the path (without the extension) of a state that is persisted per repository under STATE_DIRECTORY.
+
+        Args:
+            state_directory (str): The directory of the state, under STATE_DIRECTORY.
+            user_repo (str): The repository, in `<owner>/<repository>` form.
+
+        Returns:
+            str: The path of the state of the repository.
+        """
+
+        # * Owners can't contain underscores, which means the repositories won't collide with each other.
+        return path.join(
+            self.envs["STATE_DIRECTORY"], state_directory, user_repo.replace("/", "__")
         )
-        self.logger.debug(f"Env. Serialization Context -> {self.envs}")
+
+    def get_blob_sha(self, content: bytes) -> str:
+        """
+        Computes the git blob SHA-1 of the content, which is the same `sha` that Github returns for the file with the same content.
+
+        Args:
+            content (bytes): The content of the file in raw bytes.
+
+        Returns:
+            str: The SHA-1 of the content in hexadecimal.
+        """
+
+        return sha1(b"blob %d\0" % len(content) + content).hexdigest()
 
     def print_exception(
         self,